@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark des extracteurs de contenu: lxml intégré vs newspaper3k
+
+Corpus fixe: pages synthétiques déterministes (graine fixe) ou répertoire de
+fichiers .html passé avec --corpus (ex. pages capturées en production).
+"""
+
+import os
+import sys
+import glob
+import time
+import random
+import argparse
+import statistics
+
+sys.path.insert(0, 'src')
+
+from article_extractor import ArticleExtractor
+
+WORDS = ("distributeur alimentaire québec restauration hôtellerie grossiste importation douane "
+         "chaîne approvisionnement entrepôt livraison produits frais viande volaille laitiers "
+         "prix inflation pénurie marché client fournisseur menu chef tendance local régional").split()
+
+def _sentence(rng: random.Random) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(8, 22))]
+    return ' '.join(words).capitalize() + ', ' + ' '.join(rng.choice(WORDS) for _ in range(5)) + '.'
+
+def build_synthetic_corpus(pages: int = 60, seed: int = 42):
+    """Pages réalistes: navigation, barre latérale, commentaires, scripts et corps d'article"""
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(pages):
+        paragraphs = [' '.join(_sentence(rng) for _ in range(rng.randint(3, 6))) for _ in range(rng.randint(6, 14))]
+        nav = ''.join(f'<li><a href="/rubrique/{j}">Rubrique {j}</a></li>' for j in range(40))
+        sidebar = ''.join(f'<div class="widget"><a href="/populaire/{j}">{_sentence(rng)}</a></div>' for j in range(25))
+        comments = ''.join(f'<div class="comment"><p>{_sentence(rng)}</p></div>' for _ in range(rng.randint(5, 30)))
+        scripts = ''.join(f'<script>window.data{j} = {{"k": "{"x" * 2000}"}};</script>' for j in range(rng.randint(5, 40)))
+        body = ''.join(f'<p>{p}</p>' for p in paragraphs)
+        html = f"""<!DOCTYPE html><html><head><meta charset="utf-8"><title>Article {i}</title>
+<meta property="og:image" content="https://cdn.example.com/{i}.jpg">
+<link rel="canonical" href="https://example.com/articles/{i}">{scripts}</head>
+<body><header><nav><ul>{nav}</ul></nav></header>
+<main><article class="post-content"><h1>Article {i}</h1>{body}</article>
+<aside class="sidebar">{sidebar}</aside><section id="comments">{comments}</section></main>
+<footer><p>© Éditeur {i}</p></footer></body></html>"""
+        corpus.append((f"https://example.com/articles/{i}", html.encode('utf-8'), paragraphs))
+    return corpus
+
+def load_corpus_dir(path: str):
+    corpus = []
+    for filename in sorted(glob.glob(os.path.join(path, '*.html'))):
+        with open(filename, 'rb') as f:
+            corpus.append((f"file://{os.path.abspath(filename)}", f.read(), None))
+    return corpus
+
+def _recall(text: str, paragraphs) -> float:
+    """Part des paragraphes de référence retrouvés dans le texte extrait"""
+    if not paragraphs:
+        return float('nan')
+    normalized = ' '.join(text.split())
+    return sum(1 for p in paragraphs if ' '.join(p.split())[:80] in normalized) / len(paragraphs)
+
+def run(engine: str, corpus, repeat: int):
+    extractor = ArticleExtractor(engine=engine)
+    timings, recalls, sizes = [], [], []
+    for _ in range(repeat):
+        for url, html, paragraphs in corpus:
+            start = time.perf_counter()
+            page = extractor.extract(url, html)
+            timings.append((time.perf_counter() - start) * 1000)
+            recalls.append(_recall(page.text, paragraphs))
+            sizes.append(len(page.text))
+    timings.sort()
+    valid_recalls = [r for r in recalls if r == r]
+    return {
+        'mean_ms': statistics.mean(timings),
+        'p95_ms': timings[int(len(timings) * 0.95) - 1],
+        'recall': statistics.mean(valid_recalls) if valid_recalls else float('nan'),
+        'chars': statistics.mean(sizes)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des extracteurs de contenu")
+    parser.add_argument('--corpus', help="Répertoire de pages .html (défaut: corpus synthétique)")
+    parser.add_argument('--pages', type=int, default=60, help="Taille du corpus synthétique")
+    parser.add_argument('--repeat', type=int, default=3, help="Nombre de passes sur le corpus")
+    parser.add_argument('--engines', default='lxml,newspaper', help="Extracteurs à comparer")
+    args = parser.parse_args()
+
+    corpus = load_corpus_dir(args.corpus) if args.corpus else build_synthetic_corpus(args.pages)
+    total_kb = sum(len(html) for _, html, _ in corpus) / 1024
+    print(f"Corpus: {len(corpus)} pages, {total_kb:.0f} Ko, {args.repeat} passes\n")
+
+    engines = [engine.strip() for engine in args.engines.split(',')]
+    if 'newspaper' in engines:
+        start = time.perf_counter()
+        try:
+            import newspaper  # noqa: F401 - mesure du coût d'import séparée
+            print(f"Import newspaper3k: {(time.perf_counter() - start) * 1000:.0f} ms\n")
+        except ImportError:
+            # Sans la bibliothèque, l'extracteur retomberait sur lxml: mesure trompeuse
+            print("newspaper3k non installé: extracteur 'newspaper' ignoré\n")
+            engines.remove('newspaper')
+
+    print(f"{'Extracteur':<12}{'moy (ms)':>10}{'p95 (ms)':>10}{'rappel':>9}{'car./page':>11}")
+    for engine in engines:
+        stats = run(engine, corpus, args.repeat)
+        print(f"{engine:<12}{stats['mean_ms']:>10.2f}{stats['p95_ms']:>10.2f}{stats['recall']:>9.2f}{stats['chars']:>11.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -53,6 +53,53 @@ BULLETIN_CONFIG = {
     'cache_duration_hours': 48  # Cache pour éviter les doublons
 }
 
+# Configuration réseau (pool HTTP partagé, moteur asyncio et timeouts)
+HTTP_CONFIG = {
+    'max_concurrency': 200,  # Requêtes simultanées max sur la boucle asyncio
+    'pool_size_per_host': 8,  # Connexions simultanées (keep-alive) max par hôte
+    'max_workers': 32,  # Plafond global de pages d'articles téléchargées simultanément (phase 3)
+    'initial_per_host': 2,  # Fenêtre de départ par hôte, ajustée en AIMD jusqu'à pool_size_per_host
+    'slow_latency': 4.0,  # Réponse plus lente (secondes) = signal de surcharge de l'hôte
+    'max_hosts': 50,  # Nombre d'hôtes conservés dans le pool de connexions
+    'max_retries': 1,  # Nouvelles tentatives sur 502/503/504
+    'user_agent': 'Mozilla/5.0 (compatible; FLBNewsBot/1.0; +https://www.flb.ca)',
+    'feed_timeout': 15,  # Timeout par flux RSS/page de listing (secondes)
+    'article_timeout': 10,  # Timeout par page d'article (secondes)
+    'sources_phase_timeout': 60,  # Timeout global de la phase 1
+    'extraction_phase_timeout': 120,  # Timeout global de la phase 3
+    'run_timeout': 300,  # Budget de l'exécution complète (main.py --budget), réparti entre les phases
+    'phase_shares': {'sources': 0.3, 'extraction': 0.45, 'analysis': 0.15, 'translation': 0.1},  # Part du temps restant par phase
+    'streaming_pipeline': True,  # Extraction dès la réponse de chaque source (files bornées) au lieu de phases en barrière
+    'stream_queue_size': 32,  # File d'extraction bornée (contre-pression sur la lecture des sources)
+    'stream_translate_ahead': 3,  # Articles en tête traduits pendant que l'extraction se poursuit
+    'breaker_failure_threshold': 3,  # Échecs consécutifs avant mise à l'écart d'une source
+    'breaker_cooldown': 6 * 3600,  # Pause initiale (secondes), doublée à chaque sonde ratée
+    'probe_timeout': 5,  # Timeout de la sonde d'une source en pause
+    'canonicalize_urls': True,  # Paramètres de suivi, AMP, http/https et redirecteurs ramenés à une URL avant la phase 3
+    'redirect_cache_enabled': True,  # Redirections résolues gardées entre les exécutions (.url_cache)
+    'redirect_timeout': 5,  # Timeout de résolution d'un redirecteur (feedproxy, raccourcisseurs)
+    'redirect_phase_timeout': 15,  # Timeout global de la canonicalisation (phase 1.5)
+    'fast_feed_parser': True,  # Parseur lxml iterparse (arrêt à la date limite); feedparser en repli
+    'state_dir': None,  # Répertoire des états persistants (caches, santé des sources, magasin); None = racine du projet
+    'feed_cache_enabled': True,  # GET conditionnel (ETag/Last-Modified) sur les flux RSS
+    'max_page_bytes': 2 * 1024 * 1024,  # Plafond par réponse; surcharge possible par source ('max_bytes')
+    'skip_content_types': ['application/pdf', 'image/', 'video/', 'audio/', 'application/zip', 'application/octet-stream']
+}
+
+# Configuration de l'extraction du contenu des articles
+EXTRACTION_CONFIG = {
+    'extractor': 'lxml',  # 'lxml' (intégré, rapide) ou 'newspaper' (newspaper3k)
+    'newspaper_fallback': False,  # Réessayer avec newspaper3k si le texte lxml est trop court
+    'max_text_chars': 20000,  # Texte conservé par article (tronqué pendant l'extraction)
+    'rich_summary_chars': 1000,  # Résumé RSS assez riche: lire seulement le <head> (image, date)
+    'head_max_bytes': 65536,  # Limite de lecture du <head> en flux
+    'parse_workers': 0,  # Processus de parsing HTML (phase 3, hors GIL); 0 = dans les threads réseau
+    'structured_listings': True,  # Sources 'website': JSON-LD, flux annoncé ou sitemap news avant les sélecteurs CSS
+    'article_store_enabled': True,  # Magasin SQLite des articles extraits (exécutions incrémentales)
+    'article_store_ttl_days': 14,  # Article réutilisé sans téléchargement pendant cette durée
+    'article_store_retention_days': 90  # Purge des articles plus anciens à l'ouverture du magasin
+}
+
 # Configuration email
 EMAIL_CONFIG = {
     'smtp_server': os.getenv('SMTP_SERVER', 'smtp.gmail.com'),
@@ -77,6 +124,16 @@ SCHEDULE_CONFIG = {
     'days': os.getenv('SCHEDULE_DAYS', 'monday,wednesday,friday').split(',')
 }
 
+# Ingestion continue (main.py --ingest): chaque source interrogée à son propre rythme
+INGESTION_CONFIG = {
+    'min_interval': 15 * 60,  # Jamais plus souvent (secondes), même pour un flux très actif
+    'max_interval': 6 * 3600,  # Au moins une interrogation toutes les 6 heures
+    'default_interval': 3600,  # Rythme de départ tant que la fréquence de publication est inconnue
+    'workers': 4,  # Sources interrogées simultanément
+    'window_days': 7,  # Entrées plus anciennes ignorées
+    'poll_timeout': 120  # Échéance d'une interrogation (flux + extraction des nouveaux articles)
+}
+
 # Configuration de l'analyseur avancé
 ANALYSIS_CONFIG = {
     # Modes: 'economique', 'standard', 'premium'
@@ -97,6 +154,8 @@ ANALYSIS_CONFIG = {
     
     # Seuils et limites
     'bm25_threshold': 0.3,  # Score minimum pour analyse LLM
+    'bm25_corpus_stats': True,  # Statistiques BM25 (df, longueur moyenne) persistantes, mises à jour à chaque article
+    'bm25_window_days': 30,  # Fenêtre glissante des articles comptés dans le corpus BM25
     'max_ollama_articles': 20,  # Nombre max d'articles à analyser avec Ollama
     'max_openrouter_articles': 5,  # Nombre max pour enrichissement cloud
     
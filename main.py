@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 
-import sys
 import os
 import argparse
+import asyncio
 import logging
 import schedule
+import threading
+import math
 import time
 import smtplib
 from email.mime.text import MIMEText
@@ -13,10 +15,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Tuple, Dict, Any
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from scraper import FoodIndustryNewsScraper
-from bulletin_generator import BulletinGenerator
+from src.scraper import FoodIndustryNewsScraper
+from src.bulletin_generator import BulletinGenerator
+from src.source_health import SourceHealthTracker
+from src.ingestion_daemon import IngestionDaemon
+from src import http_recorder
 import config
 
 logging.basicConfig(
@@ -68,7 +71,11 @@ def load_analysis_config():
 ANALYSIS_CONFIG, CONFIG_SOURCE = load_analysis_config()
 
 class FLBNewsApp:
-    def __init__(self):
+    def __init__(self, use_async: bool = False, from_store: bool = False):
+        self.use_async = use_async
+        self.from_store = from_store  # Bulletin = requête sur les articles déjà ingérés
+        self.ingestion = None  # Démon d'ingestion continue (start_ingestion)
+        
         # Configuration avec validation
         analysis_config = ANALYSIS_CONFIG or getattr(config, 'ANALYSIS_CONFIG', None)
         
@@ -86,7 +93,9 @@ class FLBNewsApp:
                 config.NEWS_SOURCES,
                 keywords_config=getattr(config, 'RELEVANCE_KEYWORDS', None),
                 analysis_config=analysis_config,
-                bulletin_config=config.BULLETIN_CONFIG
+                bulletin_config=config.BULLETIN_CONFIG,
+                http_config=getattr(config, 'HTTP_CONFIG', None),
+                extraction_config=getattr(config, 'EXTRACTION_CONFIG', None)
             )
         except Exception as e:
             logger.error(f"Erreur lors de l'initialisation du scraper: {e}")
@@ -133,9 +142,13 @@ class FLBNewsApp:
         
         try:
             logger.info(f"Recherche de nouvelles des {config.BULLETIN_CONFIG['days_to_scrape']} derniers jours...")
-            news_items = self.scraper.scrape_all_sources(
-                days_back=config.BULLETIN_CONFIG['days_to_scrape']
-            )
+            days_back = config.BULLETIN_CONFIG['days_to_scrape']
+            if self.from_store:
+                news_items = self.scraper.select_from_store(days_back=days_back)
+            elif self.use_async:
+                news_items = asyncio.run(self.scraper.ascrape_all_sources(days_back=days_back))
+            else:
+                news_items = self.scraper.scrape_all_sources(days_back=days_back)
             
             if not news_items:
                 logger.warning("Aucune nouvelle trouvée pour cette période")
@@ -216,6 +229,24 @@ class FLBNewsApp:
             
         logger.info("Tâche planifiée terminée")
     
+    def start_ingestion(self, background: bool = False):
+        """Ingestion continue des sources vers le magasin local (thread de fond avec le planificateur)"""
+        daemon = self.ingestion = IngestionDaemon.from_config(self.scraper, getattr(config, 'INGESTION_CONFIG', None))
+        if background:
+            thread = threading.Thread(target=daemon.run, name='ingestion', daemon=True)
+            thread.start()
+            return thread
+        try:
+            daemon.run()
+        except KeyboardInterrupt:
+            logger.info("Ingestion arrêtée")
+    
+    def close(self):
+        """Arrêter l'ingestion en fond et libérer les processus de parsing du scraper"""
+        if self.ingestion is not None:
+            self.ingestion.stop()
+        self.scraper.close()
+    
     def start_scheduler(self):
         if not config.SCHEDULE_CONFIG['enabled']:
             logger.info("Planificateur désactivé")
@@ -242,6 +273,47 @@ class FLBNewsApp:
             schedule.run_pending()
             time.sleep(60)
 
+def show_source_health(export_path: str = ''):
+    """Rapport de santé des sources, de la plus lente à la plus rapide"""
+    tracker = SourceHealthTracker.from_config(getattr(config, 'HTTP_CONFIG', None))
+    rows = tracker.report()
+    if not rows:
+        print("Aucune statistique de source enregistrée pour le moment")
+        return
+    print(f"{'Source':<40}{'État':<8}{'Succès':>8}{'p50 (s)':>9}{'p95 (s)':>9}{'Échecs':>8}  Dernière erreur")
+    for row in rows:
+        print(f"{row['source'][:39]:<40}{row['etat']:<8}{row['taux_succes']:>8.0%}{row['p50_s']:>9.2f}{row['p95_s']:>9.2f}"
+              f"{row['echecs_consecutifs']:>8}  {row['derniere_erreur'][:60]}")
+    if export_path:
+        count = tracker.export_csv(export_path)
+        print(f"\n📁 {count} sources exportées vers {export_path}")
+
+def parse_budget(value: str) -> float:
+    """Durée du budget d'exécution: '90', '90s', '2m' ou '1h'"""
+    units = {'s': 1, 'm': 60, 'h': 3600}
+    value = value.strip().lower()
+    try:
+        if value and value[-1] in units:
+            seconds = float(value[:-1]) * units[value[-1]]
+        else:
+            seconds = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"durée invalide: {value} (exemples: 90s, 2m)")
+    if seconds <= 0:
+        raise argparse.ArgumentTypeError("le budget doit être positif")
+    return seconds
+
+def isolate_for_http_archive():
+    """Enregistrement/rejeu: aucun état persistant ne doit éviter une requête ni écarter une source"""
+    config.HTTP_CONFIG['feed_cache_enabled'] = False
+    config.HTTP_CONFIG['redirect_cache_enabled'] = False
+    config.HTTP_CONFIG['breaker_failure_threshold'] = math.inf
+    config.EXTRACTION_CONFIG['article_store_enabled'] = False
+    # IDF et longueur moyenne figées par exécution: rejouer deux fois donne les mêmes scores
+    for analysis_config in (ANALYSIS_CONFIG, getattr(config, 'ANALYSIS_CONFIG', None)):
+        if analysis_config is not None:
+            analysis_config['bm25_corpus_stats'] = False
+
 def main():
     parser = argparse.ArgumentParser(
         description="FLB News - Générateur de bulletin de nouvelles de l'industrie alimentaire"
@@ -266,6 +338,56 @@ def main():
         action='store_true',
         help="Démarrer le planificateur selon la configuration"
     )
+    parser.add_argument(
+        '--async-fetch',
+        action='store_true',
+        help="Utiliser le moteur de récupération asyncio (aiohttp)"
+    )
+    parser.add_argument(
+        '--ingest',
+        action='store_true',
+        help="Ingestion continue: chaque source interrogée à son propre rythme, articles rangés dans le magasin local"
+    )
+    parser.add_argument(
+        '--from-store',
+        action='store_true',
+        help="Générer le bulletin à partir des articles déjà ingérés (sans scraping)"
+    )
+    parser.add_argument(
+        '--source-health',
+        nargs='?',
+        const='',
+        metavar='FICHIER_CSV',
+        help="Afficher la santé des sources (latences, échecs, disjoncteur) et l'exporter en CSV si un fichier est donné"
+    )
+    archive_group = parser.add_mutually_exclusive_group()
+    archive_group.add_argument(
+        '--record',
+        nargs='?',
+        const=http_recorder.DEFAULT_ARCHIVE,
+        metavar='ARCHIVE',
+        help="Enregistrer tout le trafic HTTP (flux, pages, DeepL, OpenRouter) dans une archive gzip"
+    )
+    archive_group.add_argument(
+        '--replay',
+        nargs='?',
+        const=http_recorder.DEFAULT_ARCHIVE,
+        metavar='ARCHIVE',
+        help="Rejouer une archive HTTP sans réseau (exécutions hors ligne reproductibles)"
+    )
+    parser.add_argument(
+        '--replay-latency',
+        type=float,
+        default=None,
+        metavar='SECONDES',
+        help="Latence fixe par réponse rejouée (défaut: latence enregistrée; 0 = aucune)"
+    )
+    parser.add_argument(
+        '--budget',
+        type=parse_budget,
+        metavar='DURÉE',
+        help="Budget de l'exécution (ex. 90s, 2m) réparti entre les phases; les meilleurs candidats sont traités en premier"
+    )
     parser.add_argument(
         '--days',
         type=int,
@@ -275,14 +397,52 @@ def main():
     
     args = parser.parse_args()
     
-    app = FLBNewsApp()
+    if args.source_health is not None:
+        show_source_health(args.source_health)
+        return
+    
+    if args.budget:
+        # Heure de fin garantie (exécutions planifiées de 08:00 comprises)
+        config.HTTP_CONFIG['run_timeout'] = args.budget
+        logger.info(f"⏱️ Budget d'exécution: {args.budget:.0f}s")
+    
+    recorder = None
+    if args.record or args.replay:
+        isolate_for_http_archive()
+        if args.record:
+            recorder = http_recorder.install(args.record, http_recorder.RECORD)
+        else:
+            recorder = http_recorder.install(args.replay, http_recorder.REPLAY, args.replay_latency)
+    
+    try:
+        run_app(args, parser, recorder)
+    finally:
+        http_recorder.uninstall()
+
+def run_app(args, parser, recorder=None):
+    # Avec l'ingestion en fond, les bulletins planifiés ne font qu'interroger le magasin
+    app = FLBNewsApp(use_async=args.async_fetch, from_store=args.from_store or (args.schedule and args.ingest))
     
     if args.days != 7:
         config.BULLETIN_CONFIG['days_to_scrape'] = args.days
+    if recorder is not None and recorder.mode == http_recorder.REPLAY:
+        # Fenêtre décalée de l'âge de l'archive: les mêmes articles restent dans la période
+        config.BULLETIN_CONFIG['days_to_scrape'] += recorder.age_days
     
+    try:
+        run_commands(app, args, parser)
+    finally:
+        app.close()
+
+def run_commands(app, args, parser):
     if args.schedule:
         logger.info("Démarrage du planificateur...")
+        if args.ingest:
+            app.start_ingestion(background=True)
         app.start_scheduler()
+    elif args.ingest:
+        logger.info("Démarrage de l'ingestion continue...")
+        app.start_ingestion()
     elif args.run_now or not any([args.schedule]):
         bulletin_data = app.run_bulletin_generation()
         
@@ -12,6 +12,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 import hashlib
 
+from src.deadline import Deadline
+from src.keyword_matcher import KeywordMatcher
+from src.corpus_stats import CorpusStats
+
 # Imports conditionnels pour supporter différents modes
 try:
     from rank_bm25 import BM25Okapi
@@ -27,6 +31,12 @@ except ImportError:
     NLTK_AVAILABLE = False
     logging.warning("rank-bm25 or nltk not installed. BM25 scoring will use basic tokenization.")
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 try:
     import ollama
     OLLAMA_AVAILABLE = True
@@ -43,6 +53,8 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+OPENROUTER_TIMEOUT = 15  # Timeout d'un appel OpenRouter (réduit au budget restant de la phase d'analyse)
+
 @dataclass
 class AnalysisResult:
     """Résultat d'analyse d'un article"""
@@ -58,17 +70,30 @@ class AnalysisResult:
 class BM25Analyzer:
     """Analyseur rapide basé sur BM25 pour pré-filtrage avec tokenisation améliorée"""
     
-    def __init__(self, keywords_config: Dict[str, int]):
+    def __init__(self, keywords_config: Dict[str, int], corpus_stats: Optional[CorpusStats] = None):
         self.keywords = keywords_config
+        # Statistiques de corpus persistantes: scoring sans index par exécution (rank-bm25 inutile)
+        self.corpus_stats = corpus_stats
         self.bm25_index = None
         self.documents = []
         self.tokenized_docs = []  # Cache des documents tokenisés
         self.index_hash = None  # Hash pour détecter si l'index doit être reconstruit
+        self.positions: Dict[str, int] = {}  # Position de chaque texte dans l'index
+        self._flb_query: Optional[str] = None
+        self._query_tokens: Dict[str, List[str]] = {}  # Requêtes tokenisées une seule fois
+        self._corpus_scores: Dict[str, List[float]] = {}  # Scores de tout l'index par requête (index courant)
         
         # Initialiser le tokenizer
         self.tokenizer = self._init_tokenizer()
         
-        if not BM25_AVAILABLE:
+        # Mots-clés simples (cherchés dans le vocabulaire) et expressions (cherchées dans le texte) pour le scoring par lot
+        self.keyword_names = list(self.keywords)
+        self.keyword_matcher = KeywordMatcher({
+            'words': [k for k in self.keyword_names if ' ' not in k.lower()],
+            'phrases': [k for k in self.keyword_names if ' ' in k.lower()]
+        })
+        
+        if not BM25_AVAILABLE and corpus_stats is None:
             logger.warning("BM25 not available, falling back to keyword scoring")
     
     def _init_tokenizer(self):
@@ -106,41 +131,80 @@ class BM25Analyzer:
         self.bm25_index = BM25Okapi(self.tokenized_docs)
         self.documents = documents
         self.index_hash = docs_hash
+        self.positions = {}
+        for position, document in enumerate(documents):
+            self.positions.setdefault(document, position)
+        self._corpus_scores = {}
         
         logger.info(f"BM25 index built with {len(documents)} documents, avg tokens: {sum(len(doc) for doc in self.tokenized_docs) / len(self.tokenized_docs):.1f}")
     
-    def score_document(self, document: str, query_context: str = None) -> float:
-        """Calculer le score de pertinence d'un document avec normalisation"""
+    def score_batch(self, documents: List[str], query_context: str = None, keyword_scores: Optional[List[float]] = None) -> List[float]:
+        """Scores de tout un lot: index construit sur le lot, un seul passage BM25 pour la requête,
+        scores rattachés aux documents par position (doublons compris)"""
+        if keyword_scores is None:
+            keyword_scores = self.keyword_scores(documents)
+        if self.corpus_stats is not None:
+            # Lot ajouté aux statistiques globales puis noté contre elles, sans index
+            tokenized = self.ingest(documents)
+            query_tokens = self._tokens_for(query_context)
+            return [self._combine(self.corpus_stats.score(tokens, query_tokens), keyword_score)
+                    for tokens, keyword_score in zip(tokenized, keyword_scores)]
+        self.build_index(documents)
+        if not BM25_AVAILABLE or self.bm25_index is None or not documents:
+            return list(keyword_scores)
+        scores = self._scores_for(query_context)
+        return [self._combine(scores[position], keyword_score) for position, keyword_score in enumerate(keyword_scores)]
+    
+    def score_document(self, document: str, query_context: str = None, keyword_score: Optional[float] = None) -> float:
+        """Calculer le score de pertinence d'un document avec normalisation
+        (keyword_score: score de mots-clés déjà calculé par keyword_scores pour tout le lot)"""
+        if keyword_score is None:
+            keyword_score = self._keyword_score(document)
+        
+        if self.corpus_stats is not None:
+            return self._combine(self.corpus_stats.score(self.tokenizer(document), self._tokens_for(query_context)), keyword_score)
         
         # Si pas de BM25, utiliser le scoring par mots-clés
         if not BM25_AVAILABLE or self.bm25_index is None:
-            return self._keyword_score(document)
+            return keyword_score
         
-        # Construire la requête à partir du contexte FLB
+        # Scores de tout l'index calculés une fois par requête, document retrouvé par sa position
+        position = self.positions.get(document)
+        bm25_score = self._scores_for(query_context)[position] if position is not None else 0
+        return self._combine(bm25_score, keyword_score)
+    
+    def _scores_for(self, query_context: Optional[str] = None) -> List[float]:
+        """Scores BM25 de tous les documents indexés pour la requête (FLB par défaut)"""
         if query_context is None:
             query_context = self._build_flb_query()
-        
-        # Tokeniser la requête avec le même tokenizer
-        query_tokens = self.tokenizer(query_context)
-        scores = self.bm25_index.get_scores(query_tokens)
-        
-        # Trouver l'index du document
-        try:
-            doc_index = self.documents.index(document)
-            bm25_score = scores[doc_index]
-        except (ValueError, IndexError):
-            bm25_score = 0
-        
+        scores = self._corpus_scores.get(query_context)
+        if scores is None:
+            scores = self._corpus_scores[query_context] = [float(score) for score in self.bm25_index.get_scores(self._tokens_for(query_context))]
+        return scores
+    
+    def _tokens_for(self, query_context: Optional[str] = None) -> List[str]:
+        """Requête tokenisée avec le même tokenizer, une seule fois"""
+        if query_context is None:
+            query_context = self._build_flb_query()
+        query_tokens = self._query_tokens.get(query_context)
+        if query_tokens is None:
+            query_tokens = self._query_tokens[query_context] = self.tokenizer(query_context)
+        return query_tokens
+    
+    def ingest(self, documents: List[str]) -> List[List[str]]:
+        """Ajouter des documents aux statistiques de corpus persistantes; renvoie leurs tokens"""
+        tokenized = [self.tokenizer(document) for document in documents]
+        if self.corpus_stats is not None:
+            self.corpus_stats.add_many(zip(documents, tokenized))
+        return tokenized
+    
+    @staticmethod
+    def _combine(bm25_score: float, keyword_score: float) -> float:
         # Normaliser le score BM25 (souvent entre 0-20)
         normalized_bm25 = min(bm25_score / 15, 1.0)  # Normaliser vers 0-1
         
-        # Score de mots-clés normalisé
-        keyword_score = self._keyword_score(document)
-        
         # Pondération optimisée: 60% BM25, 40% mots-clés
-        final_score = (normalized_bm25 * 0.6) + (keyword_score * 0.4)
-        
-        return final_score
+        return (normalized_bm25 * 0.6) + (keyword_score * 0.4)
     
     def _keyword_score(self, document: str) -> float:
         """Scoring amélioré par mots-clés avec TF-IDF simplifié"""
@@ -181,8 +245,65 @@ class BM25Analyzer:
         normalized = min(math.log(1 + score) / math.log(101), 1.0)
         return normalized
     
+    def keyword_scores(self, documents: List[str]) -> List[float]:
+        """_keyword_score pour tout un lot: matrices creuses document x terme puis opérations NumPy"""
+        if not NUMPY_AVAILABLE or not documents:
+            return [self._keyword_score(document) for document in documents]
+        
+        lowered = [document.lower() for document in documents]
+        tokenized = [self.tokenizer(document) for document in lowered]
+        lengths = np.array([len(tokens) for tokens in tokenized], dtype=float)
+        weights = np.array([self.keywords[keyword] for keyword in self.keyword_names], dtype=float)
+        column = {}
+        for index, keyword in enumerate(self.keyword_names):
+            column.setdefault(keyword.lower(), []).append(index)
+        
+        # Vocabulaire du lot: document x token (occurrences), token x mot-clé simple (mot-clé contenu dans le token)
+        vocabulary = {}
+        doc_ids, token_ids = [], []
+        for doc, tokens in enumerate(tokenized):
+            for token in tokens:
+                doc_ids.append(doc)
+                token_ids.append(vocabulary.setdefault(token, len(vocabulary)))
+        n_tokens = max(len(vocabulary), 1)
+        pairs, counts = np.unique(np.array(doc_ids, dtype=np.int64) * n_tokens + np.array(token_ids, dtype=np.int64), return_counts=True)
+        pair_docs, pair_tokens = pairs // n_tokens, pairs % n_tokens
+        
+        indptr, indices = [0], []
+        for token in vocabulary:
+            found = self.keyword_matcher.scan(token)
+            indices.extend(index for pattern in found.groups['words'] if pattern in found for index in column[pattern])
+            indptr.append(len(indices))
+        indptr, indices = np.array(indptr, dtype=np.int64), np.array(indices, dtype=np.int64)
+        
+        # Produit creux: chaque (document, token) réparti sur les mots-clés que contient le token
+        starts = indptr[pair_tokens]
+        repeats = indptr[pair_tokens + 1] - starts
+        offsets = np.arange(repeats.sum()) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+        keywords = indices[np.repeat(starts, repeats) + offsets]
+        rows = np.repeat(pair_docs, repeats)
+        token_matches = np.repeat(counts, repeats).astype(float)
+        idf = 1 + np.array([len(keyword.lower()) for keyword in self.keyword_names], dtype=float) / 10  # Mots longs = plus spécifiques
+        safe_lengths = np.maximum(lengths, 1)
+        scores = np.bincount(rows, weights=weights[keywords] * token_matches / safe_lengths[rows] * idf[keywords],
+                             minlength=len(documents))
+        
+        # Expressions multi-mots: occurrences dans le texte, bonus x2
+        for doc, document in enumerate(lowered):
+            found = self.keyword_matcher.scan(document)
+            for pattern in found.groups['phrases']:
+                if pattern in found:
+                    for index in column[pattern]:
+                        scores[doc] += weights[index] * found.count(pattern) / safe_lengths[doc] * 2
+        
+        # Normaliser vers 0-1 avec courbe logarithmique
+        normalized = np.minimum(np.log1p(scores) / np.log(101), 1.0)
+        return np.where(lengths > 0, normalized, 0.0).tolist()
+    
     def _build_flb_query(self) -> str:
-        """Construire une requête pondérée représentant les intérêts prioritaires de FLB"""
+        """Construire une requête pondérée représentant les intérêts prioritaires de FLB (une fois)"""
+        if self._flb_query is not None:
+            return self._flb_query
         # Créer requête avec répétitions pour pondération
         priority_terms = {
             'distributeur alimentaire': 3,
@@ -200,7 +321,8 @@ class BM25Analyzer:
         for term, repeat in priority_terms.items():
             query_parts.extend([term] * repeat)
         
-        return ' '.join(query_parts)
+        self._flb_query = ' '.join(query_parts)
+        return self._flb_query
 
 class OllamaAnalyzer:
     """Analyseur basé sur LLM local via Ollama"""
@@ -309,7 +431,7 @@ class OpenRouterEnricher:
         else:
             logger.warning("OpenRouter not configured. Cloud enrichment disabled.")
     
-    def enrich_analysis(self, title: str, summary: str, initial_analysis: AnalysisResult) -> AnalysisResult:
+    def enrich_analysis(self, title: str, summary: str, initial_analysis: AnalysisResult, timeout: float = OPENROUTER_TIMEOUT) -> AnalysisResult:
         """Enrichir l'analyse avec un LLM cloud plus puissant"""
         
         if not self.client:
@@ -348,6 +470,7 @@ class OpenRouterEnricher:
                 ],
                 temperature=0.4,
                 max_tokens=800,
+                timeout=timeout,  # Borné par le budget de la phase d'analyse
                 extra_headers={
                     "HTTP-Referer": "http://localhost:3000",
                     "X-Title": "FLB News Bulletin Generator"
@@ -407,7 +530,13 @@ class HybridAnalysisEngine:
         
         if self.config['enable_bm25']:
             keywords = self.config.get('keywords', {})
-            self.bm25 = BM25Analyzer(keywords)
+            corpus_stats = None
+            if self.config.get('bm25_corpus_stats', True):
+                try:
+                    corpus_stats = CorpusStats.from_config(self.config)
+                except Exception as e:
+                    logger.warning(f"Corpus BM25 persistant indisponible, index par exécution: {e}")
+            self.bm25 = BM25Analyzer(keywords, corpus_stats)
         
         if self.config['enable_ollama']:
             self.ollama = OllamaAnalyzer(
@@ -431,12 +560,15 @@ class HybridAnalysisEngine:
             'enable_openrouter': False,  # Désactivé par défaut (nécessite API key)
             'mode': 'economique',  # economique, standard, premium
             'bm25_threshold': 0.3,  # Score minimum pour passer à l'analyse LLM
+            'bm25_corpus_stats': True,  # IDF sur tous les articles de la fenêtre glissante (persistant)
+            'bm25_window_days': 30,
             'max_ollama_articles': 20,
             'max_openrouter_articles': 7
         }
     
-    def analyze_batch(self, articles: List[Dict]) -> List[Tuple[Dict, AnalysisResult]]:
-        """Analyser un lot d'articles avec la pipeline hybride"""
+    def analyze_batch(self, articles: List[Dict], deadline: Optional[Deadline] = None) -> List[Tuple[Dict, AnalysisResult]]:
+        """Analyser un lot d'articles avec la pipeline hybride; à l'échéance, analyse basique sans LLM"""
+        deadline = deadline or Deadline.never()
         
         results = []
         
@@ -447,11 +579,8 @@ class HybridAnalysisEngine:
                 f"{a.get('title', '')} {a.get('summary', '')} {a.get('full_text', '')}"
                 for a in articles
             ]
-            self.bm25.build_index(documents)
-            
-            # Scorer chaque article
-            for i, article in enumerate(articles):
-                score = self.bm25.score_document(documents[i])
+            # Un seul passage BM25 sur tout le lot, scores rattachés par position
+            for article, score in zip(articles, self.bm25.score_batch(documents)):
                 article['bm25_score'] = score
         else:
             # Fallback: tous les articles ont un score de 0.5
@@ -473,8 +602,8 @@ class HybridAnalysisEngine:
                 results.append((article, cached_result))
                 continue
             
-            # Analyse avec Ollama si disponible
-            if self.ollama and article.get('bm25_score', 0) >= self.config['bm25_threshold']:
+            # Analyse avec Ollama si disponible et si le budget le permet
+            if self.ollama and article.get('bm25_score', 0) >= self.config['bm25_threshold'] and not deadline.expired:
                 analysis = self.ollama.analyze_article(
                     title=article.get('title', ''),
                     summary=article.get('summary', ''),
@@ -496,13 +625,17 @@ class HybridAnalysisEngine:
             # Enrichir les top articles
             for i in range(min(self.config['max_openrouter_articles'], len(results))):
                 article, analysis = results[i]
+                if deadline.expired:
+                    logger.warning(f"Budget d'analyse épuisé: enrichissement arrêté après {i} articles")
+                    break
                 
                 # Enrichir seulement si le score est suffisant
                 if analysis.relevance_score >= 0.5:
                     enriched = self.openrouter.enrich_analysis(
                         title=article.get('title', ''),
                         summary=article.get('summary', ''),
-                        initial_analysis=analysis
+                        initial_analysis=analysis,
+                        timeout=deadline.timeout(OPENROUTER_TIMEOUT)
                     )
                     results[i] = (article, enriched)
         
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Extraction unifiée des pages d'articles pour FLB News
+Un seul téléchargement et un seul parsing: texte, image, métadonnées, date et URL canonique
+"""
+
+import re
+import logging
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from datetime import datetime
+from urllib.parse import urljoin
+
+import lxml.html
+from dateutil import parser as date_parser
+
+logger = logging.getLogger(__name__)
+
+# newspaper3k est lent à importer: chargé seulement si l'extracteur 'newspaper' est demandé
+_newspaper_article = None
+
+def _load_newspaper():
+    global _newspaper_article
+    if _newspaper_article is None:
+        try:
+            from newspaper import Article
+            _newspaper_article = Article
+        except ImportError:
+            logger.warning("newspaper3k not installed. Article extraction will use lxml only.")
+            _newspaper_article = False
+    return _newspaper_article or None
+
+# Balises de date de publication, par ordre de fiabilité
+PUBLISHED_META_KEYS = [
+    'article:published_time', 'og:published_time', 'datepublished',
+    'parsely-pub-date', 'sailthru.date', 'dc.date', 'dc.date.issued', 'pubdate', 'date'
+]
+
+# Élaguage et scoring (densité de texte / densité de liens) à la Readability
+PRUNE_TAGS = ('script', 'style', 'noscript', 'nav', 'header', 'footer', 'aside', 'form',
+              'iframe', 'svg', 'button', 'select', 'template')
+TEXT_BLOCK_TAGS = ('p', 'h2', 'h3', 'h4', 'li', 'blockquote', 'pre')
+NEGATIVE_HINTS = re.compile(
+    r'comment|sidebar|share|social|related|promo|footer|masthead|nav|menu|cookie|newsletter|'
+    r'subscribe|advert|sponsor|banner|popup|modal|breadcrumb|widget|outbrain|taboola|pagination', re.I)
+POSITIVE_HINTS = re.compile(r'article|content|entry|post|story|body|text|main|blog', re.I)
+TAG_WEIGHTS = {'article': 10, 'main': 8, 'section': 3, 'div': 5, 'td': 3, 'pre': 3, 'blockquote': 3,
+               'form': -3, 'ul': -3, 'ol': -3, 'li': -3, 'th': -5}
+
+def _class_weight(element) -> int:
+    hints = f"{element.get('class', '')} {element.get('id', '')}"
+    weight = 0
+    if NEGATIVE_HINTS.search(hints):
+        weight -= 25
+    if POSITIVE_HINTS.search(hints):
+        weight += 25
+    return weight
+
+def _normalized_text(element) -> str:
+    return ' '.join(element.text_content().split())
+
+def _link_density(element, text_length: int) -> float:
+    if text_length == 0:
+        return 1.0
+    link_length = sum(len(_normalized_text(a)) for a in element.iter('a'))
+    return min(link_length / text_length, 1.0)
+
+def _inside_text_block(node, container) -> bool:
+    """Le bloc est-il imbriqué dans un autre bloc texte (ex. <p> dans <li>) sous le conteneur?"""
+    for ancestor in node.iterancestors():
+        if ancestor is container:
+            return False
+        if ancestor.tag in TEXT_BLOCK_TAGS:
+            return True
+    return False
+
+def extract_main_text(doc, max_chars: int = 0) -> str:
+    """Extracteur de contenu principal sur un arbre lxml (modifie l'arbre: élaguage)"""
+    body = doc.find('body')
+    root = body if body is not None else doc
+
+    # 1. Élaguer le bruit: balises non éditoriales et blocs aux classes/id suspects
+    for element in list(root.iter(*PRUNE_TAGS)):
+        if element.getparent() is not None:
+            element.drop_tree()
+    for element in list(root.iter('div', 'section', 'ul', 'ol', 'table', 'span')):
+        hints = f"{element.get('class', '')} {element.get('id', '')}"
+        if element.getparent() is not None and NEGATIVE_HINTS.search(hints) and not POSITIVE_HINTS.search(hints):
+            element.drop_tree()
+
+    # 2. Scorer les conteneurs à partir des paragraphes qu'ils contiennent
+    candidates = {}
+    for paragraph in root.iter('p', 'pre', 'td'):
+        text = _normalized_text(paragraph)
+        if len(text) < 25:
+            continue
+        content_score = 1 + text.count(',') + min(len(text) // 100, 3)
+        parent = paragraph.getparent()
+        grandparent = parent.getparent() if parent is not None else None
+        for node, factor in ((parent, 1.0), (grandparent, 0.5)):
+            if node is None:
+                continue
+            if node not in candidates:
+                candidates[node] = TAG_WEIGHTS.get(node.tag, 0) + _class_weight(node)
+            candidates[node] += content_score * factor
+
+    if not candidates:
+        text = _normalized_text(root)
+        return text[:max_chars] if max_chars else text
+
+    for node in candidates:
+        candidates[node] *= 1 - _link_density(node, len(_normalized_text(node)))
+    best = max(candidates, key=candidates.get)
+
+    # 3. Conserver les voisins du meilleur bloc qui portent aussi du contenu
+    threshold = max(10, candidates[best] * 0.2)
+    containers = [best]
+    parent = best.getparent()
+    if parent is not None:
+        containers = [sibling for sibling in parent
+                      if sibling is best or candidates.get(sibling, 0) >= threshold]
+
+    # 4. Texte par blocs, tronqué pendant le parcours
+    blocks: List[str] = []
+    total = 0
+    for container in containers:
+        nodes = [node for node in container.iter(*TEXT_BLOCK_TAGS)
+                 if node is container or not _inside_text_block(node, container)]
+        if not nodes:
+            nodes = [container]
+        for node in nodes:
+            text = _normalized_text(node)
+            if not text or (node.tag == 'li' and _link_density(node, len(text)) > 0.5):
+                continue
+            blocks.append(text)
+            total += len(text) + 2
+            if max_chars and total >= max_chars:
+                return '\n\n'.join(blocks)[:max_chars]
+    return '\n\n'.join(blocks)
+
+CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.I)
+
+def sniff_encoding(html: bytes, content_type: str = "") -> str:
+    """Encodage d'une page: en-tête HTTP, puis <meta charset>, puis UTF-8 strict, sinon cp1252"""
+    if 'charset=' in content_type.lower():
+        return content_type.lower().split('charset=')[-1].split(';')[0].strip().strip('"\'')
+    match = CHARSET_PATTERN.search(html[:4096])
+    if match:
+        return match.group(1).decode('ascii', errors='ignore')
+    try:
+        html.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'windows-1252'
+
+def parse_html(html: bytes, content_type: str = ""):
+    """Construire l'arbre lxml avec le bon encodage"""
+    try:
+        parser = lxml.html.HTMLParser(encoding=sniff_encoding(html, content_type))
+    except LookupError:
+        parser = lxml.html.HTMLParser(encoding='utf-8')
+    return lxml.html.document_fromstring(html, parser=parser)
+
+@dataclass
+class ExtractedPage:
+    """Résultat de l'extraction d'une page d'article"""
+    url: str
+    text: str = ""
+    top_image: str = ""
+    canonical_url: str = ""
+    published_date: Optional[datetime] = None
+    metadata: Dict[str, str] = field(default_factory=dict)  # og:*, twitter:*, article:*, description...
+
+class ArticleExtractor:
+    """Extraire en une passe tout ce dont le pipeline a besoin à partir du HTML déjà téléchargé"""
+
+    def __init__(self, engine: str = 'lxml', max_text_chars: int = 20000, newspaper_fallback: bool = False, min_text_chars: int = 200):
+        self.engine = engine  # 'lxml' (intégré, rapide) ou 'newspaper' (newspaper3k)
+        self.max_text_chars = max_text_chars
+        self.newspaper_fallback = newspaper_fallback  # newspaper3k si le texte lxml est trop court
+        self.min_text_chars = min_text_chars
+
+    def extract(self, url: str, html: bytes, content_type: str = "") -> ExtractedPage:
+        page = ExtractedPage(url=url)
+        if not html:
+            return page
+
+        if self.engine == 'newspaper':
+            doc = self._extract_with_newspaper(url, html, page)
+            if doc is not None:
+                self._read_metadata(doc, page)
+                if page.text:
+                    return page
+
+        try:
+            doc = parse_html(html, content_type)
+        except Exception as e:
+            logger.debug(f"Parsing lxml impossible pour {url}: {e}")
+            return page
+
+        # Métadonnées lues avant l'élaguage de l'arbre par l'extracteur de texte
+        self._read_metadata(doc, page)
+        page.text = extract_main_text(doc, self.max_text_chars)
+
+        if self.newspaper_fallback and self.engine != 'newspaper' and len(page.text) < self.min_text_chars:
+            fallback = ExtractedPage(url=url)
+            if self._extract_with_newspaper(url, html, fallback) is not None and len(fallback.text) > len(page.text):
+                page.text = fallback.text
+        return page
+
+    def extract_head(self, url: str, head_html: bytes, content_type: str = "") -> ExtractedPage:
+        """Métadonnées seulement (image, URL canonique, date) à partir du <head> d'une page"""
+        page = ExtractedPage(url=url)
+        if not head_html:
+            return page
+        try:
+            doc = parse_html(head_html, content_type)
+        except Exception as e:
+            logger.debug(f"Parsing du <head> impossible pour {url}: {e}")
+            return page
+        self._read_metadata(doc, page)
+        return page
+
+    def _extract_with_newspaper(self, url: str, html: bytes, page: ExtractedPage):
+        """Extraction newspaper3k; retourne l'arbre non nettoyé pour la lecture des métadonnées"""
+        Article = _load_newspaper()
+        if Article is None:
+            return None
+        try:
+            article = Article(url, fetch_images=False)
+            article.download(input_html=html)
+            article.parse()
+            page.text = (article.text or "")[:self.max_text_chars]
+            return article.clean_doc  # Copie non nettoyée de l'arbre (balises meta intactes)
+        except Exception as e:
+            logger.debug(f"newspaper3k a échoué pour {url}: {e}")
+            return None
+
+    def _read_metadata(self, doc, page: ExtractedPage):
+        """Balises meta, lien canonique, date de publication et image principale"""
+        metadata = {}
+        for meta in doc.iter('meta'):
+            key = (meta.get('property') or meta.get('name') or meta.get('itemprop') or '').strip().lower()
+            content = (meta.get('content') or '').strip()
+            if key and content and key not in metadata:
+                metadata[key] = content
+        page.metadata = metadata
+
+        for link in doc.iter('link'):
+            if (link.get('rel') or '').lower() == 'canonical' and link.get('href'):
+                page.canonical_url = urljoin(page.url, link.get('href').strip())
+                break
+        if not page.canonical_url and metadata.get('og:url'):
+            page.canonical_url = urljoin(page.url, metadata['og:url'])
+
+        page.published_date = self._parse_published(metadata, doc)
+
+        image = metadata.get('og:image') or metadata.get('twitter:image') or metadata.get('twitter:image:src')
+        if not image:
+            for img in doc.iter('img'):
+                if img.get('src'):
+                    image = img.get('src')
+                    break
+        page.top_image = urljoin(page.url, image) if image else ""
+
+    def _parse_published(self, metadata: Dict[str, str], doc) -> Optional[datetime]:
+        candidates = [metadata[key] for key in PUBLISHED_META_KEYS if metadata.get(key)]
+        candidates += [t.get('datetime') for t in doc.iter('time') if t.get('datetime')][:1]
+        for value in candidates:
+            try:
+                published = date_parser.parse(value)
+                # Le pipeline travaille en heure locale naïve
+                if published.tzinfo is not None:
+                    published = published.astimezone().replace(tzinfo=None)
+                return published
+            except (ValueError, OverflowError):
+                continue
+        return None
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Magasin local des articles pour FLB News (SQLite)
+Un article déjà extrait lors d'une exécution précédente n'est ni re-téléchargé ni re-parsé
+"""
+
+import os
+import time
+import zlib
+import sqlite3
+import logging
+import threading
+from typing import Dict, List, Optional
+from datetime import datetime
+
+from src.url_canonicalizer import url_key
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    url_key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    canonical_url TEXT NOT NULL DEFAULT '',
+    source TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL DEFAULT '',
+    summary TEXT NOT NULL DEFAULT '',
+    published TEXT,
+    image_url TEXT NOT NULL DEFAULT '',
+    content_hash TEXT NOT NULL DEFAULT '',
+    full_text BLOB,
+    relevance_score REAL NOT NULL DEFAULT 0,
+    first_seen REAL NOT NULL,
+    extracted_at REAL NOT NULL
+)
+"""
+
+def _record(row: sqlite3.Row) -> Dict:
+    record = dict(row)
+    record['full_text'] = zlib.decompress(row['full_text']).decode('utf-8') if row['full_text'] else ''
+    return record
+
+class ArticleStore:
+    """Articles extraits, indexés par URL canonique; texte complet compressé (zlib)"""
+
+    def __init__(self, path: str = None, ttl_days: float = 14, retention_days: float = 90):
+        self.path = path or os.path.join(os.path.dirname(__file__), '..', '.article_store', 'articles.sqlite3')
+        self.ttl = ttl_days * 86400  # Au-delà, l'article est ré-extrait (page mise à jour, image ajoutée)
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(SCHEMA)
+            self._conn.execute("DELETE FROM articles WHERE extracted_at < ?", (time.time() - retention_days * 86400,))
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_config(cls, extraction_config: Dict = None, path: str = None) -> 'ArticleStore':
+        extraction_config = extraction_config or {}
+        return cls(
+            path=extraction_config.get('article_store_path') or path,
+            ttl_days=extraction_config.get('article_store_ttl_days', 14),
+            retention_days=extraction_config.get('article_store_retention_days', 90)
+        )
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Article frais (extrait depuis moins de ttl_days), None sinon"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM articles WHERE url_key = ?", (url_key(url),)).fetchone()
+            fresh = row is not None and time.time() - row['extracted_at'] < self.ttl
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return _record(row) if fresh else None
+
+    def known(self, url: str) -> bool:
+        """Article déjà enregistré, frais ou non (l'ingestion continue ne le ré-extrait pas)"""
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM articles WHERE url_key = ?", (url_key(url),)).fetchone() is not None
+
+    def recent(self, since: datetime) -> List[Dict]:
+        """Articles publiés (ou vus pour la première fois, sans date) depuis 'since', du plus récent au plus ancien"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM articles WHERE COALESCE(published, '') >= ? OR (published IS NULL AND first_seen >= ?) "
+                "ORDER BY published DESC, first_seen DESC",
+                (since.isoformat(), since.timestamp())
+            ).fetchall()
+        return [_record(row) for row in rows]
+
+    def put(self, item):
+        """Enregistrer un NewsItem après extraction (la première date de vue est conservée)"""
+        now = time.time()
+        full_text = zlib.compress(item.full_text.encode('utf-8'), 6) if item.full_text else None
+        published = item.published_date.isoformat() if item.published_date else None
+        with self._lock, self._conn:
+            self._conn.execute("""
+                INSERT INTO articles (url_key, url, canonical_url, source, title, summary, published, image_url,
+                                      content_hash, full_text, relevance_score, first_seen, extracted_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url_key) DO UPDATE SET
+                    url = excluded.url, canonical_url = excluded.canonical_url, source = excluded.source,
+                    title = excluded.title, summary = excluded.summary, published = excluded.published,
+                    image_url = excluded.image_url, content_hash = excluded.content_hash, full_text = excluded.full_text,
+                    relevance_score = excluded.relevance_score, extracted_at = excluded.extracted_at
+            """, (url_key(item.url), item.url, item.canonical_url, item.source, item.title, item.summary, published,
+                  item.image_url, item.content_hash, full_text, item.relevance_score, now, now))
+
+    def log_summary(self):
+        total = self.hits + self.misses
+        if total:
+            logger.info(f"🗄️ Magasin d'articles: {self.hits}/{total} articles réutilisés sans téléchargement")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Scoring de pertinence par lot pour FLB News
+Un lot d'articles devient, en une passe de recherche multi-motifs, des matrices creuses
+(article x mot-clé, article x phrase); poids, bonus de titre, amortissement logarithmique des
+occurrences, proximité, contexte négatif, bonus géographique et fraîcheur sont ensuite calculés
+en opérations NumPy sur tout le lot. Même formule que FoodIndustryNewsScraper._score_content
+"""
+
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.keyword_matcher import KeywordMatcher
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+FRESHNESS_BONUS = {0: 1.5, 1: 1.3, 2: 1.2, 3: 1.1, 4: 1.0}  # Multiplicateur selon l'âge en jours (0.8 au-delà)
+GEO_WEIGHTS = {'quebec': 8, 'canada': 3}  # Points par mention, par groupe de termes géographiques
+
+class TermMatrix:
+    """Matrice creuse au format coordonnées: une entrée par couple (article, mot-clé) présent"""
+
+    def __init__(self, n_docs: int, n_keywords: int, docs, keywords, counts, title_hits):
+        self.shape = (n_docs, n_keywords)
+        self.docs = docs  # Ligne (article) de chaque entrée
+        self.keywords = keywords  # Colonne (mot-clé) de chaque entrée
+        self.counts = counts  # Occurrences sans chevauchement
+        self.title_hits = title_hits  # Mot-clé contenu dans un mot du titre
+
+class BatchScorer:
+    """Scores unifiés d'un lot d'articles, vectorisés sur le lot"""
+
+    def __init__(self, matcher: KeywordMatcher, keyword_weights: Dict[str, float]):
+        self.matcher = matcher
+        self.keyword_names = list(keyword_weights)
+        self.patterns = [keyword.lower() for keyword in self.keyword_names]
+        self.weights = np.array([keyword_weights[keyword] for keyword in self.keyword_names], dtype=float)
+        proximity = set(matcher.groups['proximity'])
+        self.is_proximity = np.array([pattern in proximity for pattern in self.patterns], dtype=bool)
+        self.single_word = [len(pattern.split()) == 1 for pattern in self.patterns]
+        self.columns: Dict[str, List[int]] = {}
+        for keyword, pattern in enumerate(self.patterns):
+            self.columns.setdefault(pattern, []).append(keyword)
+
+    def score(self, texts: Sequence[str], title_lengths: Sequence[int], multipliers: Sequence[float],
+              days_old: Sequence[Optional[int]]) -> Tuple['np.ndarray', List[List[str]]]:
+        """Scores du lot et mots-clés pertinents de chaque article (textes déjà en minuscules, titre en tête)"""
+        n_docs = len(texts)
+        # Passe unique sur chaque texte: entrées creuses (article, mot-clé), (entrée, phrase), (article, phrase)
+        pair_docs, pair_keywords, pair_counts, pair_titles = [], [], [], []
+        sentence_pairs, sentence_docs, sentence_ids, sentence_leading = [], [], [], []
+        proximity_docs, proximity_ids, negative_docs, negative_ids = [], [], [], []
+        geo = np.zeros(n_docs)
+        stride = 1
+        for doc, (text, title_end) in enumerate(zip(texts, title_lengths)):
+            if not text.strip():
+                continue
+            matches = self.matcher.scan(text)
+            stride = max(stride, len(matches.breaks) + 1)
+            for pattern in matches.hits:
+                for keyword in self.columns.get(pattern, ()):
+                    pair = len(pair_docs)
+                    pair_docs.append(doc)
+                    pair_keywords.append(keyword)
+                    pair_counts.append(matches.count(pattern))
+                    pair_titles.append(self.single_word[keyword] and matches.starts(pattern)[0] + len(pattern) <= title_end)
+                    for sentence in matches.sentences(pattern):
+                        sentence_pairs.append(pair)
+                        sentence_docs.append(doc)
+                        sentence_ids.append(sentence)
+                        sentence_leading.append(matches.in_leading_words(pattern, sentence, 5))
+            for pattern in matches.groups['proximity']:
+                for sentence in matches.sentences(pattern):
+                    proximity_docs.append(doc)
+                    proximity_ids.append(sentence)
+            for sentence in matches.sentences_of('negative'):
+                negative_docs.append(doc)
+                negative_ids.append(sentence)
+            for group, points in GEO_WEIGHTS.items():
+                geo[doc] += points * sum(matches.count(term) for term in matches.groups[group])
+
+        matrix = TermMatrix(n_docs, len(self.patterns), np.array(pair_docs, dtype=np.int64), np.array(pair_keywords, dtype=np.int64),
+                            np.array(pair_counts, dtype=float), np.array(pair_titles, dtype=bool))
+        sentence_pairs = np.array(sentence_pairs, dtype=np.int64)
+        sentence_keys = np.array(sentence_docs, dtype=np.int64) * stride + np.array(sentence_ids, dtype=np.int64)
+
+        # Proximité: mots-clés proches distincts dans la phrase, le mot-clé lui-même exclu
+        proximity_keys, proximity_counts = np.unique(np.array(proximity_docs, dtype=np.int64) * stride
+                                                     + np.array(proximity_ids, dtype=np.int64), return_counts=True)
+        neighbours = np.zeros(len(sentence_keys))
+        if len(proximity_keys):
+            position = np.minimum(np.searchsorted(proximity_keys, sentence_keys), len(proximity_keys) - 1)
+            neighbours = np.where(proximity_keys[position] == sentence_keys, proximity_counts[position], 0)
+        neighbours = neighbours - self.is_proximity[matrix.keywords[sentence_pairs]]
+        sentence_factors = 1.2 ** neighbours * np.where(np.array(sentence_leading, dtype=bool), 1.1, 1.0)
+
+        # Score contextuel de chaque couple (article, mot-clé)
+        weights = self.weights[matrix.keywords]
+        contextual = weights * 1.5 * matrix.title_hits + weights * np.bincount(sentence_pairs, weights=sentence_factors,
+                                                                              minlength=len(matrix.docs))
+        contextual *= np.where(matrix.counts > 1, 1 + np.log(np.maximum(matrix.counts, 1)) * 0.3, 1.0)
+        relevant = contextual > 0
+        scores = np.bincount(matrix.docs, weights=np.where(relevant, contextual, 0.0), minlength=n_docs)
+
+        # Contexte négatif: phrases avec un mot-clé pertinent et un indicateur négatif, 10% chacune (50% max)
+        negative_keys = np.unique(np.array(negative_docs, dtype=np.int64) * stride + np.array(negative_ids, dtype=np.int64))
+        flagged = np.intersect1d(np.unique(sentence_keys[relevant[sentence_pairs]]), negative_keys)
+        penalty = np.minimum(0.1 * np.bincount(flagged // stride, minlength=n_docs), 0.5)
+
+        freshness = np.array([1.0 if days is None else FRESHNESS_BONUS.get(days, 0.8) for days in days_old])
+        scores = (scores * (1 - penalty) * np.asarray(multipliers, dtype=float) + geo) * freshness
+
+        # Mots-clés pertinents de chaque article, dans l'ordre du profil
+        keywords: List[List[str]] = [[] for _ in range(n_docs)]
+        order = np.lexsort((matrix.keywords, matrix.docs))
+        order = order[relevant[order]]
+        for doc, keyword in zip(matrix.docs[order].tolist(), matrix.keywords[order].tolist()):
+            keywords[doc].append(self.keyword_names[keyword])
+        return scores, keywords
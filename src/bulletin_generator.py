@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import List
 import os
 import locale
-from scraper import NewsItem
+from src.scraper import NewsItem
 
 try:
     locale.setlocale(locale.LC_TIME, 'fr_CA.UTF-8')
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Statistiques de corpus BM25 persistantes pour FLB News (SQLite)
+Fréquences documentaires et longueur moyenne calculées sur tous les articles vus pendant une fenêtre
+glissante, mises à jour à chaque ajout: les IDF ne dépendent plus des quelques articles d'une exécution
+et un article se note sans reconstruire d'index
+"""
+
+import os
+import math
+import time
+import hashlib
+import sqlite3
+import logging
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    doc_key TEXT PRIMARY KEY,
+    length INTEGER NOT NULL,
+    added_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    doc_key TEXT NOT NULL,
+    term TEXT NOT NULL,
+    PRIMARY KEY (doc_key, term)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS terms (
+    term TEXT PRIMARY KEY,
+    df INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS documents_added_at ON documents (added_at);
+"""
+
+EXPIRE_EVERY = 3600  # Purge de la fenêtre glissante au plus une fois par heure (ingestion continue)
+
+def document_key(document: str) -> str:
+    """Empreinte du texte: un même article vu à plusieurs exécutions n'est compté qu'une fois"""
+    return hashlib.sha1(document.encode('utf-8', 'surrogatepass')).hexdigest()
+
+class CorpusStats:
+    """Fréquences documentaires (df), nombre de documents et longueur totale sur une fenêtre glissante"""
+
+    def __init__(self, path: str = None, window_days: float = 30, k1: float = 1.5, b: float = 0.75):
+        self.path = path or os.path.join(os.path.dirname(__file__), '..', '.corpus_stats', 'terms.sqlite3')
+        self.window = window_days * 86400
+        self.k1 = k1
+        self.b = b
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+        self._df_cache: Dict[str, int] = {}
+        self._expired_at = 0.0
+        self.expire()
+
+    @classmethod
+    def from_config(cls, analysis_config: Dict = None) -> 'CorpusStats':
+        analysis_config = analysis_config or {}
+        return cls(
+            path=analysis_config.get('bm25_corpus_path'),
+            window_days=analysis_config.get('bm25_window_days', 30)
+        )
+
+    def _load_totals(self):
+        self.doc_count, total_length = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(length), 0) FROM documents").fetchone()
+        self.total_length = total_length
+
+    @property
+    def avgdl(self) -> float:
+        return self.total_length / self.doc_count if self.doc_count else 0.0
+
+    def expire(self):
+        """Retirer de la fenêtre les documents trop anciens (leurs termes perdent une fréquence documentaire)"""
+        cutoff = time.time() - self.window
+        with self._lock, self._conn:
+            self._conn.execute("""
+                UPDATE terms SET df = df - (
+                    SELECT COUNT(*) FROM postings JOIN documents USING (doc_key)
+                    WHERE postings.term = terms.term AND documents.added_at < ?)
+                WHERE term IN (SELECT term FROM postings JOIN documents USING (doc_key) WHERE documents.added_at < ?)
+            """, (cutoff, cutoff))
+            self._conn.execute("DELETE FROM postings WHERE doc_key IN (SELECT doc_key FROM documents WHERE added_at < ?)", (cutoff,))
+            removed = self._conn.execute("DELETE FROM documents WHERE added_at < ?", (cutoff,)).rowcount
+            self._conn.execute("DELETE FROM terms WHERE df <= 0")
+            self._load_totals()
+            self._df_cache.clear()
+            self._expired_at = time.time()
+        if removed:
+            logger.info(f"📚 Corpus BM25: {removed} documents sortis de la fenêtre, {self.doc_count} restants")
+
+    def add_many(self, documents: Iterable[Tuple[str, List[str]]]) -> int:
+        """Ajouter des documents (texte, tokens); un document déjà connu reste dans la fenêtre sans être recompté"""
+        if time.time() - self._expired_at > EXPIRE_EVERY:
+            self.expire()
+        now = time.time()
+        added = 0
+        with self._lock, self._conn:
+            for document, tokens in documents:
+                key = document_key(document)
+                known = self._conn.execute("UPDATE documents SET added_at = ? WHERE doc_key = ?", (now, key)).rowcount
+                if known:
+                    continue
+                distinct = set(tokens)
+                self._conn.execute("INSERT INTO documents (doc_key, length, added_at) VALUES (?, ?, ?)", (key, len(tokens), now))
+                self._conn.executemany("INSERT INTO postings (doc_key, term) VALUES (?, ?)", ((key, term) for term in distinct))
+                self._conn.executemany("INSERT INTO terms (term, df) VALUES (?, 1) ON CONFLICT(term) DO UPDATE SET df = df + 1",
+                                       ((term,) for term in distinct))
+                for term in distinct & self._df_cache.keys():
+                    self._df_cache[term] += 1
+                self.doc_count += 1
+                self.total_length += len(tokens)
+                added += 1
+        return added
+
+    def document_frequency(self, term: str) -> int:
+        """df d'un terme, gardé en mémoire (les termes de la requête FLB sont toujours les mêmes)"""
+        df = self._df_cache.get(term)
+        if df is None:
+            with self._lock:
+                row = self._conn.execute("SELECT df FROM terms WHERE term = ?", (term,)).fetchone()
+                df = self._df_cache[term] = row[0] if row else 0
+        return df
+
+    def idf(self, term: str) -> float:
+        """IDF BM25 toujours positive (les termes très fréquents gardent un faible poids)"""
+        df = self.document_frequency(term)
+        return math.log(1 + (self.doc_count - df + 0.5) / (df + 0.5))
+
+    def score(self, tokens: List[str], query_tokens: List[str], frequencies: Optional[Counter] = None) -> float:
+        """Score BM25 d'un document contre les statistiques globales: une consultation par terme de la requête"""
+        if not self.doc_count or not tokens:
+            return 0.0
+        frequencies = frequencies if frequencies is not None else Counter(tokens)
+        length_norm = self.k1 * (1 - self.b + self.b * len(tokens) / self.avgdl)
+        score = 0.0
+        for term in query_tokens:
+            tf = frequencies.get(term, 0)
+            if tf:
+                score += self.idf(term) * tf * (self.k1 + 1) / (tf + length_norm)
+        return score
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Échéances d'exécution pour FLB News
+Une échéance par exécution et par phase, passée à chaque récupération et à chaque parsing;
+le budget d'exécution répartit le temps restant entre les phases
+"""
+
+import math
+import time
+from typing import Dict, Optional
+
+class DeadlineExceeded(TimeoutError):
+    """Échéance dépassée: le travail en cours doit être abandonné"""
+
+class Deadline:
+    """Instant limite absolu; les échéances enfants ne dépassent jamais leur parent"""
+
+    def __init__(self, seconds: Optional[float] = None, parent: Optional['Deadline'] = None, name: str = "run"):
+        self.name = name
+        self.started_at = time.monotonic()
+        expires_at = self.started_at + seconds if seconds is not None else math.inf
+        if parent is not None:
+            expires_at = min(expires_at, parent.expires_at)
+        self.expires_at = expires_at
+
+    @classmethod
+    def never(cls) -> 'Deadline':
+        return cls(None, name="illimité")
+
+    def child(self, seconds: Optional[float], name: str) -> 'Deadline':
+        return Deadline(seconds, parent=self, name=name)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def check(self):
+        """Lever DeadlineExceeded si l'échéance est passée (à appeler entre deux unités de travail)"""
+        if self.expired:
+            raise DeadlineExceeded(f"échéance '{self.name}' dépassée")
+
+    def timeout(self, default: Optional[float] = None) -> float:
+        """Timeout d'une opération: le plus court entre le défaut et le temps restant"""
+        self.check()
+        remaining = self.remaining()
+        return min(default, remaining) if default else remaining
+
+    def __repr__(self):
+        return f"Deadline({self.name}, reste {self.remaining():.1f}s)"
+
+# Part du budget restant accordée à chaque phase, dans l'ordre d'exécution
+DEFAULT_PHASE_SHARES = {'sources': 0.3, 'extraction': 0.45, 'analysis': 0.15, 'translation': 0.1}
+
+class RunBudget:
+    """Budget d'une exécution réparti entre les phases: chaque phase reçoit sa part du temps restant,
+    le temps non consommé par une phase revient donc aux suivantes"""
+
+    def __init__(self, deadline: Deadline, shares: Dict[str, float] = None, caps: Dict[str, float] = None):
+        self.deadline = deadline
+        self.shares = dict(shares or DEFAULT_PHASE_SHARES)
+        self.caps = caps or {}  # Plafond absolu par phase (secondes), même avec un budget large
+        self._started = set()
+
+    @classmethod
+    def from_config(cls, http_config: Dict = None, deadline: Optional[Deadline] = None) -> 'RunBudget':
+        http_config = http_config or {}
+        deadline = deadline or Deadline(http_config.get('run_timeout'), name='run')
+        caps = {
+            'sources': http_config.get('sources_phase_timeout', 60),
+            'extraction': http_config.get('extraction_phase_timeout', 120)
+        }
+        return cls(deadline, http_config.get('phase_shares'), caps)
+
+    def phase(self, *names: str) -> Deadline:
+        """Échéance d'une phase (ou de plusieurs phases menées de front)"""
+        pending = [name for name in self.shares if name not in self._started or name in names]
+        weight = sum(self.shares.get(name, 0) for name in names)
+        total = sum(self.shares[name] for name in pending)
+        self._started.update(names)
+        remaining = self.deadline.remaining()
+        seconds = remaining * weight / total if total and math.isfinite(remaining) else None
+        caps = [self.caps[name] for name in names if name in self.caps]
+        if caps and len(caps) == len(names):
+            seconds = min(sum(caps), seconds) if seconds is not None else sum(caps)
+        return self.deadline.child(seconds, '+'.join(names))
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Cache des flux RSS avec validateurs HTTP (ETag / Last-Modified)
+Un flux inchangé (304) réutilise les entrées déjà parsées
+"""
+
+import os
+import json
+import hashlib
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class FeedCache:
+    """Cache persistant par flux: validateurs HTTP + dernières entrées normalisées"""
+
+    def __init__(self, cache_dir: str = None):
+        self.cache_dir = cache_dir or os.path.join(os.path.dirname(__file__), '..', '.feed_cache')
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _cache_file(self, url: str) -> str:
+        key = hashlib.md5(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def load(self, url: str) -> Optional[Dict]:
+        """Charger l'état caché d'un flux (None si absent ou illisible)"""
+        cache_file = self._cache_file(url)
+        if not os.path.exists(cache_file):
+            return None
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Cache flux illisible pour {url}: {e}")
+            return None
+
+    @staticmethod
+    def covers(cached: Optional[Dict], cutoff: Optional[datetime] = None) -> bool:
+        """Les entrées cachées couvrent-elles la fenêtre demandée? (lecture arrêtée à une date limite plus récente: non)"""
+        stopped_at = cached.get('cutoff') if cached else None
+        if not stopped_at:
+            return True
+        if cutoff is None:
+            return False
+        try:
+            return cutoff >= datetime.fromisoformat(stopped_at)
+        except (TypeError, ValueError):
+            return False
+
+    def conditional_headers(self, cached: Optional[Dict], cutoff: Optional[datetime] = None) -> Dict[str, str]:
+        """En-têtes If-None-Match / If-Modified-Since à partir de l'état caché (aucun si la fenêtre est plus large)"""
+        headers = {}
+        if cached and self.covers(cached, cutoff):
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+
+    def store(self, url: str, response_headers: Dict[str, str], entries: List[Dict], cutoff: Optional[datetime] = None):
+        """Enregistrer les validateurs de la réponse et les entrées parsées (cutoff: date limite de l'arrêt anticipé)"""
+        headers = {k.lower(): v for k, v in response_headers.items()}
+        data = {
+            'url': url,
+            'etag': headers.get('etag', ''),
+            'last_modified': headers.get('last-modified', ''),
+            'fetched_at': time.time(),
+            'cutoff': cutoff.isoformat() if cutoff else None,
+            'entries': entries
+        }
+        cache_file = self._cache_file(url)
+        tmp_file = f"{cache_file}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            logger.warning(f"Impossible de sauvegarder le cache du flux {url}: {e}")
+
+    def record(self, not_modified: bool):
+        """Compter les réponses 304 (hits) et les flux re-parsés (misses)"""
+        with self._lock:
+            if not_modified:
+                self.hits += 1
+            else:
+                self.misses += 1
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Parseur RSS/Atom rapide pour FLB News (lxml iterparse)
+Ne lit que les champs utilisés et s'arrête dès que le quota d'entrées est atteint
+ou que le flux passe sous la date limite; None si le flux doit passer par feedparser
+"""
+
+import io
+import logging
+from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import lxml.html
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+ENTRY_TAGS = ('item', 'entry')
+FEED_ROOTS = ('rss', 'feed', 'RDF', 'channel')
+SUMMARY_TAGS = ('description', 'summary')
+CONTENT_TAGS = ('encoded', 'content')  # content:encoded (RSS) et <content> (Atom)
+DATE_TAGS = ('pubDate', 'published', 'issued', 'date', 'updated', 'modified')  # Par ordre de préférence
+STALE_RUN = 3  # Entrées consécutives plus vieilles que la limite avant d'arrêter la lecture
+
+def _local(tag) -> str:
+    return etree.QName(tag).localname if isinstance(tag, str) else ''
+
+def _text(element) -> str:
+    return ' '.join(''.join(element.itertext()).split())
+
+def html_to_text(fragment: str) -> str:
+    """Résumé HTML (souvent en CDATA) réduit au texte brut"""
+    if '<' not in fragment:
+        return ' '.join(fragment.split())
+    try:
+        return ' '.join(lxml.html.fromstring(f"<div>{fragment}</div>").text_content().split())
+    except (etree.ParserError, ValueError):
+        return ' '.join(fragment.split())
+
+def parse_date(value: str) -> Optional[datetime]:
+    """RFC 822 (RSS) ou ISO 8601 (Atom, dc:date), ramenée en UTC naïf comme feedparser"""
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def _read_entry(entry) -> Dict:
+    fields = {'title': '', 'link': '', 'summary': '', 'content': '', 'dates': {}, 'image_url': ''}
+    guid = ''
+    media_url = ''
+    thumbnail_url = ''
+    for child in entry.iter():
+        name = _local(child.tag)
+        if child is entry or not name:
+            continue
+        if name == 'title' and not fields['title']:
+            fields['title'] = _text(child)
+        elif name == 'link':
+            rel = child.get('rel', 'alternate')
+            href = child.get('href')
+            if href is None and not fields['link']:
+                fields['link'] = (child.text or '').strip()
+            elif rel == 'alternate' and href and not fields['link']:
+                fields['link'] = href.strip()
+            elif rel == 'enclosure' and href and 'image' in child.get('type', '') and not fields['image_url']:
+                fields['image_url'] = href
+        elif name == 'guid' and child.get('isPermaLink', 'true') != 'false':
+            guid = (child.text or '').strip()
+        elif name in SUMMARY_TAGS and not fields['summary']:
+            fields['summary'] = ''.join(child.itertext())
+        elif name in DATE_TAGS and child.text:
+            fields['dates'].setdefault(name, child.text)
+        elif name == 'enclosure' and 'image' in child.get('type', '') and not fields['image_url']:
+            fields['image_url'] = child.get('url', '')
+        elif name == 'content' and child.get('url'):
+            media_url = media_url or child.get('url')  # media:content
+        elif name in CONTENT_TAGS and not fields['content']:
+            fields['content'] = ''.join(child.itertext())
+        elif name == 'thumbnail' and child.get('url') and not thumbnail_url:
+            thumbnail_url = child.get('url')
+    if not fields['link'] and guid.startswith('http'):
+        fields['link'] = guid
+    # Même priorité que la normalisation feedparser: enclosure, media:content, media:thumbnail
+    fields['image_url'] = fields['image_url'] or media_url or thumbnail_url
+    return fields
+
+SY_PERIODS = {'hourly': 3600, 'daily': 86400, 'weekly': 7 * 86400, 'monthly': 30 * 86400, 'yearly': 365 * 86400}
+
+def parse_feed_hints(content: bytes) -> Dict:
+    """Indications de fréquence du canal: ttl (minutes), skipHours/skipDays, sy:updatePeriod/updateFrequency"""
+    hints = {}
+    period, frequency = '', 1
+    try:
+        for _, element in etree.iterparse(io.BytesIO(content), events=('end',), resolve_entities=False, no_network=True):
+            name = _local(element.tag)
+            if name in ENTRY_TAGS:
+                break  # Les indications précèdent les entrées
+            text = (element.text or '').strip()
+            if name == 'ttl' and text.isdigit():
+                hints['ttl'] = int(text) * 60
+            elif name == 'hour' and text.isdigit():
+                hints.setdefault('skip_hours', []).append(int(text) % 24)
+            elif name == 'day' and text:
+                hints.setdefault('skip_days', []).append(text.lower())
+            elif name == 'updatePeriod':
+                period = text.lower()
+            elif name == 'updateFrequency' and text.isdigit():
+                frequency = max(1, int(text))
+    except etree.XMLSyntaxError:
+        pass
+    if period in SY_PERIODS:
+        hints['update_period'] = SY_PERIODS[period] // frequency
+    return hints
+
+def parse_feed(content: bytes, max_entries: int = 20, cutoff: Optional[datetime] = None) -> Optional[List[Dict]]:
+    """Entrées normalisées (title, link, summary, published, image_url) ou None si le flux est mal formé"""
+    entries = []
+    stale = 0
+    root_checked = False
+    parser = etree.iterparse(io.BytesIO(content), events=('start', 'end'), resolve_entities=False,
+                             no_network=True, huge_tree=False, remove_comments=True)
+    try:
+        for event, element in parser:
+            name = _local(element.tag)
+            if event == 'start':
+                if not root_checked:
+                    if name not in FEED_ROOTS:
+                        return None
+                    root_checked = True
+                continue
+            if name not in ENTRY_TAGS:
+                continue
+            fields = _read_entry(element)
+            # Libérer l'entrée et ses sœurs déjà lues: mémoire bornée sur les gros flux
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+            if not fields['title'] or not fields['link']:
+                continue
+            published = next((parse_date(fields['dates'][tag]) for tag in DATE_TAGS if tag in fields['dates']), None)
+            entries.append({
+                'title': fields['title'],
+                'link': fields['link'],
+                'summary': html_to_text(fields['summary'] or fields['content'])[:1800],
+                'published': published.isoformat() if published else None,
+                'image_url': fields['image_url']
+            })
+            if len(entries) >= max_entries:
+                break
+            # Flux triés du plus récent au plus ancien: quelques entrées périmées d'affilée suffisent
+            if cutoff is not None and published is not None and published < cutoff:
+                stale += 1
+                if stale >= STALE_RUN:
+                    break
+            else:
+                stale = 0
+    except etree.XMLSyntaxError as e:
+        logger.debug(f"Flux mal formé, repli sur feedparser: {e}")
+        return None
+    return entries if root_checked else None
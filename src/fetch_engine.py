@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Moteur de récupération asynchrone pour FLB News
+Une seule boucle asyncio pour tous les flux RSS et pages d'articles
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    logging.warning("aiohttp not installed. Async fetch engine will be disabled.")
+
+from src.deadline import Deadline
+from src.http_client import FetchResult, HttpClient, head_end, skipped_content_type, timeout_error, DEFAULT_MAX_BYTES, DEFAULT_SKIP_CONTENT_TYPES
+
+logger = logging.getLogger(__name__)
+
+class AsyncFetchEngine:
+    """Récupération concurrente sur une seule boucle d'événements avec timeouts par requête"""
+
+    def __init__(self, max_concurrency: int = 200, limit_per_host: int = 8, default_timeout: float = 10.0, headers: Dict[str, str] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES, skip_content_types: List[str] = None, sync_client: Optional[HttpClient] = None):
+        self.max_concurrency = max_concurrency
+        self.limit_per_host = limit_per_host
+        self.default_timeout = default_timeout
+        self.headers = headers or {}
+        self.max_bytes = max_bytes
+        self.skip_content_types = skip_content_types if skip_content_types is not None else DEFAULT_SKIP_CONTENT_TYPES
+        self.session = None
+        # Enregistrement/rejeu HTTP: requêtes déléguées au client synchrone, seul point d'interception
+        self.sync_client = sync_client
+
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp est requis pour le moteur asynchrone (pip install aiohttp)")
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrency,
+            limit_per_host=self.limit_per_host,
+            ttl_dns_cache=300
+        )
+        self.session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def fetch(self, url: str, timeout: Optional[float] = None, headers: Dict[str, str] = None, max_bytes: Optional[int] = None,
+                    deadline: Optional[Deadline] = None) -> FetchResult:
+        """Récupérer une URL en flux avec plafond d'octets; le timeout couvre connexion + lecture du corps"""
+        if self.sync_client is not None:
+            return await asyncio.to_thread(self.sync_client.fetch, url, max_bytes or self.max_bytes, timeout or self.default_timeout, headers, deadline)
+        start_time = time.time()
+        max_bytes = max_bytes or self.max_bytes
+        requested = timeout = timeout or self.default_timeout
+        if deadline is not None:
+            if deadline.expired:
+                return FetchResult(url=url, error="deadline")
+            timeout = deadline.timeout(requested)
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        try:
+            async with self.session.get(url, timeout=client_timeout, headers=headers, allow_redirects=True) as response:
+                result = FetchResult(
+                    url=url,
+                    status=response.status,
+                    headers={k: v for k, v in response.headers.items()},
+                    final_url=str(response.url)
+                )
+                if response.status >= 400:
+                    result.error = f"HTTP {response.status}"
+                elif skipped_content_type(result.header('Content-Type'), self.skip_content_types):
+                    result.error = f"type de contenu ignoré: {result.header('Content-Type')}"
+                else:
+                    buffer = bytearray()
+                    async for chunk in response.content.iter_chunked(65536):
+                        buffer.extend(chunk)
+                        if len(buffer) >= max_bytes:
+                            # Arrêt anticipé: le reste du corps n'est jamais lu
+                            del buffer[max_bytes:]
+                            result.truncated = True
+                            break
+                    result.content = bytes(buffer)
+                result.elapsed = time.time() - start_time
+                return result
+        except asyncio.TimeoutError:
+            return FetchResult(url=url, elapsed=time.time() - start_time, error=timeout_error(timeout, requested))
+        except aiohttp.ClientError as e:
+            return FetchResult(url=url, elapsed=time.time() - start_time, error=str(e) or type(e).__name__)
+
+    async def fetch_head(self, url: str, max_bytes: int = 65536, timeout: Optional[float] = None, deadline: Optional[Deadline] = None) -> FetchResult:
+        """Lire en flux jusqu'à la fin du <head> (ou max_bytes) sans télécharger le corps"""
+        if self.sync_client is not None:
+            result = await self.fetch(url, timeout, max_bytes=max_bytes, deadline=deadline)
+            end = head_end(result.content)
+            if end >= 0:
+                result.content = result.content[:end]
+            return result
+        start_time = time.time()
+        requested = timeout = timeout or self.default_timeout
+        if deadline is not None:
+            if deadline.expired:
+                return FetchResult(url=url, error="deadline")
+            timeout = deadline.timeout(requested)
+        client_timeout = aiohttp.ClientTimeout(total=timeout)
+        try:
+            async with self.session.get(url, timeout=client_timeout, allow_redirects=True) as response:
+                buffer = bytearray()
+                async for chunk in response.content.iter_chunked(8192):
+                    search_from = max(0, len(buffer) - 8)
+                    buffer.extend(chunk)
+                    end = head_end(buffer, search_from)
+                    if end >= 0:
+                        del buffer[end:]  # Ne garder que le <head>
+                        break
+                    if len(buffer) >= max_bytes:
+                        break
+                return FetchResult(
+                    url=url,
+                    status=response.status,
+                    content=bytes(buffer[:max_bytes]),
+                    headers={k: v for k, v in response.headers.items()},
+                    final_url=str(response.url),
+                    elapsed=time.time() - start_time,
+                    error="" if response.status < 400 else f"HTTP {response.status}"
+                )
+        except asyncio.TimeoutError:
+            return FetchResult(url=url, elapsed=time.time() - start_time, error=timeout_error(timeout, requested))
+        except aiohttp.ClientError as e:
+            return FetchResult(url=url, elapsed=time.time() - start_time, error=str(e) or type(e).__name__)
+
+    async def fetch_many(self, urls: List[str], timeout: Optional[float] = None) -> List[FetchResult]:
+        """Récupérer plusieurs URLs en parallèle (ordre conservé)"""
+        return await asyncio.gather(*(self.fetch(url, timeout) for url in urls))
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Limiteur de concurrence adaptatif par hôte pour FLB News
+AIMD: +1 requête simultanée par fenêtre réussie, division sur 429/503, timeout ou lenteur
+"""
+
+import time
+import asyncio
+import logging
+import threading
+from typing import Dict, Optional
+from dataclasses import dataclass
+from contextlib import contextmanager, asynccontextmanager
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Statuts signalant que l'hôte nous ralentit
+THROTTLE_STATUSES = (429, 503)
+
+def host_of(url: str) -> str:
+    return (urlsplit(url).hostname or '').lower()
+
+@dataclass
+class HostState:
+    """Fenêtre de concurrence et mesures d'un hôte"""
+    limit: float
+    active: int = 0
+    latency: float = 0.0  # Moyenne mobile exponentielle (secondes)
+    successes: int = 0
+    throttled: int = 0
+    timeouts: int = 0
+    blocked_until: float = 0.0  # Retry-After reçu sur 429/503
+
+class HostSlot:
+    """Emplacement réservé; l'appelant y note le résultat de la requête"""
+
+    def __init__(self, host: str):
+        self.host = host
+        self.status = 0
+        self.error = ""
+        self.retry_after = 0.0
+        self.start = time.time()
+
+    def observe(self, status: int = 0, error: str = "", retry_after: str = ""):
+        self.status = status
+        self.error = error
+        try:
+            self.retry_after = float(retry_after) if retry_after else 0.0
+        except ValueError:
+            self.retry_after = 0.0  # Date HTTP: ignorée, le recul multiplicatif suffit
+
+class HostLimiter:
+    """Limites par domaine + plafond global, utilisable depuis des threads ou une boucle asyncio"""
+
+    def __init__(self, global_limit: int = 32, initial_per_host: int = 2, min_per_host: int = 1, max_per_host: int = 8,
+                 slow_latency: float = 4.0, decrease_factor: float = 0.5, max_retry_after: float = 30.0):
+        self.global_limit = global_limit
+        self.initial_per_host = initial_per_host
+        self.min_per_host = min_per_host
+        self.max_per_host = max_per_host
+        self.slow_latency = slow_latency  # Au-delà, la réponse compte comme un signal de surcharge
+        self.decrease_factor = decrease_factor
+        self.max_retry_after = max_retry_after
+
+        self.hosts: Dict[str, HostState] = {}
+        self.active_total = 0
+        self._lock = threading.Lock()
+        self._cond = threading.Condition(self._lock)
+        self._async_waiters = []  # (boucle, future) à réveiller sur libération
+
+    @classmethod
+    def from_config(cls, http_config: Dict = None) -> 'HostLimiter':
+        http_config = http_config or {}
+        return cls(
+            global_limit=http_config.get('max_workers', 32),
+            initial_per_host=http_config.get('initial_per_host', 2),
+            max_per_host=http_config.get('pool_size_per_host', 8),
+            slow_latency=http_config.get('slow_latency', 4.0)
+        )
+
+    def _state(self, host: str) -> HostState:
+        state = self.hosts.get(host)
+        if state is None:
+            state = self.hosts[host] = HostState(limit=float(self.initial_per_host))
+        return state
+
+    def _try_acquire(self, host: str) -> float:
+        """Réserver un emplacement; retourne 0 si obtenu, sinon le délai d'attente suggéré"""
+        state = self._state(host)
+        wait = state.blocked_until - time.time()
+        if wait > 0:
+            return wait
+        if self.active_total >= self.global_limit or state.active >= int(state.limit):
+            return 0.05
+        state.active += 1
+        self.active_total += 1
+        return 0
+
+    def acquire(self, host: str, timeout: Optional[float] = None):
+        """Attendre un emplacement; TimeoutError si rien ne se libère avant timeout"""
+        give_up_at = time.monotonic() + timeout if timeout is not None else None
+        with self._cond:
+            while True:
+                wait = self._try_acquire(host)
+                if not wait:
+                    return
+                if give_up_at is not None:
+                    left = give_up_at - time.monotonic()
+                    if left <= 0:
+                        raise TimeoutError(f"aucun emplacement libre pour {host}")
+                    wait = min(wait, left)
+                self._cond.wait(timeout=wait)
+
+    async def aacquire(self, host: str, timeout: Optional[float] = None):
+        loop = asyncio.get_running_loop()
+        give_up_at = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            with self._lock:
+                wait = self._try_acquire(host)
+                if not wait:
+                    return
+                if give_up_at is not None:
+                    left = give_up_at - time.monotonic()
+                    if left <= 0:
+                        raise TimeoutError(f"aucun emplacement libre pour {host}")
+                    wait = min(wait, left)
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await asyncio.wait_for(waiter, timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+
+    def release(self, slot: HostSlot):
+        with self._cond:
+            state = self._state(slot.host)
+            state.active -= 1
+            self.active_total -= 1
+            self._adjust(state, slot, time.time() - slot.start)
+            self._cond.notify_all()
+            waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(lambda w=waiter: w.done() or w.set_result(None))
+
+    def _adjust(self, state: HostState, slot: HostSlot, elapsed: float):
+        """AIMD: hausse additive (+1 par fenêtre complète), baisse multiplicative sur signal de surcharge"""
+        timed_out = slot.error == "timeout"
+        throttled = slot.status in THROTTLE_STATUSES
+        if timed_out or throttled or elapsed > self.slow_latency:
+            state.limit = max(self.min_per_host, state.limit * self.decrease_factor)
+            if throttled:
+                state.throttled += 1
+                if slot.retry_after:
+                    state.blocked_until = time.time() + min(slot.retry_after, self.max_retry_after)
+            if timed_out:
+                state.timeouts += 1
+            logger.debug(f"⬇️ {slot.host}: limite {state.limit:.1f} (statut {slot.status}, {elapsed:.1f}s, {slot.error or 'lent'})")
+        elif not slot.error or slot.status:
+            state.successes += 1
+            state.limit = min(self.max_per_host, state.limit + 1.0 / state.limit)
+        state.latency = elapsed if not state.latency else 0.8 * state.latency + 0.2 * elapsed
+
+    def _slot_exit(self, slot: HostSlot, failed: bool):
+        if failed and not slot.error:
+            slot.error = "exception"
+        self.release(slot)
+
+    @contextmanager
+    def slot(self, url: str, timeout: Optional[float] = None):
+        """with limiter.slot(url) as slot: ...; slot.observe(status, error)"""
+        host = host_of(url)
+        self.acquire(host, timeout)
+        slot = HostSlot(host)
+        failed = True
+        try:
+            yield slot
+            failed = False
+        finally:
+            self._slot_exit(slot, failed)
+
+    @asynccontextmanager
+    async def aslot(self, url: str, timeout: Optional[float] = None):
+        """async with limiter.aslot(url) as slot: ...; slot.observe(status, error)"""
+        host = host_of(url)
+        await self.aacquire(host, timeout)
+        slot = HostSlot(host)
+        failed = True
+        try:
+            yield slot
+            failed = False
+        finally:
+            self._slot_exit(slot, failed)
+
+    def limit_for(self, host: str) -> Optional[float]:
+        state = self.hosts.get(host)
+        return state.limit if state else None
+
+    def log_summary(self):
+        """Résumé des hôtes ralentis en fin de phase"""
+        with self._lock:
+            throttled = {host: s for host, s in self.hosts.items() if s.throttled or s.timeouts}
+            total_limit = sum(min(int(s.limit), self.max_per_host) for s in self.hosts.values())
+        logger.info(f"🚦 Concurrence adaptative: {len(self.hosts)} hôtes, capacité {min(total_limit, self.global_limit)}/{self.global_limit}")
+        for host, state in throttled.items():
+            logger.info(f"   {host}: limite {state.limit:.1f}, {state.throttled} refus 429/503, {state.timeouts} timeouts, latence {state.latency:.1f}s")
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Client HTTP mutualisé pour FLB News
+Une seule session avec pool de connexions keep-alive pour toutes les requêtes sortantes
+"""
+
+import json
+import time
+import logging
+import threading
+import importlib.util
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import HTTPError as Urllib3HTTPError, ReadTimeoutError
+
+from src.deadline import Deadline
+
+# brotli n'est jamais appelé directement: sa seule présence active le décodage 'br' dans urllib3/aiohttp
+BROTLI_AVAILABLE = importlib.util.find_spec('brotli') is not None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = "Mozilla/5.0 (compatible; FLBNewsBot/1.0; +https://www.flb.ca)"
+
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024  # Plafond par réponse (octets décompressés)
+
+# Réponses jamais téléchargées (liens PDF, médias, archives)
+DEFAULT_SKIP_CONTENT_TYPES = ['application/pdf', 'image/', 'video/', 'audio/', 'application/zip', 'application/octet-stream']
+
+HEAD_END_MARKERS = (b'</head', b'<body')
+
+@dataclass
+class FetchResult:
+    """Résultat d'une requête HTTP (client synchrone et moteur asyncio)"""
+    url: str
+    status: int = 0
+    content: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+    final_url: str = ""
+    elapsed: float = 0.0
+    error: str = ""
+    truncated: bool = False  # Corps coupé au plafond d'octets
+
+    @property
+    def ok(self) -> bool:
+        return not self.error and 200 <= self.status < 300
+
+    def header(self, name: str, default: str = "") -> str:
+        """Lecture d'en-tête insensible à la casse"""
+        name = name.lower()
+        for key, value in self.headers.items():
+            if key.lower() == name:
+                return value
+        return default
+
+def skipped_content_type(content_type: str, skip_content_types: List[str]) -> bool:
+    content_type = (content_type or '').lower()
+    return any(content_type.startswith(prefix) for prefix in skip_content_types)
+
+def head_end(buffer: bytes, start: int = 0) -> int:
+    """Position de la fin du <head> dans le tampon (-1 si pas encore atteinte)"""
+    window = bytes(buffer[start:]).lower()
+    positions = [window.find(marker) for marker in HEAD_END_MARKERS]
+    positions = [p for p in positions if p >= 0]
+    return start + min(positions) if positions else -1
+
+def timeout_error(timeout: float, requested: float) -> str:
+    """Erreur d'un timeout: 'deadline' si l'échéance de la phase l'a raccourci (abandon, pas un échec de la source)"""
+    return "deadline" if timeout < requested else "timeout"
+
+def iter_body(response: requests.Response, chunk_size: int):
+    """Morceaux du corps dès leur arrivée (read1): l'échéance est vérifiable entre deux lectures"""
+    raw = response.raw
+    if not hasattr(raw, 'read1'):  # urllib3 < 2
+        yield from response.iter_content(chunk_size=chunk_size)
+        return
+    while True:
+        chunk = raw.read1(chunk_size, decode_content=True)
+        if not chunk:
+            break
+        yield chunk
+
+def default_headers(http_config: Dict = None) -> Dict[str, str]:
+    """En-têtes communs au client synchrone et au moteur asyncio"""
+    http_config = http_config or {}
+    return {
+        'User-Agent': http_config.get('user_agent', DEFAULT_USER_AGENT),
+        'Accept': 'text/html,application/xhtml+xml,application/rss+xml,application/atom+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Encoding': 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate',
+        'Accept-Language': 'fr-CA,fr;q=0.9,en;q=0.8',
+        'Connection': 'keep-alive'
+    }
+
+class HttpClient:
+    """Session requests partagée avec pool de connexions par hôte"""
+
+    def __init__(self, http_config: Dict = None):
+        self.config = http_config or {}
+        self.default_timeout = self.config.get('article_timeout', 10)
+        self.max_bytes = self.config.get('max_page_bytes', DEFAULT_MAX_BYTES)
+        self.skip_content_types = self.config.get('skip_content_types', DEFAULT_SKIP_CONTENT_TYPES)
+
+        retries = Retry(
+            total=self.config.get('max_retries', 1),
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,  # Retourner la dernière réponse (statut visible par le limiteur et le disjoncteur)
+            allowed_methods=frozenset(['GET', 'HEAD'])
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.config.get('max_hosts', 50),  # Nombre d'hôtes gardés en pool
+            pool_maxsize=self.config.get('pool_size_per_host', 8),  # Connexions keep-alive par hôte
+            max_retries=retries
+        )
+
+        self.session = requests.Session()
+        self.session.headers.update(default_headers(self.config))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def fetch(self, url: str, max_bytes: Optional[int] = None, timeout: Optional[float] = None, headers: Dict[str, str] = None,
+              deadline: Optional[Deadline] = None) -> FetchResult:
+        """GET en flux avec plafond d'octets (mémoire bornée); les erreurs sont dans FetchResult.error"""
+        start_time = time.time()
+        max_bytes = max_bytes or self.max_bytes
+        requested = timeout = timeout or self.default_timeout
+        if deadline is not None:
+            if deadline.expired:
+                return FetchResult(url=url, error="deadline")
+            timeout = deadline.timeout(requested)
+        try:
+            with self.session.get(url, timeout=timeout, headers=headers, stream=True) as response:
+                result = FetchResult(
+                    url=url,
+                    status=response.status_code,
+                    headers=dict(response.headers),
+                    final_url=response.url
+                )
+                if response.status_code >= 400:
+                    result.error = f"HTTP {response.status_code}"
+                elif skipped_content_type(result.header('Content-Type'), self.skip_content_types):
+                    result.error = f"type de contenu ignoré: {result.header('Content-Type')}"
+                else:
+                    buffer = bytearray()
+                    for chunk in iter_body(response, 65536):
+                        if deadline is not None and deadline.expired:
+                            # Le timeout requests est par lecture: un flux au compte-gouttes est coupé ici
+                            result.error = "deadline"
+                            break
+                        buffer.extend(chunk)
+                        if len(buffer) >= max_bytes:
+                            # Arrêt anticipé: le reste du corps n'est jamais lu
+                            del buffer[max_bytes:]
+                            result.truncated = True
+                            break
+                    result.content = bytes(buffer)
+        except (requests.Timeout, ReadTimeoutError):
+            return FetchResult(url=url, elapsed=time.time() - start_time, error=timeout_error(timeout, requested))
+        except (requests.RequestException, Urllib3HTTPError) as e:
+            # Retries épuisés sur un timeout raccourci: requests lève ConnectionError, l'échéance reste la cause
+            error = "deadline" if deadline is not None and deadline.expired else str(e) or type(e).__name__
+            return FetchResult(url=url, elapsed=time.time() - start_time, error=error)
+        result.elapsed = time.time() - start_time
+        return result
+
+    def fetch_head(self, url: str, max_bytes: int = 65536, timeout: Optional[float] = None, deadline: Optional[Deadline] = None) -> Tuple[bytes, str]:
+        """Lire la réponse en flux jusqu'à </head> (ou <body>, ou max_bytes) puis fermer la connexion"""
+        timeout = timeout or self.default_timeout
+        if deadline is not None:
+            timeout = deadline.timeout(timeout)
+        with self.session.get(url, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            content_type = response.headers.get('Content-Type', '')
+            buffer = bytearray()
+            for chunk in iter_body(response, 8192):
+                if deadline is not None:
+                    deadline.check()
+                search_from = max(0, len(buffer) - 8)
+                buffer.extend(chunk)
+                end = head_end(buffer, search_from)
+                if end >= 0:
+                    del buffer[end:]  # Ne garder que le <head>
+                    break
+                if len(buffer) >= max_bytes:
+                    break
+            return bytes(buffer[:max_bytes]), content_type
+
+    def resolve_redirect(self, url: str, timeout: Optional[float] = None, deadline: Optional[Deadline] = None) -> str:
+        """URL finale après redirections (HEAD, GET sans lire le corps si HEAD est refusé)"""
+        timeout = timeout or self.default_timeout
+        if deadline is not None:
+            deadline.check()
+            timeout = deadline.timeout(timeout)
+        response = self.session.head(url, timeout=timeout, allow_redirects=True)
+        if response.status_code in (403, 405, 501):
+            with self.session.get(url, timeout=timeout, stream=True) as response:
+                return response.url
+        return response.url
+
+    def close(self):
+        self.session.close()
+
+_shared_clients: Dict[str, HttpClient] = {}
+_shared_lock = threading.Lock()
+
+def config_key(http_config: Dict = None) -> str:
+    """Empreinte figée d'une configuration réseau (ordre des clés indifférent)"""
+    return json.dumps(http_config or {}, sort_keys=True, default=repr)
+
+def get_http_client(http_config: Dict = None) -> HttpClient:
+    """Client partagé du processus pour cette configuration (un pool par configuration distincte)"""
+    key = config_key(http_config)
+    with _shared_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = _shared_clients[key] = HttpClient(http_config)
+            logger.info(f"Client HTTP partagé initialisé (pool {client.config.get('pool_size_per_host', 8)}/hôte, brotli={'oui' if BROTLI_AVAILABLE else 'non'})")
+        return client
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Enregistrement et rejeu des échanges HTTP pour FLB News
+Mode 'record': chaque requête sortante (flux, pages, DeepL, OpenRouter) est capturée dans une archive gzip;
+mode 'replay': l'archive sert les réponses sans réseau, avec la latence d'origine ou une latence fixe.
+Interception au niveau transport: HTTPAdapter.send (requests, donc HttpClient et deepl) et httpx.Client.send (openai)
+"""
+
+import io
+import os
+import json
+import gzip
+import time
+import base64
+import hashlib
+import logging
+import threading
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+RECORD = 'record'
+REPLAY = 'replay'
+ARCHIVE_FORMAT = 1
+DEFAULT_ARCHIVE = os.path.join(os.path.dirname(__file__), '..', '.http_archive', 'run.jsonl.gz')
+
+# Le corps est archivé décompressé: ces en-têtes ne le décrivent plus
+DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding'}
+
+def request_key(method: str, url: str, body=None) -> str:
+    """Clé d'un échange: méthode, URL et empreinte du corps (les POST DeepL/OpenRouter diffèrent par le texte)"""
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    digest = hashlib.sha1(body if isinstance(body, bytes) else b'').hexdigest()[:16]
+    return f"{method.upper()} {url} {digest}"
+
+class HttpRecorder:
+    """Archive gzip d'échanges HTTP (une ligne JSON par réponse); rejouée dans l'ordre d'enregistrement"""
+
+    def __init__(self, path: str = None, mode: str = REPLAY, latency: Optional[float] = None):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Mode d'archive HTTP inconnu: {mode}")
+        self.path = path or DEFAULT_ARCHIVE
+        self.mode = mode
+        self.latency = latency  # None: latence enregistrée; sinon délai fixe par réponse rejouée (0 = aucun)
+        self._lock = threading.Lock()
+        self.exchanges: Dict[str, List[Dict]] = {}
+        self._cursors: Dict[str, int] = {}
+        self.recorded = 0
+        self.replayed = 0
+        self.missing = 0
+        self.recorded_at = time.time()
+        self._file = None
+        if mode == REPLAY:
+            self._load()
+        else:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._file = gzip.open(self.path, 'wt', encoding='utf-8')
+            self._write({'format': ARCHIVE_FORMAT, 'recorded_at': self.recorded_at})
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"Archive HTTP introuvable: {self.path}")
+        try:
+            with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    entry = json.loads(line)
+                    if 'format' in entry:
+                        self.recorded_at = entry.get('recorded_at', self.recorded_at)
+                        continue
+                    self.exchanges.setdefault(entry['key'], []).append(entry)
+        except (EOFError, OSError, json.JSONDecodeError) as e:
+            # Enregistrement interrompu: les échanges complets restent utilisables
+            logger.warning(f"Archive HTTP tronquée ({self.path}): {e}")
+        logger.info(f"📼 Archive HTTP chargée: {sum(len(v) for v in self.exchanges.values())} échanges, "
+                    f"enregistrée il y a {self.age_days:.1f} jours")
+
+    @property
+    def age_days(self) -> float:
+        return max(0.0, (time.time() - self.recorded_at) / 86400)
+
+    def _write(self, entry: Dict):
+        self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._file.flush()
+
+    def record(self, method: str, url: str, body, status: int = 0, reason: str = '', headers: Dict[str, str] = None,
+               content: bytes = b'', elapsed: float = 0.0, error: str = '', message: str = ''):
+        """Archiver une réponse (ou une erreur de transport: 'timeout' / 'connection')"""
+        entry = {
+            'key': request_key(method, url, body),
+            'method': method.upper(),
+            'url': url,
+            'status': status,
+            'reason': reason,
+            'headers': {k: v for k, v in (headers or {}).items() if k.lower() not in DROPPED_HEADERS},
+            'body': base64.b64encode(content).decode('ascii'),
+            'elapsed': round(elapsed, 4),
+            'error': error,
+            'message': message
+        }
+        with self._lock:
+            self._write(entry)
+            self.recorded += 1
+
+    def lookup(self, method: str, url: str, body=None) -> Optional[Dict]:
+        """Réponse suivante pour cette requête (la dernière est resservie une fois la liste épuisée)"""
+        key = request_key(method, url, body)
+        with self._lock:
+            entries = self.exchanges.get(key)
+            if not entries:
+                self.missing += 1
+                return None
+            index = self._cursors.get(key, 0)
+            self._cursors[key] = index + 1
+            self.replayed += 1
+            return entries[min(index, len(entries) - 1)]
+
+    def delay(self, entry: Dict):
+        """Latence simulée, dans le thread appelant"""
+        seconds = entry['elapsed'] if self.latency is None else self.latency
+        if seconds > 0:
+            time.sleep(seconds)
+
+    @staticmethod
+    def content(entry: Dict) -> bytes:
+        return base64.b64decode(entry['body'])
+
+    def close(self):
+        if self._file is not None:
+            with self._lock:
+                self._file.close()
+                self._file = None
+            logger.info(f"📼 Archive HTTP: {self.recorded} échanges enregistrés dans {self.path}")
+        else:
+            logger.info(f"📼 Archive HTTP: {self.replayed} réponses rejouées, {self.missing} requêtes absentes de l'archive")
+
+_active: Optional[HttpRecorder] = None
+_original_adapter_send = HTTPAdapter.send
+_original_httpx_send = httpx.Client.send if HTTPX_AVAILABLE else None
+
+def active() -> Optional[HttpRecorder]:
+    """Enregistreur installé dans le processus (None hors enregistrement/rejeu)"""
+    return _active
+
+def install(path: str = None, mode: str = REPLAY, latency: Optional[float] = None) -> HttpRecorder:
+    """Intercepter tout le trafic HTTP du processus jusqu'à uninstall()"""
+    global _active
+    uninstall()
+    _active = HttpRecorder(path, mode, latency)
+    HTTPAdapter.send = _adapter_send
+    if HTTPX_AVAILABLE:
+        httpx.Client.send = _httpx_send
+    logger.info(f"📼 Trafic HTTP {'enregistré dans' if mode == RECORD else 'rejoué depuis'} {_active.path}")
+    return _active
+
+def uninstall():
+    global _active
+    if _active is None:
+        return
+    HTTPAdapter.send = _original_adapter_send
+    if HTTPX_AVAILABLE:
+        httpx.Client.send = _original_httpx_send
+    recorder, _active = _active, None
+    recorder.close()
+
+def _requests_response(adapter: HTTPAdapter, request, status: int, reason: str, headers: Dict[str, str], content: bytes) -> requests.Response:
+    """Réponse requests construite sur un corps en mémoire (lisible en flux comme une vraie réponse)"""
+    raw = HTTPResponse(body=io.BytesIO(content), headers=headers, status=status, reason=reason,
+                       preload_content=False, decode_content=False, request_method=request.method)
+    return adapter.build_response(request, raw)
+
+def _adapter_send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+    recorder = _active
+    if recorder is None:
+        return _original_adapter_send(self, request, stream=stream, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+
+    if recorder.mode == REPLAY:
+        entry = recorder.lookup(request.method, request.url, request.body)
+        if entry is None:
+            raise requests.ConnectionError(f"Absent de l'archive HTTP: {request.method} {request.url}", request=request)
+        recorder.delay(entry)
+        if entry['error'] == 'timeout':
+            raise requests.Timeout(entry['message'], request=request)
+        if entry['error']:
+            raise requests.ConnectionError(entry['message'], request=request)
+        return _requests_response(self, request, entry['status'], entry['reason'], entry['headers'], recorder.content(entry))
+
+    start_time = time.time()
+    try:
+        response = _original_adapter_send(self, request, stream=True, timeout=timeout, verify=verify, cert=cert, proxies=proxies)
+        try:
+            content = response.raw.read(decode_content=True)
+        finally:
+            response.close()
+    except requests.RequestException as e:
+        recorder.record(request.method, request.url, request.body, elapsed=time.time() - start_time,
+                        error='timeout' if isinstance(e, requests.Timeout) else 'connection', message=str(e))
+        raise
+    headers = {k: v for k, v in response.headers.items() if k.lower() not in DROPPED_HEADERS}
+    recorder.record(request.method, request.url, request.body, response.status_code, response.reason or '', headers,
+                    content, time.time() - start_time)
+    return _requests_response(self, request, response.status_code, response.reason or '', headers, content)
+
+def _httpx_send(self, request, **kwargs):
+    recorder = _active
+    if recorder is None:
+        return _original_httpx_send(self, request, **kwargs)
+    body = request.read()
+
+    if recorder.mode == REPLAY:
+        entry = recorder.lookup(request.method, str(request.url), body)
+        if entry is None:
+            raise httpx.ConnectError(f"Absent de l'archive HTTP: {request.method} {request.url}", request=request)
+        recorder.delay(entry)
+        if entry['error'] == 'timeout':
+            raise httpx.ReadTimeout(entry['message'], request=request)
+        if entry['error']:
+            raise httpx.ConnectError(entry['message'], request=request)
+        return httpx.Response(entry['status'], headers=entry['headers'], content=recorder.content(entry), request=request)
+
+    start_time = time.time()
+    try:
+        response = _original_httpx_send(self, request, **kwargs)
+        content = response.read()
+    except httpx.TransportError as e:
+        recorder.record(request.method, str(request.url), body, elapsed=time.time() - start_time,
+                        error='timeout' if isinstance(e, httpx.TimeoutException) else 'connection', message=str(e))
+        raise
+    recorder.record(request.method, str(request.url), body, response.status_code, response.reason_phrase,
+                    dict(response.headers), content, time.time() - start_time)
+    return response
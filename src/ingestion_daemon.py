@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Ingestion continue des sources pour FLB News
+Chaque source est interrogée à son propre rythme (fréquence de publication observée, ttl,
+skipHours/skipDays, sy:updatePeriod); les nouveaux articles sont extraits et rangés dans le
+magasin local au fil de l'eau, et le bulletin devient une simple requête sur ce magasin
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from statistics import median
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field, asdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from src.deadline import Deadline
+from src.source_health import SKIP
+from src.url_canonicalizer import url_key
+
+logger = logging.getLogger(__name__)
+
+ENTRY_TIMES_KEPT = 20  # Dates de publication conservées par source pour estimer le rythme
+DAY_NAMES = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+
+@dataclass
+class FeedSchedule:
+    """Rythme d'interrogation d'une source"""
+    name: str
+    interval: float
+    next_poll_at: float = 0.0
+    entry_times: List[float] = field(default_factory=list)
+    hints: Dict = field(default_factory=dict)
+    seen: List[str] = field(default_factory=list)  # Clés d'URL de la dernière lecture du flux
+    polls: int = 0
+    new_articles: int = 0
+
+def next_interval(schedule: FeedSchedule, new_entries: int, min_interval: float, max_interval: float,
+                  default_interval: float) -> float:
+    """Moitié de l'écart médian entre publications; recul x1.5 si rien de neuf; bornes ttl/updatePeriod"""
+    times = sorted(schedule.entry_times)
+    gaps = [later - earlier for earlier, later in zip(times, times[1:]) if later > earlier]
+    interval = median(gaps) / 2 if gaps else default_interval
+    if new_entries == 0 and schedule.polls > 0:
+        interval = max(interval, schedule.interval * 1.5)
+    # Le diffuseur demande de ne pas revenir avant ttl / updatePeriod
+    floor = max(min_interval, schedule.hints.get('ttl', 0), schedule.hints.get('update_period', 0))
+    return max(floor, min(interval, max_interval))
+
+def skip_forward(when: float, hints: Dict) -> float:
+    """Reporter après les heures (GMT) et jours exclus par skipHours/skipDays"""
+    skip_hours = set(hints.get('skip_hours', []))
+    skip_days = {day for day in hints.get('skip_days', []) if day in DAY_NAMES}
+    if len(skip_hours) >= 24 or len(skip_days) >= 7:
+        return when
+    moment = datetime.fromtimestamp(when, tz=timezone.utc)
+    for _ in range(24 * 8):
+        if moment.hour not in skip_hours and DAY_NAMES[moment.weekday()] not in skip_days:
+            return moment.timestamp()
+        moment = (moment + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
+    return when
+
+class IngestionDaemon:
+    """Boucle d'ingestion: sources dues interrogées en parallèle, rythmes persistés entre les redémarrages"""
+
+    def __init__(self, scraper, state_path: str = None, min_interval: float = 900, max_interval: float = 6 * 3600,
+                 default_interval: float = 3600, workers: int = 4, window_days: int = 7, poll_timeout: float = 120):
+        if scraper.article_store is None:
+            raise ValueError("L'ingestion continue requiert le magasin d'articles (article_store_enabled)")
+        self.scraper = scraper
+        self.state_path = (state_path or scraper.state_path('ingestion', 'schedule.json')
+                           or os.path.join(os.path.dirname(__file__), '..', '.ingestion', 'schedule.json'))
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.default_interval = default_interval
+        self.workers = workers
+        self.window_days = window_days  # Entrées plus anciennes ignorées
+        self.poll_timeout = poll_timeout  # Échéance d'une interrogation (flux + extraction des nouveaux articles)
+        self._lock = threading.Lock()
+        self._run_lock = threading.Lock()  # Une interrogation complète à la fois (arrêt après la passe en cours)
+        self._stop_event = threading.Event()
+        self.schedules: Dict[str, FeedSchedule] = self._load()
+
+    @classmethod
+    def from_config(cls, scraper, ingestion_config: Dict = None) -> 'IngestionDaemon':
+        ingestion_config = ingestion_config or {}
+        return cls(
+            scraper,
+            state_path=ingestion_config.get('state_path'),
+            min_interval=ingestion_config.get('min_interval', 900),
+            max_interval=ingestion_config.get('max_interval', 6 * 3600),
+            default_interval=ingestion_config.get('default_interval', 3600),
+            workers=ingestion_config.get('workers', 4),
+            window_days=ingestion_config.get('window_days', 7),
+            poll_timeout=ingestion_config.get('poll_timeout', 120)
+        )
+
+    def _load(self) -> Dict[str, FeedSchedule]:
+        if not os.path.exists(self.state_path):
+            return {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return {name: FeedSchedule(**record) for name, record in data.items()}
+        except Exception as e:
+            logger.warning(f"État d'ingestion illisible ({self.state_path}): {e}")
+            return {}
+
+    def save(self):
+        """Écriture atomique des rythmes d'interrogation"""
+        with self._lock:
+            data = {name: asdict(schedule) for name, schedule in self.schedules.items()}
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        tmp_file = f"{self.state_path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_file, self.state_path)
+        except Exception as e:
+            logger.warning(f"Impossible de sauvegarder l'état d'ingestion: {e}")
+
+    def _schedule(self, name: str) -> FeedSchedule:
+        with self._lock:
+            schedule = self.schedules.get(name)
+            if schedule is None:
+                schedule = self.schedules[name] = FeedSchedule(name=name, interval=self.default_interval)
+            return schedule
+
+    def due_sources(self, now: Optional[float] = None) -> List[str]:
+        now = now or time.time()
+        return [name for name, config in self.scraper.sources.items()
+                if config.get('type') in ('rss', 'website') and self._schedule(name).next_poll_at <= now]
+
+    def seconds_until_next_poll(self) -> float:
+        with self._lock:
+            upcoming = [schedule.next_poll_at for schedule in self.schedules.values()]
+        return max(0.0, min(upcoming) - time.time()) if upcoming else 0.0
+
+    def poll_source(self, name: str) -> int:
+        """Interroger une source, extraire et ranger ses nouveaux articles; nombre d'articles ingérés"""
+        schedule = self._schedule(name)
+        config = self.scraper.sources[name]
+        scraper = self.scraper
+        ingested = 0
+        new_entries = 0
+        if scraper.source_health.admission(name) == SKIP:
+            logger.debug(f"   🔌 {name}: disjoncteur ouvert, interrogation reportée")
+        else:
+            deadline = Deadline(self.poll_timeout, name=f"poll {name}")
+            cutoff_date = datetime.now() - timedelta(days=self.window_days)
+            if config['type'] == 'rss':
+                items = scraper._scrape_rss_basic(name, config, cutoff_date, deadline)
+            else:
+                items = scraper._scrape_website_basic(name, config, cutoff_date, deadline)
+            items = scraper._canonicalize_articles(items, deadline)
+            seen = set(schedule.seen)
+            fresh = [item for item in items if url_key(item.url) not in seen]
+            new_entries = len(fresh)
+
+            # Seuls les articles qui passent le filtre rapide sont téléchargés et conservés
+            relevant = scraper._rapid_keyword_filter(fresh)
+            # Vus = écartés par le filtre ou rangés dans le magasin; les échecs et les
+            # articles non atteints avant l'échéance seront retentés au prochain passage
+            handled = {url_key(item.url) for item in fresh} - {url_key(item.url) for item in relevant}
+            for item in relevant:
+                if deadline.expired:
+                    break
+                if scraper.article_store.known(item.url):
+                    handled.add(url_key(item.url))
+                    continue
+                try:
+                    # Rangé dans le magasin par l'extraction elle-même (les replis sur le résumé ne le sont pas)
+                    scraper._extract_and_enhance_article(item, deadline)
+                    if scraper.article_store.known(item.url):
+                        ingested += 1
+                        handled.add(url_key(item.url))
+                except Exception as e:
+                    logger.debug(f"Ingestion échouée pour {item.url}: {e}")
+
+            with self._lock:
+                if items:
+                    schedule.seen = [key for key in (url_key(item.url) for item in items) if key in seen or key in handled]
+                published = {item.published_date.timestamp() for item in fresh if item.published_date}
+                schedule.entry_times = sorted(set(schedule.entry_times) | published)[-ENTRY_TIMES_KEPT:]
+                schedule.hints = scraper.feed_hints.get(name, schedule.hints)
+
+        with self._lock:
+            schedule.interval = next_interval(schedule, new_entries, self.min_interval, self.max_interval, self.default_interval)
+            schedule.next_poll_at = skip_forward(time.time() + schedule.interval, schedule.hints)
+            schedule.polls += 1
+            schedule.new_articles += ingested
+        logger.info(f"📥 {name}: {new_entries} nouvelles entrées, {ingested} articles ingérés, "
+                    f"prochaine interrogation dans {schedule.interval / 60:.0f} min")
+        return ingested
+
+    def run_once(self) -> int:
+        """Interroger toutes les sources dues; nombre d'articles ingérés"""
+        due = self.due_sources()
+        if not due:
+            return 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            ingested = sum(executor.map(self._safe_poll, due))
+        self.scraper.source_health.save()
+        self.save()
+        return ingested
+
+    def _safe_poll(self, name: str) -> int:
+        try:
+            return self.poll_source(name)
+        except Exception as e:
+            logger.error(f"❌ Ingestion {name}: {e}")
+            schedule = self._schedule(name)
+            with self._lock:
+                schedule.next_poll_at = time.time() + schedule.interval
+            return 0
+
+    def run(self, stop_event: Optional[threading.Event] = None):
+        """Boucle jusqu'à stop_event ou stop() (Ctrl-C en avant-plan)"""
+        if stop_event is not None:
+            self._stop_event = stop_event
+        stop_event = self._stop_event
+        logger.info(f"📥 Ingestion continue de {len(self.scraper.sources)} sources "
+                    f"(intervalles {self.min_interval / 60:.0f}-{self.max_interval / 60:.0f} min)")
+        while not stop_event.is_set():
+            with self._run_lock:
+                if stop_event.is_set():
+                    break
+                self.run_once()
+            # Se réveiller à la prochaine échéance, au plus tard dans une minute (nouvelles sources, arrêt)
+            stop_event.wait(min(60.0, max(1.0, self.seconds_until_next_poll())))
+
+    def stop(self):
+        """Arrêter la boucle après l'interrogation en cours, sauvegarder les rythmes et libérer le pool de parsing"""
+        self._stop_event.set()
+        with self._run_lock:
+            self.save()
+            self.scraper.close()
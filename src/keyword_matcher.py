@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Recherche multi-motifs pour le scoring FLB News
+Tous les motifs d'un profil (mots-clés pondérés, filtre rapide, indicateurs négatifs, termes géographiques,
+proximité) sont réunis dans un trie compilé une fois en expression régulière: une seule passe sur le texte
+donne chaque occurrence avec sa position et son numéro de phrase, quel que soit le nombre de motifs
+"""
+
+import re
+import hashlib
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+SENTENCE_BREAK = re.compile(r'\.')  # Même découpage que text.split('.')
+WORD = re.compile(r'\S+')
+
+class KeywordMatches:
+    """Occurrences d'un texte: {motif: [(début, phrase), ...]} dans l'ordre du texte"""
+
+    def __init__(self, text: str, hits: Dict[str, List[Tuple[int, int]]], breaks: List[int], groups: Dict[str, Tuple[str, ...]]):
+        self.text = text
+        self.hits = hits
+        self.breaks = breaks  # Positions des '.' (fins de phrase)
+        self.groups = groups
+        self._first: Dict[str, Dict[int, int]] = {}
+        self._leading: Dict[Tuple[int, int], int] = {}
+
+    def __contains__(self, pattern: str) -> bool:
+        return pattern in self.hits
+
+    def any_of(self, group: str) -> bool:
+        return any(pattern in self.hits for pattern in self.groups[group])
+
+    def starts(self, pattern: str) -> List[int]:
+        return [start for start, _ in self.hits.get(pattern, ())]
+
+    def count(self, pattern: str) -> int:
+        """Occurrences sans chevauchement, comme str.count"""
+        total, next_free = 0, 0
+        for start, _ in self.hits.get(pattern, ()):
+            if start >= next_free:
+                total += 1
+                next_free = start + len(pattern)
+        return total
+
+    def _first_by_sentence(self, pattern: str) -> Dict[int, int]:
+        """Première occurrence du motif dans chaque phrase où il apparaît"""
+        first = self._first.get(pattern)
+        if first is None:
+            first = {}
+            for start, sentence in self.hits.get(pattern, ()):
+                first.setdefault(sentence, start)
+            self._first[pattern] = first
+        return first
+
+    def sentences(self, pattern: str):
+        return self._first_by_sentence(pattern).keys()
+
+    def sentences_of(self, group: str) -> Set[int]:
+        found = set()
+        for pattern in self.groups[group]:
+            found.update(self.sentences(pattern))
+        return found
+
+    def sentence_span(self, sentence: int) -> Tuple[int, int]:
+        start = self.breaks[sentence - 1] + 1 if sentence else 0
+        end = self.breaks[sentence] if sentence < len(self.breaks) else len(self.text)
+        return start, end
+
+    def in_leading_words(self, pattern: str, sentence: int, words: int) -> bool:
+        """Motif compris dans les premiers mots de la phrase"""
+        start = self._first_by_sentence(pattern).get(sentence)
+        if start is None:
+            return False
+        limit = self._leading.get((sentence, words))
+        if limit is None:
+            sentence_start, sentence_end = self.sentence_span(sentence)
+            limit = sentence_start
+            for n, word in enumerate(WORD.finditer(self.text, sentence_start, sentence_end), 1):
+                limit = word.end()
+                if n == words:
+                    break
+            self._leading[(sentence, words)] = limit
+        return start + len(pattern) <= limit
+
+class KeywordMatcher:
+    """Trie de l'union des groupes de motifs (en minuscules), compilé en une expression régulière.
+    La recherche renvoie le plus long motif commençant à chaque position; les motifs plus courts qui
+    commencent au même endroit en sont des préfixes, précalculés: les occurrences chevauchantes
+    ('import' dans 'importation', 'québec' dans 'ville de québec') sont toutes retrouvées"""
+
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        self.groups = {name: tuple(dict.fromkeys(p.lower() for p in patterns if p)) for name, patterns in groups.items()}
+        self.patterns = list(dict.fromkeys(p for patterns in self.groups.values() for p in patterns))
+        self.version = hashlib.sha1(repr(sorted(self.groups.items())).encode('utf-8')).hexdigest()[:16]
+        trie: Dict = {}
+        for pattern in self.patterns:
+            node = trie
+            for ch in pattern:
+                node = node.setdefault(ch, {})
+            node[''] = pattern
+        # Motifs préfixes de chaque motif (lui compris), du plus court au plus long
+        self._prefixes: Dict[str, Tuple[str, ...]] = {
+            pattern: tuple(p for p in self.patterns if pattern.startswith(p)) for pattern in self.patterns}
+        self._regex: Optional[re.Pattern] = re.compile(self._trie_regex(trie)) if self.patterns else None
+
+    @classmethod
+    def _trie_regex(cls, node: Dict) -> str:
+        branches = [re.escape(ch) + cls._trie_regex(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # Quantificateur gourmand: le plus long motif l'emporte
+        return f'(?:{body})?' if '' in node else body
+
+    def scan(self, text: str) -> KeywordMatches:
+        """Une passe sur le texte (déjà en minuscules): toutes les occurrences avec position et phrase"""
+        hits: Dict[str, List[Tuple[int, int]]] = {}
+        breaks = [match.start() for match in SENTENCE_BREAK.finditer(text)]
+        if self._regex is not None:
+            search, prefixes = self._regex.search, self._prefixes
+            match = search(text)
+            while match:
+                start = match.start()
+                sentence = bisect_left(breaks, start)
+                for pattern in prefixes[match.group()]:
+                    hits.setdefault(pattern, []).append((start, sentence))
+                match = search(text, start + 1)
+        return KeywordMatches(text, hits, breaks, self.groups)
+
+_compiled: Dict[tuple, KeywordMatcher] = {}
+_compiled_lock = threading.Lock()
+
+def compile_profile(groups: Dict[str, Iterable[str]]) -> KeywordMatcher:
+    """Matcher partagé par profil: compilé à la première demande, réutilisé par les scrapers suivants"""
+    profile = tuple((name, tuple(patterns)) for name, patterns in sorted(groups.items()))
+    with _compiled_lock:
+        matcher = _compiled.get(profile)
+        if matcher is None:
+            matcher = _compiled[profile] = KeywordMatcher(dict(profile))
+        return matcher
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Extraction structurée des pages de listing (sources 'website') pour FLB News
+JSON-LD (ItemList, NewsArticle...), sitemaps Google News et flux annoncés par <link rel=alternate>:
+dates et descriptions réelles dès la phase 1, sans télécharger chaque article
+"""
+
+import io
+import json
+import logging
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from urllib.parse import urljoin
+
+from lxml import etree
+
+from src.feed_parser import parse_date
+from src.article_extractor import parse_html
+
+logger = logging.getLogger(__name__)
+
+ARTICLE_TYPES = {'NewsArticle', 'Article', 'BlogPosting', 'Report', 'AnalysisNewsArticle',
+                 'ReportageNewsArticle', 'PressRelease', 'TechArticle', 'ScholarlyArticle'}
+FEED_TYPES = ('application/rss+xml', 'application/atom+xml')
+
+@dataclass
+class StructuredListing:
+    """Entrées normalisées (même format que les flux RSS) et liens à suivre si la page n'en contient pas"""
+    entries: List[Dict] = field(default_factory=list)
+    feed_url: str = ""
+    sitemap_url: str = ""
+
+def _types(node: Dict) -> set:
+    value = node.get('@type', [])
+    return set(value) if isinstance(value, list) else {value}
+
+def _url_of(value) -> str:
+    if isinstance(value, list):
+        value = value[0] if value else ''
+    if isinstance(value, dict):
+        value = value.get('url') or value.get('@id') or ''
+    return value if isinstance(value, str) else ''
+
+def _flatten(data) -> List[Dict]:
+    """Noeuds JSON-LD de premier niveau (listes et @graph dépliés)"""
+    if isinstance(data, list):
+        return [node for item in data for node in _flatten(item)]
+    if isinstance(data, dict):
+        return [data] + _flatten(data['@graph']) if '@graph' in data else [data]
+    return []
+
+def _entry(node: Dict, page_url: str) -> Optional[Dict]:
+    title = ' '.join(str(node.get('headline') or node.get('name') or '').split())
+    link = _url_of(node.get('url')) or _url_of(node.get('mainEntityOfPage'))
+    if not title or not link:
+        return None
+    link = urljoin(page_url, link)
+    published = parse_date(str(node.get('datePublished') or node.get('dateCreated') or ''))
+    return {
+        'title': title,
+        'link': link,
+        'summary': ' '.join(str(node.get('description') or '').split())[:1800],
+        'published': published.isoformat() if published else None,
+        'image_url': urljoin(page_url, _url_of(node.get('image'))) if node.get('image') else ''
+    }
+
+def _json_ld_entries(tree, page_url: str) -> List[Dict]:
+    entries = []
+    for script in tree.xpath('//script[@type="application/ld+json"]'):
+        try:
+            data = json.loads(script.text_content().strip() or 'null')
+        except ValueError:
+            continue
+        for node in _flatten(data):
+            if not isinstance(node, dict):
+                continue
+            if 'ItemList' in _types(node):
+                for element in node.get('itemListElement') or []:
+                    if isinstance(element, dict):
+                        item = element.get('item', element)
+                        if isinstance(item, str):
+                            item = {'url': item, 'name': element.get('name', '')}
+                        entries.append(_entry(item, page_url) if isinstance(item, dict) else None)
+            elif _types(node) & ARTICLE_TYPES:
+                entries.append(_entry(node, page_url))
+    # L'article décrivant la page de listing elle-même n'est pas une entrée
+    return [entry for entry in entries if entry and entry['link'].rstrip('/') != page_url.rstrip('/')]
+
+def extract_listing(content: bytes, page_url: str, max_entries: int = 20, content_type: str = "") -> StructuredListing:
+    """Lire le JSON-LD de la page et repérer son flux RSS/Atom ou son sitemap"""
+    listing = StructuredListing()
+    try:
+        tree = parse_html(content, content_type)
+    except (etree.ParserError, ValueError):
+        return listing
+
+    seen = set()
+    for entry in _json_ld_entries(tree, page_url):
+        if entry['link'] not in seen:
+            seen.add(entry['link'])
+            listing.entries.append(entry)
+    listing.entries = listing.entries[:max_entries]
+
+    for link in tree.xpath('//link[@href]'):
+        rel = (link.get('rel') or '').lower().split()
+        if 'alternate' in rel and (link.get('type') or '').lower() in FEED_TYPES and not listing.feed_url:
+            listing.feed_url = urljoin(page_url, link.get('href'))
+        elif 'sitemap' in rel and not listing.sitemap_url:
+            listing.sitemap_url = urljoin(page_url, link.get('href'))
+    return listing
+
+def parse_news_sitemap(content: bytes, max_entries: int = 20) -> List[Dict]:
+    """Entrées d'un sitemap Google News (news:title obligatoire), des plus récentes aux plus anciennes"""
+    entries = []
+    try:
+        for _, url in etree.iterparse(io.BytesIO(content), tag='{*}url', resolve_entities=False, no_network=True):
+            fields = {}
+            for child in url.iter():
+                if isinstance(child.tag, str) and child is not url:
+                    # <image:loc> partage le nom local de <loc>: ranger à part
+                    name = etree.QName(child).localname
+                    parent = etree.QName(child.getparent()).localname
+                    fields.setdefault('image_loc' if parent == 'image' else name, (child.text or '').strip())
+            url.clear()
+            if fields.get('loc') and fields.get('title'):
+                published = parse_date(fields.get('publication_date') or fields.get('lastmod', ''))
+                entries.append({
+                    'title': ' '.join(fields['title'].split()),
+                    'link': fields['loc'],
+                    'summary': '',
+                    'published': published.isoformat() if published else None,
+                    'image_url': fields.get('image_loc', '')
+                })
+    except etree.XMLSyntaxError as e:
+        logger.debug(f"Sitemap illisible: {e}")
+    entries.sort(key=lambda entry: entry['published'] or '', reverse=True)
+    return entries[:max_entries]
@@ -13,6 +13,8 @@ from dataclasses import dataclass, field
 import openai
 from dotenv import load_dotenv
 
+from src.deadline import Deadline
+
 load_dotenv()
 
 logger = logging.getLogger(__name__)
@@ -48,7 +50,7 @@ class OpenRouterAnalyzer:
         else:
             logger.error("Clé API OpenRouter non trouvée!")
     
-    def analyze_article(self, title: str, content: str, source: str, url: str = "") -> ArticleAnalysis:
+    def analyze_article(self, title: str, content: str, source: str, url: str = "", timeout: float = 15) -> ArticleAnalysis:
         """
         Analyser un article avec GPT-5 pour générer un résumé intelligent
         et une analyse stratégique pour FLB Solutions
@@ -111,7 +113,7 @@ IMPORTANT:
                 ],
                 temperature=0.3,  # Plus déterministe
                 max_tokens=800,  # Réduit pour économiser les tokens
-                timeout=15,  # Timeout pour éviter les attentes infinies
+                timeout=timeout,  # Timeout pour éviter les attentes infinies (réduit au budget restant)
                 extra_headers={
                     "HTTP-Referer": "http://localhost:3000",
                     "X-Title": "FLB News Bulletin Generator"
@@ -171,11 +173,12 @@ IMPORTANT:
                 relevance_score=0.3
             )
     
-    def analyze_batch(self, articles: List[Dict], max_articles: int = 7) -> List[ArticleAnalysis]:
+    def analyze_batch(self, articles: List[Dict], max_articles: int = 7, deadline: Optional[Deadline] = None) -> List[ArticleAnalysis]:
         """
         Analyser un lot d'articles avec O4 de manière optimisée
-        Utilise un retry intelligent et évite les pauses fixes
+        Utilise un retry intelligent et évite les pauses fixes; s'arrête à l'échéance
         """
+        deadline = deadline or Deadline.never()
         results = []
         
         # Pré-trier les articles par score de pertinence si disponible
@@ -192,6 +195,9 @@ IMPORTANT:
         logger.info(f"Buffer d'analyse: {len(sorted_articles)} articles candidats (cible: {max_articles})")
         
         for i, article in enumerate(sorted_articles):
+            if deadline.expired:
+                logger.warning(f"Budget d'analyse épuisé après {i} articles")
+                break
             logger.info(f"Analyse O4 ({i+1}/{len(sorted_articles)}): {article.get('title', '')[:50]}...")
             
             # Analyser avec retry intelligent
@@ -200,7 +206,8 @@ IMPORTANT:
                 content=article.get('summary', '') + " " + article.get('full_text', '')[:1000],
                 source=article.get('source', ''),
                 url=article.get('url', ''),
-                retry_count=3
+                retry_count=3,
+                deadline=deadline
             )
             
             results.append(analysis)
@@ -214,24 +221,27 @@ IMPORTANT:
         logger.info(f"Analyse terminée: {len(results)} articles traités, {len([r for r in results if r.relevance_score > 0.1])} réussis")
         return results[:max_articles]  # Retourner seulement le nombre demandé
     
-    def _analyze_with_retry(self, title: str, content: str, source: str, url: str = "", retry_count: int = 3) -> ArticleAnalysis:
+    def _analyze_with_retry(self, title: str, content: str, source: str, url: str = "", retry_count: int = 3,
+                            deadline: Optional[Deadline] = None) -> ArticleAnalysis:
         """
-        Analyser avec retry intelligent et backoff exponentiel
+        Analyser avec retry intelligent et backoff exponentiel, sans dépasser l'échéance
         """
+        deadline = deadline or Deadline.never()
         last_error = None
         
         for attempt in range(retry_count):
             try:
-                return self.analyze_article(title, content, source, url)
+                return self.analyze_article(title, content, source, url, timeout=deadline.timeout(15))
             except Exception as e:
                 last_error = e
-                if attempt < retry_count - 1:
-                    # Backoff exponentiel: 1s, 2s, 4s
-                    wait_time = 2 ** attempt
+                # Backoff exponentiel: 1s, 2s, 4s (pas de nouvel essai si l'échéance tombe pendant l'attente)
+                wait_time = 2 ** attempt
+                if attempt < retry_count - 1 and deadline.remaining() > wait_time:
                     logger.warning(f"API error (attempt {attempt + 1}), retrying in {wait_time}s: {str(e)}")
                     time.sleep(wait_time)
                 else:
                     logger.error(f"All retry attempts failed for {title[:30]}...")
+                    break
         
         # Fallback si tous les essais échouent
         logger.warning(f"Falling back to basic analysis for: {title[:50]}...")
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Pool de processus pour le parsing HTML de la phase 3
+Les octets téléchargés partent vers un processus de travail, un ExtractedPage compact revient:
+le parsing lxml et l'extraction du texte ne sont plus sérialisés par le GIL des threads réseau
+"""
+
+import logging
+import multiprocessing
+from typing import Dict, Optional
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from src.article_extractor import ArticleExtractor, ExtractedPage
+from src.deadline import DeadlineExceeded
+
+logger = logging.getLogger(__name__)
+
+_worker_extractor = None  # Un extracteur par processus, créé une seule fois
+
+def _init_worker(extractor_options: Dict):
+    global _worker_extractor
+    _worker_extractor = ArticleExtractor(**extractor_options)
+
+def _extract_in_worker(url: str, html: bytes, content_type: str) -> ExtractedPage:
+    page = _worker_extractor.extract(url, html, content_type)
+    page.metadata = {}  # Inutile au pipeline: ne pas le renvoyer au processus principal
+    return page
+
+class ParsePool:
+    """Processus de travail réutilisés pendant toute la durée de vie du scraper"""
+
+    def __init__(self, extractor: ArticleExtractor, workers: int):
+        self.extractor = extractor  # Repli local si le pool est cassé
+        self.workers = workers
+        options = {
+            'engine': extractor.engine,
+            'max_text_chars': extractor.max_text_chars,
+            'newspaper_fallback': extractor.newspaper_fallback,
+            'min_text_chars': extractor.min_text_chars
+        }
+        # 'spawn': jamais de fork d'un processus qui a déjà des threads réseau (verrous hérités)
+        self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                             initializer=_init_worker, initargs=(options,))
+        self._broken = False
+        self._abandoned = 0  # Jobs dépassés par l'échéance, peut-être encore en cours dans un processus
+        logger.info(f"Pool de parsing: {workers} processus")
+
+    def extract(self, url: str, html: bytes, content_type: str = "", timeout: Optional[float] = None) -> ExtractedPage:
+        """Extraction dans un processus de travail; bloque le thread appelant (GIL relâché pendant l'attente)"""
+        if self._broken or not html:
+            return self.extractor.extract(url, html, content_type)
+        future = self._executor.submit(_extract_in_worker, url, html, content_type)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            self._abandoned += 1  # Processus occupés par un travail trop long: ne pas l'attendre à la fermeture
+            raise DeadlineExceeded(f"parsing de {url} interrompu à l'échéance")
+        except BrokenProcessPool as e:
+            logger.warning(f"Pool de parsing interrompu, extraction dans le processus principal: {e}")
+            self._broken = True
+            return self.extractor.extract(url, html, content_type)
+
+    def close(self):
+        """Arrêter les processus de travail; une extraction tardive se fait dans le processus principal.
+        Un parsing abandonné à l'échéance n'est pas attendu: ses processus sont terminés"""
+        self._broken = True
+        processes = list((self._executor._processes or {}).values())
+        self._executor.shutdown(wait=not self._abandoned, cancel_futures=True)
+        if self._abandoned:
+            for process in processes:
+                process.terminate()
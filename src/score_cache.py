@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Cache des scores de pertinence pour FLB News
+Un article est noté au pré-filtrage, à l'extraction puis à la sélection finale: la clé décrit l'état
+du contenu (titre, résumé, texte complet) et tout ce dont le score dépend, un contenu inchangé
+n'est donc noté qu'une fois
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+class CachedScore(NamedTuple):
+    score: float
+    tags: List[str]
+    relevance_to_flb: str
+
+class ScoreCache:
+    """Cache LRU en mémoire, partagé par les phases et les threads d'extraction"""
+
+    def __init__(self, max_entries: int = 5000):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, CachedScore]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(title: str, summary: str, full_text: str, include_full_text: bool, profile: str, *context) -> str:
+        """Empreinte du contenu noté (texte complet seulement s'il entre dans le score), du mode et du profil
+        de mots-clés; 'context' porte les autres entrées du score (multiplicateur de source, âge en jours)"""
+        digest = hashlib.sha1()
+        for part in (title, summary, full_text if include_full_text else '', str(include_full_text), profile, *map(str, context)):
+            digest.update(part.encode('utf-8', 'surrogatepass'))
+            digest.update(b'\x1f')
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[CachedScore]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, entry: CachedScore):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def log_summary(self):
+        total = self.hits + self.misses
+        if total:
+            logger.info(f"🧮 Cache de scores: {self.hits}/{total} scores réutilisés ({len(self._entries)} contenus notés)")
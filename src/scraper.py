@@ -1,16 +1,35 @@
-import requests
 from bs4 import BeautifulSoup
 import feedparser
-from newspaper import Article
 from datetime import datetime, timedelta
 import logging
+import os
 import time
 from typing import List, Dict, Optional
 from dataclasses import dataclass, field
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import asyncio
 import hashlib
+import math
+import threading
+import requests
 from src.translator import NewsTranslator
+from src.fetch_engine import AsyncFetchEngine
+from src import http_recorder
+from src.http_client import FetchResult, get_http_client, default_headers
+from src.feed_cache import FeedCache
+from src.feed_parser import parse_feed, parse_feed_hints, html_to_text
+from src.listing_extractor import extract_listing, parse_news_sitemap
+from src.url_canonicalizer import UrlCanonicalizer, url_key, is_redirect_wrapper
+from src.article_store import ArticleStore
+from src.host_limiter import HostLimiter
+from src.deadline import Deadline, DeadlineExceeded, RunBudget
+from src.source_health import SourceHealthTracker, latency_band, PROBE, SKIP
+from src.article_extractor import ArticleExtractor
+from src.parse_pool import ParsePool
+from src.keyword_matcher import KeywordMatches, compile_profile
+from src.score_cache import CachedScore, ScoreCache
+from src.batch_scorer import BatchScorer, FRESHNESS_BONUS, NUMPY_AVAILABLE
+from src.streaming_pipeline import StreamingPipeline
 
 # Import du nouvel analyseur hybride
 try:
@@ -23,6 +42,37 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+FEED_MAX_ENTRIES = 20  # Entrées lues par flux RSS
+CATEGORY_RANK = {'A': 0, 'B': 1, 'C': 2, 'D': 3, 'E': 4}  # Ordre de soumission à durée attendue égale
+CATEGORY_WEIGHT = {'A': 1.0, 'B': 0.8, 'C': 0.6, 'D': 0.4, 'E': 0.2}  # Valeur attendue = pré-score x catégorie
+
+# Mots-clés critiques FLB du filtre rapide (au moins un requis)
+CRITICAL_KEYWORDS = [
+    # Priorité 1: Importation et commerce international
+    'importation', 'import', 'douane', 'international', 'tarif',
+    # Priorité 2: Distribution et concurrence
+    'distributeur', 'grossiste', 'distribution', 'wholesale', 'sysco',
+    # Priorité 3: Restauration (clientèle principale)
+    'restaurant', 'restauration', 'foodservice', 'service alimentaire', 'chef',
+    # Priorité 4: Hôtellerie (clientèle importante)
+    'hôtel', 'hôtellerie', 'horeca', 'tourisme', 'hébergement',
+    # Priorité 5: Proximité géographique (région de Québec)
+    'ville de québec', 'quebec city', 'capitale-nationale', 'beauport', 'lévis',
+    'sainte-foy', 'charlesbourg', 'ancienne-lorette',
+    # Priorité 6: Province de Québec élargie
+    'québec', 'quebec', 'montréal', 'montreal', 'sherbrooke', 'gatineau',
+    # Mots génériques importants
+    'alimentaire', 'food', 'prix', 'coût'
+]
+PROXIMITY_KEYWORDS = ['distributeur', 'québec', 'alimentaire', 'supply chain']  # +20% par voisin dans la phrase
+NEGATIVE_INDICATORS = [
+    'pas de', 'aucun', 'éviter', 'rejeter', 'interdire', 'bannir',
+    'no longer', 'avoid', 'prevent', 'ban', 'prohibit',
+    'fermeture', 'closure', 'échec', 'failure'
+]
+QUEBEC_TERMS = ['québec', 'quebec', 'capitale-nationale', 'beauport', 'lévis', 'sainte-foy', 'charlesbourg']
+CANADA_TERMS = ['canada', 'canadien', 'canadian']
+
 @dataclass
 class NewsItem:
     title: str
@@ -37,9 +87,10 @@ class NewsItem:
     image_url: str = ""
     is_translated: bool = False  # Flag pour éviter la double traduction
     content_hash: str = ""  # Hash pour déduplication
+    canonical_url: str = ""  # URL canonique déclarée par la page (<link rel=canonical>)
 
 class FoodIndustryNewsScraper:
-    def __init__(self, sources_config: Dict, keywords_config: Dict = None, analysis_config: Dict = None, bulletin_config: Dict = None):
+    def __init__(self, sources_config: Dict, keywords_config: Dict = None, analysis_config: Dict = None, bulletin_config: Dict = None, http_config: Dict = None, extraction_config: Dict = None):
         self.sources = sources_config
         self.translator = NewsTranslator()
         # Utiliser les mots-clés de config.py si fournis
@@ -56,9 +107,62 @@ class FoodIndustryNewsScraper:
                 'sustainability': 4, 'local': 5, 'régional': 5, 'innovation': 4
             }
         
+        # Tous les motifs du scoring (mots-clés, filtre rapide, négatifs, géo, proximité) en un automate
+        self.keyword_matcher = compile_profile({
+            'keywords': list(self.keyword_weights),
+            'critical': CRITICAL_KEYWORDS,
+            'proximity': PROXIMITY_KEYWORDS,
+            'negative': NEGATIVE_INDICATORS,
+            'quebec': QUEBEC_TERMS,
+            'canada': CANADA_TERMS
+        })
+        # Version du profil de scoring (poids et motifs): un changement invalide les scores mémorisés
+        self.keyword_profile = hashlib.sha1(
+            repr((sorted(self.keyword_weights.items()), self.keyword_matcher.version)).encode('utf-8')).hexdigest()[:16]
+        self.score_cache = ScoreCache()
+        # Scoring vectorisé des lots (NumPy): tous les candidats sont notés, sans troncature préalable
+        self.batch_scorer = BatchScorer(self.keyword_matcher, self.keyword_weights) if NUMPY_AVAILABLE else None
+        
         # Configuration du bulletin (pour limites d'articles)
         self.bulletin_config = bulletin_config or {'max_articles': 7}
         
+        # Configuration réseau (concurrence, timeouts)
+        self.http_config = http_config or {}
+        # États persistants (caches, santé, magasin) sous state_dir si défini, sinon à la racine du dépôt
+        self.state_dir = self.http_config.get('state_dir')
+        self.http = get_http_client(self.http_config)
+        # Concurrence par hôte ajustée en AIMD (latence, 429/503, timeouts) sous un plafond global
+        self.host_limiter = HostLimiter.from_config(self.http_config)
+        
+        # Santé des sources (latences, échecs) et disjoncteur persistant entre les exécutions
+        self.source_health = SourceHealthTracker.from_config(self.http_config, self.state_path('source_health', 'health.json'))
+        
+        # URLs canoniques (suivi, AMP, http/https) et redirecteurs résolus, cache persistant entre les exécutions
+        self.url_canonicalizer = (UrlCanonicalizer(self.state_path('url_cache', 'redirects.json'),
+                                                   persistent=self.http_config.get('redirect_cache_enabled', True))
+                                  if self.http_config.get('canonicalize_urls', True) else None)
+        
+        # Indications de fréquence des flux (ttl, skipHours, sy:updatePeriod) pour l'ingestion continue
+        self.feed_hints: Dict[str, Dict] = {}
+        
+        # Cache des flux RSS (ETag / Last-Modified) persistant entre les exécutions
+        self.feed_cache = FeedCache(self.state_path('feed_cache')) if self.http_config.get('feed_cache_enabled', True) else None
+        
+        # Extraction unifiée des pages (texte + image + métadonnées en une passe)
+        self.extraction_config = extraction_config or {}
+        self.extractor = ArticleExtractor(
+            engine=self.extraction_config.get('extractor', 'lxml'),
+            max_text_chars=self.extraction_config.get('max_text_chars', 20000),
+            newspaper_fallback=self.extraction_config.get('newspaper_fallback', False)
+        )
+        
+        # Parsing HTML de la phase 3 dans des processus (hors GIL), créés à la première extraction
+        self._parse_pool = None
+        self._parse_pool_lock = threading.Lock()
+        
+        # Articles déjà extraits lors des exécutions précédentes (fenêtres days_back qui se chevauchent)
+        self.article_store = ArticleStore.from_config(self.extraction_config, self.state_path('article_store', 'articles.sqlite3')) if self.extraction_config.get('article_store_enabled', True) else None
+        
         # Initialiser l'analyseur avancé si disponible
         self.analyzer = None
         if ANALYZER_AVAILABLE and analysis_config:
@@ -71,21 +175,33 @@ class FoodIndustryNewsScraper:
             except Exception as e:
                 logger.warning(f"Failed to initialize advanced analyzer: {e}")
         
-    def scrape_all_sources(self, days_back: int = 7) -> List[NewsItem]:
+    def state_path(self, *parts: str) -> Optional[str]:
+        """Chemin d'un état persistant sous state_dir (None: emplacement par défaut du module)"""
+        return os.path.join(self.state_dir, *parts) if self.state_dir else None
+    
+    def scrape_all_sources(self, days_back: int = 7, deadline: Optional[Deadline] = None) -> List[NewsItem]:
+        if self.http_config.get('streaming_pipeline', True):
+            # Étapes reliées par des files bornées au lieu de phases en barrière
+            return StreamingPipeline.from_config(self).run(days_back, deadline)
         start_time = time.time()
         cutoff_date = datetime.now() - timedelta(days=days_back)
+        budget = self._run_budget(deadline)
+        deadline = budget.deadline
         logger.info(f"🚀 DÉBUT SCRAPING - Recherche des {days_back} derniers jours depuis {cutoff_date.strftime('%Y-%m-%d %H:%M')}")
         
         # Phase 1: Paralléliser le scraping des sources
         phase_start = time.time()
         logger.info(f"📡 Phase 1: Scraping de {len(self.sources)} sources en parallèle...")
-        all_news = self._parallel_scrape_sources(cutoff_date)
+        all_news = self._parallel_scrape_sources(cutoff_date, budget.phase('sources'))
         logger.info(f"✅ Phase 1 terminée en {time.time() - phase_start:.1f}s → {len(all_news)} articles récupérés")
         
         if not all_news:
             logger.warning("❌ Aucun article trouvé, arrêt du processus")
             return []
         
+        # Phase 1.5: URLs canoniques, doublons fusionnés avant tout téléchargement d'article
+        all_news = self._canonicalize_articles(all_news, deadline.child(self.http_config.get('redirect_phase_timeout', 15), 'canonicalization'))
+        
         # Phase 2: Pré-filtrage optimisé en cascade
         phase_start = time.time()
         pre_filtered = self._pre_filter_articles(all_news)
@@ -98,9 +214,99 @@ class FoodIndustryNewsScraper:
         # Phase 3: Extraction parallèle du contenu complet pour articles pré-filtrés
         phase_start = time.time()
         logger.info(f"📄 Phase 3: Extraction contenu complet de {len(pre_filtered)} articles...")
-        enhanced_news = self._parallel_extract_content(pre_filtered)
+        enhanced_news = self._parallel_extract_content(pre_filtered, budget.phase('extraction'))
         logger.info(f"✅ Phase 3 terminée en {time.time() - phase_start:.1f}s → {len(enhanced_news)} articles avec contenu")
         
+        return self._finalize_selection(enhanced_news, start_time, budget)
+    
+    def select_from_store(self, days_back: int = 7) -> List[NewsItem]:
+        """Bulletin à partir des articles déjà ingérés (magasin local): aucune requête réseau avant la traduction"""
+        start_time = time.time()
+        if not self.article_store:
+            logger.warning("❌ Magasin d'articles désactivé, rien à sélectionner")
+            return []
+        cutoff_date = datetime.now() - timedelta(days=days_back)
+        records = self.article_store.recent(cutoff_date)
+        logger.info(f"🗄️ {len(records)} articles ingérés depuis {cutoff_date.strftime('%Y-%m-%d %H:%M')}")
+        if not records:
+            return []
+        
+        news_items = []
+        for record in records:
+            item = NewsItem(
+                title=record['title'],
+                url=record['url'],
+                source=record['source'],
+                published_date=datetime.fromisoformat(record['published']) if record['published'] else datetime.fromtimestamp(record['first_seen']),
+                summary=record['summary'],
+                full_text=record['full_text'] or record['summary'],
+                image_url=record['image_url'],
+                content_hash=record['content_hash'],
+                canonical_url=record['canonical_url']
+            )
+            item.relevance_score = self._calculate_unified_score(item, include_full_text=True)
+            news_items.append(item)
+        return self._finalize_selection(news_items, start_time)
+    
+    def _run_deadline(self) -> Deadline:
+        """Échéance de l'exécution complète (HTTP_CONFIG 'run_timeout', illimitée si absente)"""
+        return Deadline(self.http_config.get('run_timeout'), name='run')
+    
+    def _run_budget(self, deadline: Optional[Deadline] = None) -> RunBudget:
+        """Budget de l'exécution réparti entre sources, extraction, analyse et traduction (HTTP_CONFIG 'phase_shares')"""
+        return RunBudget.from_config(self.http_config, deadline or self._run_deadline())
+    
+    async def ascrape_all_sources(self, days_back: int = 7, deadline: Optional[Deadline] = None) -> List[NewsItem]:
+        """Variante asyncio de scrape_all_sources: phases 1 et 3 sur une seule boucle d'événements"""
+        start_time = time.time()
+        cutoff_date = datetime.now() - timedelta(days=days_back)
+        budget = self._run_budget(deadline)
+        deadline = budget.deadline
+        logger.info(f"🚀 DÉBUT SCRAPING ASYNC - Recherche des {days_back} derniers jours depuis {cutoff_date.strftime('%Y-%m-%d %H:%M')}")
+        
+        async with AsyncFetchEngine(
+            max_concurrency=self.http_config.get('max_concurrency', 200),
+            limit_per_host=self.http_config.get('pool_size_per_host', 8),
+            default_timeout=self.http_config.get('article_timeout', 10),
+            headers=default_headers(self.http_config),
+            max_bytes=self.http.max_bytes,
+            skip_content_types=self.http.skip_content_types,
+            sync_client=self.http if http_recorder.active() else None
+        ) as engine:
+            # Phase 1: Tous les flux en vol simultanément
+            phase_start = time.time()
+            logger.info(f"📡 Phase 1: Scraping async de {len(self.sources)} sources...")
+            all_news = await self._async_scrape_sources(engine, cutoff_date, budget.phase('sources'))
+            logger.info(f"✅ Phase 1 terminée en {time.time() - phase_start:.1f}s → {len(all_news)} articles récupérés")
+            
+            if not all_news:
+                logger.warning("❌ Aucun article trouvé, arrêt du processus")
+                return []
+            
+            # Phase 1.5: URLs canoniques (résolution des redirecteurs hors de la boucle)
+            all_news = await asyncio.to_thread(self._canonicalize_articles, all_news,
+                                               deadline.child(self.http_config.get('redirect_phase_timeout', 15), 'canonicalization'))
+            
+            # Phase 2: Pré-filtrage (CPU, pas de réseau)
+            phase_start = time.time()
+            pre_filtered = self._pre_filter_articles(all_news)
+            logger.info(f"✅ Phase 2 terminée en {time.time() - phase_start:.1f}s → {len(pre_filtered)}/{len(all_news)} articles retenus ({100*len(pre_filtered)/len(all_news):.1f}%)")
+            
+            if not pre_filtered:
+                logger.warning("❌ Aucun article pertinent après pré-filtrage")
+                return []
+            
+            # Phase 3: Toutes les pages d'articles en vol simultanément
+            phase_start = time.time()
+            logger.info(f"📄 Phase 3: Extraction async de {len(pre_filtered)} articles...")
+            enhanced_news = await self._async_extract_content(engine, pre_filtered, budget.phase('extraction'))
+            logger.info(f"✅ Phase 3 terminée en {time.time() - phase_start:.1f}s → {len(enhanced_news)} articles avec contenu")
+        
+        return self._finalize_selection(enhanced_news, start_time, budget)
+    
+    def _finalize_selection(self, enhanced_news: List[NewsItem], start_time: float, budget: Optional[RunBudget] = None) -> List[NewsItem]:
+        """Phases 3.5 à 5 communes aux pipelines synchrone et asynchrone; analyse et traduction dans le budget restant"""
+        budget = budget or self._run_budget()
         # Phase 3.5: Déduplication après extraction de contenu
         phase_start = time.time()
         logger.info(f"🔄 Phase 3.5: Déduplication de {len(enhanced_news)} articles...")
@@ -111,102 +317,224 @@ class FoodIndustryNewsScraper:
         # Phase 4: Filtrage final et sélection
         phase_start = time.time()
         logger.info(f"🎯 Phase 4: Sélection finale parmi {len(deduplicated_news)} articles...")
-        selected_news = self._filter_relevant_news(deduplicated_news)
+        selected_news = self._filter_relevant_news(deduplicated_news, budget.phase('analysis'))
         logger.info(f"✅ Phase 4 terminée en {time.time() - phase_start:.1f}s → {len(selected_news)} articles sélectionnés")
+        self.score_cache.log_summary()
         
         # Phase 5: Traduire seulement les nouvelles sélectionnées
         if selected_news:
             phase_start = time.time()
             logger.info(f"🌐 Phase 5: Traduction de {len(selected_news)} articles sélectionnés...")
-            self._translate_selected_news(selected_news)
+            self._translate_selected_news(selected_news, budget.phase('translation'))
             logger.info(f"✅ Phase 5 terminée en {time.time() - phase_start:.1f}s")
         
         total_time = time.time() - start_time
         logger.info(f"🏁 SCRAPING TERMINÉ en {total_time:.1f}s → {len(selected_news)} articles finaux")
         return selected_news
     
-    def _parallel_scrape_sources(self, cutoff_date: datetime) -> List[NewsItem]:
-        """Scraper toutes les sources en parallèle"""
+    def _parallel_scrape_sources(self, cutoff_date: datetime, deadline: Deadline) -> List[NewsItem]:
+        """Scraper toutes les sources en parallèle; chaque tâche reçoit l'échéance de la phase"""
         all_news = []
         total_sources = len(self.sources)
         completed_sources = 0
         
-        logger.info(f"📡 Lancement du scraping de {total_sources} sources avec 5 workers...")
+        logger.info(f"📡 Lancement du scraping de {total_sources} sources avec 5 workers (échéance {deadline.remaining():.0f}s)...")
         
         executor = ThreadPoolExecutor(max_workers=5)
+        future_to_source = {}
         try:
-            future_to_source = {}
-            
-            # Soumettre tous les jobs
-            for source_name, source_config in self.sources.items():
+            # Soumettre tous les jobs (sauf sources mises à l'écart par le disjoncteur)
+            for source_name, source_config, timeout in self._admitted_sources():
                 logger.debug(f"   → Soumission: {source_name} ({source_config['type']})")
                 if source_config['type'] == 'rss':
-                    future = executor.submit(self._scrape_rss_basic, source_name, source_config, cutoff_date)
-                elif source_config['type'] == 'website':
-                    future = executor.submit(self._scrape_website_basic, source_name, source_config, cutoff_date)
+                    future = executor.submit(self._scrape_rss_basic, source_name, source_config, cutoff_date, deadline, timeout)
                 else:
-                    logger.warning(f"   ⚠️ Type inconnu pour {source_name}: {source_config['type']}")
-                    continue
+                    future = executor.submit(self._scrape_website_basic, source_name, source_config, cutoff_date, deadline, timeout)
                 future_to_source[future] = source_name
             
-            # Collecter les résultats avec timeout global de 60s
+            # Collecter les résultats jusqu'à l'échéance de la phase
             try:
-                for future in as_completed(future_to_source, timeout=60):
+                for future in as_completed(future_to_source, timeout=deadline.remaining()):
                     source_name = future_to_source[future]
                     completed_sources += 1
                     try:
-                        start_time = time.time()
-                        news_items = future.result(timeout=30)  # Timeout par source: 30s
-                        process_time = time.time() - start_time
+                        news_items = future.result()
                         all_news.extend(news_items)
-                        logger.info(f"✅ {source_name}: {len(news_items)} articles en {process_time:.1f}s ({completed_sources}/{total_sources})")
+                        logger.info(f"✅ {source_name}: {len(news_items)} articles à {deadline.elapsed():.1f}s ({completed_sources}/{total_sources})")
                     except Exception as e:
                         logger.error(f"❌ {source_name}: ERREUR - {str(e)} ({completed_sources}/{total_sources})")
-            except Exception as e:
-                logger.error(f"⏰ Timeout global atteint lors du scraping des sources: {str(e)}")
-                logger.info("🔍 DÉBUT annulation futures...")
-                # Annuler les futures restantes - copie pour éviter modification pendant itération
-                remaining_sources = []
-                logger.info(f"🔍 Dictionnaire futures: {len(future_to_source)} items")
-                items_list = list(future_to_source.items())
-                logger.info(f"🔍 Liste copiée: {len(items_list)} items")
-                for i, (future, source_name) in enumerate(items_list):
-                    logger.info(f"🔍 Traitement {i+1}/{len(items_list)}: {source_name}")
-                    if not future.done():
-                        try:
-                            future.cancel()
-                            remaining_sources.append(source_name)
-                            completed_sources += 1
-                            logger.info(f"🔍 Annulé: {source_name}")
-                        except Exception as e:
-                            logger.warning(f"Erreur cancel {source_name}: {e}")
-                    else:
-                        logger.info(f"🔍 Déjà terminé: {source_name}")
-                logger.info("🔍 FIN boucle annulation")
-                if remaining_sources:
-                    logger.warning(f"⏰ Sources annulées (timeout): {', '.join(remaining_sources)}")
-                logger.info("🔍 Sortie du except timeout")
-            
+            except TimeoutError:
+                remaining_sources = [name for future, name in future_to_source.items() if not future.done()]
+                logger.warning(f"⏰ Échéance de la phase atteinte ({deadline.elapsed():.0f}s), sources abandonnées: {', '.join(remaining_sources)}")
         finally:
-            # Force fermeture de tous les threads 
-            logger.info("🔍 Fermeture forcée executor...")
+            # Les jobs non démarrés sont annulés; ceux en cours voient l'échéance passée
+            # à la prochaine lecture réseau ou au prochain parsing et se terminent d'eux-mêmes
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.source_health.save()
+        
+        logger.info(f"📊 Scraping terminé: {len(all_news)} articles de {completed_sources} sources")
+        return all_news
+    
+    def _admitted_sources(self) -> List[tuple]:
+        """(nom, config, timeout) des sources à interroger, la plus longue attendue en premier;
+        timeout court pour une sonde du disjoncteur"""
+        feed_timeout = self.http_config.get('feed_timeout', 15)
+        probe_timeout = self.http_config.get('probe_timeout', 5)
+        admitted = []
+        skipped = []
+        for source_name, source_config in self.sources.items():
+            if source_config['type'] not in ('rss', 'website'):
+                logger.warning(f"   ⚠️ Type inconnu pour {source_name}: {source_config['type']}")
+                continue
+            admission = self.source_health.admission(source_name)
+            if admission == SKIP:
+                skipped.append(source_name)
+                continue
+            if admission == PROBE:
+                logger.info(f"   🔌 {source_name}: sonde ({probe_timeout}s) après mise à l'écart")
+            admitted.append((source_name, source_config, probe_timeout if admission == PROBE else feed_timeout))
+        if skipped:
+            logger.warning(f"🔌 Sources en pause (disjoncteur ouvert): {', '.join(skipped)}")
+        return self._longest_first(admitted)
+    
+    def _longest_first(self, admitted: List[tuple]) -> List[tuple]:
+        """Ordre de soumission LPT: un retardataire soumis en dernier fixe la durée de la phase 1.
+        Tranches de durée attendue décroissantes, catégorie A devant dans chaque tranche, ordre du fichier ensuite"""
+        def order(entry):
+            source_name, source_config, timeout = entry
+            expected = self.source_health.expected_duration(source_name)
+            # Sans historique, une source est supposée lente: soumise tôt plutôt que retardataire
+            expected = timeout if expected is None else min(expected, timeout)
+            return -latency_band(expected), CATEGORY_RANK.get(source_config.get('category'), len(CATEGORY_RANK))
+        ordered = sorted(admitted, key=order)
+        logger.debug(f"   Ordre de soumission: {', '.join(name for name, _, _ in ordered)}")
+        return ordered
+    
+    def _record_source_health(self, source_name: str, latency: float, error: str = "", duration: Optional[float] = None):
+        """Succès ou échec d'une source (latence réseau, durée totale avec parsing);
+        les abandons à l'échéance de la phase ne comptent pas"""
+        if error == "deadline":
+            return
+        if error:
+            self.source_health.record_failure(source_name, latency, error, duration)
+        else:
+            self.source_health.record_success(source_name, latency, duration)
+    
+    async def _async_scrape_sources(self, engine: AsyncFetchEngine, cutoff_date: datetime, deadline: Deadline) -> List[NewsItem]:
+        """Récupérer toutes les sources sur la boucle asyncio; les tâches sont annulées à l'échéance"""
+        tasks = {}
+        for source_name, source_config, timeout in self._admitted_sources():
+            task = asyncio.create_task(self._async_scrape_source(engine, source_name, source_config, cutoff_date, timeout, deadline))
+            tasks[task] = source_name
+        
+        if not tasks:
+            return []
+        
+        done, pending = await asyncio.wait(tasks.keys(), timeout=deadline.remaining())
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.warning(f"⏰ Sources annulées (échéance {deadline.elapsed():.0f}s): {', '.join(tasks[t] for t in pending)}")
+        
+        all_news = []
+        for task in done:
+            source_name = tasks[task]
             try:
-                executor.shutdown(wait=False)  # Ne pas attendre - fermeture forcée
-                logger.info("🔍 Executor fermé")
+                all_news.extend(task.result())
             except Exception as e:
-                logger.warning(f"Erreur fermeture executor: {e}")
+                logger.error(f"❌ {source_name}: ERREUR - {str(e)}")
+        self.source_health.save()
+        
+        logger.info(f"📊 Scraping async terminé: {len(all_news)} articles de {len(done)}/{len(tasks)} sources")
+        return all_news
+    
+    async def _async_scrape_source(self, engine: AsyncFetchEngine, source_name: str, config: Dict, cutoff_date: datetime, timeout: float,
+                                   deadline: Optional[Deadline] = None) -> List[NewsItem]:
+        """Récupérer une source puis parser hors de la boucle d'événements"""
+        start_time = time.time()
+        cached = None
+        headers = {}
+        if config['type'] == 'rss' and self.feed_cache:
+            cached = self.feed_cache.load(config['url'])
+            headers = self.feed_cache.conditional_headers(cached, cutoff_date)
+        
+        result = await engine.fetch(config['url'], timeout=timeout, headers=headers, max_bytes=self._max_bytes_for(source_name), deadline=deadline)
+        if not result.ok and not (result.status == 304 and cached is not None):
+            logger.error(f"❌ {source_name}: {result.error} ({result.elapsed:.1f}s)")
+            self._record_source_health(source_name, result.elapsed, result.error)
+            return []
         
-        logger.info("🔍 AVANT try final")
         try:
-            logger.info("🔍 DANS try final")
-            news_count = len(all_news) if all_news else 0
-            logger.info(f"🔍 Debug avant fin: all_news={news_count}, completed_sources={completed_sources}")
-            logger.info(f"📊 Scraping terminé: {news_count} articles de {completed_sources} sources")
+            if config['type'] == 'rss':
+                entries = await asyncio.to_thread(self._read_feed_response, source_name, config['url'], result, cached, deadline, cutoff_date)
+                news_items = self._build_rss_items(source_name, entries, cutoff_date)
+            else:
+                news_items = await asyncio.to_thread(self._parse_website_listing, source_name, config, result.content, deadline, cutoff_date)
+        except DeadlineExceeded:
+            raise
         except Exception as e:
-            logger.error(f"❌ Erreur lors du décompte final: {e}")
-            logger.info(f"📊 Scraping terminé: ? articles de {completed_sources} sources")
-        logger.info("🔍 AVANT return")
-        return all_news
+            self._record_source_health(source_name, result.elapsed, str(e) or type(e).__name__, time.time() - start_time)
+            raise
+        self._record_source_health(source_name, result.elapsed, duration=time.time() - start_time)
+        
+        logger.info(f"✅ {source_name}: {len(news_items)} articles en {result.elapsed:.1f}s")
+        return news_items
+    
+    async def _async_extract_content(self, engine: AsyncFetchEngine, articles: List[NewsItem], deadline: Deadline) -> List[NewsItem]:
+        """Télécharger toutes les pages en parallèle puis extraire le contenu hors de la boucle"""
+        article_timeout = self.http_config.get('article_timeout', 10)
+        
+        tasks = {
+            asyncio.create_task(self._async_extract_article(engine, article, article_timeout, deadline)): article
+            for article in sorted(articles, key=self._expected_value, reverse=True)
+        }
+        done, pending = await asyncio.wait(tasks.keys(), timeout=deadline.remaining())
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.error(f"Échéance atteinte ({deadline.elapsed():.0f}s) pour extraction de contenu: {len(pending)} articles en fallback")
+        
+        enhanced = []
+        successful_extractions = 0
+        for task, article in tasks.items():
+            if task in done and not task.exception():
+                enhanced.append(task.result())
+                successful_extractions += 1
+            else:
+                # Fallback avec résumé RSS
+                article.full_text = article.summary or ""
+                article.relevance_score = self._calculate_unified_score(article, include_full_text=False)
+                enhanced.append(article)
+        
+        self.host_limiter.log_summary()
+        if self.article_store:
+            self.article_store.log_summary()
+        logger.info(f"📊 Extraction async terminée: {successful_extractions} réussies, {len(enhanced) - successful_extractions} fallbacks sur {len(articles)} articles")
+        return enhanced
+    
+    async def _async_extract_article(self, engine: AsyncFetchEngine, item: NewsItem, timeout: float, deadline: Optional[Deadline] = None) -> NewsItem:
+        """Télécharger une page une seule fois puis extraire contenu et image dans un thread"""
+        if self._restore_from_store(item):
+            return item
+        if self._has_rich_summary(item):
+            head_html, content_type = b"", ""
+            if self._needs_head_metadata(item):
+                async with self.host_limiter.aslot(item.url, timeout=deadline.remaining() if deadline else None) as slot:
+                    result = await engine.fetch_head(item.url, max_bytes=self.extraction_config.get('head_max_bytes', 65536), timeout=timeout, deadline=deadline)
+                    slot.observe(result.status, result.error, result.header('Retry-After'))
+                if result.ok:
+                    head_html, content_type = result.content, result.header('Content-Type')
+            item = await asyncio.to_thread(self._apply_head_metadata, item, head_html, content_type)
+            return await asyncio.to_thread(self._store_article, item)
+        
+        async with self.host_limiter.aslot(item.url, timeout=deadline.remaining() if deadline else None) as slot:
+            result = await engine.fetch(item.url, timeout=timeout, max_bytes=self._max_bytes_for(item.source), deadline=deadline)
+            slot.observe(result.status, result.error, result.header('Retry-After'))
+        html = result.content if result.ok else b""
+        extracted = await asyncio.to_thread(self._extract_article_page, item, html, result.header('Content-Type'), deadline)
+        return await asyncio.to_thread(self._store_article, item) if extracted else item
     
     def _pre_filter_articles(self, articles: List[NewsItem]) -> List[NewsItem]:
         """Pré-filtrage optimisé en cascade pour réduire la charge"""
@@ -219,14 +547,13 @@ class FoodIndustryNewsScraper:
         rapid_filtered = self._rapid_keyword_filter(articles)
         logger.info(f"   → Filtre rapide: {len(rapid_filtered)}/{len(articles)} articles retenus")
         
-        # Étape 2: Priorisation par source et fraîcheur
-        priority_filtered = self._priority_filter(rapid_filtered)
+        # Étape 2: Priorisation par source et fraîcheur (sans troncature si le scoring par lot est disponible)
+        priority_filtered = self._priority_filter(rapid_filtered, truncate=self.batch_scorer is None)
         logger.info(f"   → Filtre priorité: {len(priority_filtered)}/{len(rapid_filtered)} articles retenus")
         
-        # Étape 3: Scoring complet sur un nombre réduit d'articles
+        # Étape 3: Scoring complet des articles retenus, par lot
         scored_articles = []
-        for item in priority_filtered:
-            score = self._calculate_unified_score(item, include_full_text=False)
+        for item, score in zip(priority_filtered, self._score_batch(priority_filtered, include_full_text=False)):
             if score > 0:
                 item.relevance_score = score
                 scored_articles.append(item)
@@ -250,159 +577,209 @@ class FoodIndustryNewsScraper:
     
     def _rapid_keyword_filter(self, articles: List[NewsItem]) -> List[NewsItem]:
         """Filtrage ultra-rapide par mots-clés critiques FLB"""
-        critical_keywords = [
-            # Priorité 1: Importation et commerce international
-            'importation', 'import', 'douane', 'international', 'tarif',
-            # Priorité 2: Distribution et concurrence
-            'distributeur', 'grossiste', 'distribution', 'wholesale', 'sysco',
-            # Priorité 3: Restauration (clientèle principale)
-            'restaurant', 'restauration', 'foodservice', 'service alimentaire', 'chef',
-            # Priorité 4: Hôtellerie (clientèle importante)
-            'hôtel', 'hôtellerie', 'horeca', 'tourisme', 'hébergement',
-            # Priorité 5: Proximité géographique (région de Québec)
-            'ville de québec', 'quebec city', 'capitale-nationale', 'beauport', 'lévis',
-            'sainte-foy', 'charlesbourg', 'ancienne-lorette',
-            # Priorité 6: Province de Québec élargie
-            'québec', 'quebec', 'montréal', 'montreal', 'sherbrooke', 'gatineau',
-            # Mots génériques importants
-            'alimentaire', 'food', 'prix', 'coût'
-        ]
-        
         filtered = []
         for article in articles:
-            text = (article.title + " " + article.summary).lower()
+            matches = self.keyword_matcher.scan((article.title + " " + article.summary).lower())
             
             # Au moins 1 mot-clé critique requis
-            if any(keyword in text for keyword in critical_keywords):
+            if matches.any_of('critical'):
                 filtered.append(article)
         
         return filtered
     
-    def _priority_filter(self, articles: List[NewsItem]) -> List[NewsItem]:
+    def _priority_filter(self, articles: List[NewsItem], truncate: bool = True) -> List[NewsItem]:
         """Filtrage par catégorie de source et fraîcheur"""
-        # Mapper les sources par catégorie de priorité
-        category_priority = {'A': 5, 'B': 4, 'C': 3, 'D': 2, 'E': 1}
-        
         # Enrichir avec score de priorité
         for article in articles:
-            source_config = self.sources.get(article.source, {})
-            category = source_config.get('category', 'E')
-            
-            # Score de priorité = catégorie + fraîcheur
-            category_score = category_priority.get(category, 1)
-            
-            # Bonus de fraîcheur (articles récents prioritaires)
-            freshness_score = 0
-            if article.published_date:
-                days_old = (datetime.now() - article.published_date).days
-                freshness_score = max(0, 3 - days_old)  # 3 points si aujourd'hui, 0 si > 3 jours
-            
-            article.priority_score = category_score + freshness_score
+            article.priority_score = self._priority_score(article)
         
         # Trier par priorité et prendre le top 30% ou minimum 20 articles
         articles.sort(key=lambda x: getattr(x, 'priority_score', 0), reverse=True)
+        if not truncate:
+            return articles
         
         target_count = max(20, len(articles) // 3)  # Au moins 20 articles ou 30% du total
         return articles[:target_count]
     
-    def _parallel_extract_content(self, articles: List[NewsItem]) -> List[NewsItem]:
-        """Extraire le contenu complet en parallèle pour articles pré-filtrés avec timeout global"""
+    def _expected_value(self, article: NewsItem) -> float:
+        """Valeur attendue d'un article à extraire: pré-score x poids de la catégorie de la source"""
+        category = self.sources.get(article.source, {}).get('category', 'E')
+        return article.relevance_score * CATEGORY_WEIGHT.get(category, CATEGORY_WEIGHT['E'])
+    
+    def _priority_score(self, article: NewsItem) -> float:
+        """Score de priorité = catégorie de la source + fraîcheur"""
+        category_priority = {'A': 5, 'B': 4, 'C': 3, 'D': 2, 'E': 1}
+        category = self.sources.get(article.source, {}).get('category', 'E')
+        category_score = category_priority.get(category, 1)
+        
+        # Bonus de fraîcheur (articles récents prioritaires)
+        freshness_score = 0
+        if article.published_date:
+            days_old = (datetime.now() - article.published_date).days
+            freshness_score = max(0, 3 - days_old)  # 3 points si aujourd'hui, 0 si > 3 jours
+        return category_score + freshness_score
+    
+    def _parallel_extract_content(self, articles: List[NewsItem], deadline: Deadline) -> List[NewsItem]:
+        """Extraire le contenu complet en parallèle pour articles pré-filtrés, jusqu'à l'échéance de la phase"""
         start_time = time.time()
         total_articles = len(articles)
         completed_articles = 0
         successful_extractions = 0
         
-        logger.info(f"📄 Extraction parallèle de {total_articles} articles avec 8 workers (timeout: 120s)...")
+        max_workers = self.host_limiter.global_limit
+        logger.info(f"📄 Extraction parallèle de {total_articles} articles avec {max_workers} workers, concurrence adaptative par hôte (échéance {deadline.remaining():.0f}s)...")
         
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            future_to_article = {}
-            
-            # Soumettre tous les jobs d'extraction
-            for i, article in enumerate(articles):
+        enhanced = []
+        collected = set()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        future_to_article = {}
+        try:
+            # Meilleure valeur attendue en premier: à l'échéance, seuls les moins prometteurs restent en repli
+            for i, article in enumerate(sorted(articles, key=self._expected_value, reverse=True)):
                 logger.debug(f"   → Soumission extraction {i+1}/{total_articles}: {article.title[:50]}...")
-                future = executor.submit(self._extract_and_enhance_article, article)
+                future = executor.submit(self._extract_and_enhance_article, article, deadline)
                 future_to_article[future] = article
             
-            enhanced = []
-            # Timeout global pour éviter blocage indéfini
-            timeout_seconds = 120  # 2 minutes maximum pour tous les articles
-            
             try:
-                for future in as_completed(future_to_article, timeout=timeout_seconds):
+                for future in as_completed(future_to_article, timeout=deadline.remaining()):
                     completed_articles += 1
-                    elapsed = time.time() - start_time
                     try:
-                        article_start = time.time()
-                        enhanced_article = future.result(timeout=10)  # 10s par article max
-                        article_time = time.time() - article_start
+                        enhanced_article = future.result()
                         if enhanced_article:
                             enhanced.append(enhanced_article)
+                            collected.add(future)
                             successful_extractions += 1
-                            logger.info(f"✅ Extraction #{completed_articles}/{total_articles}: {enhanced_article.title[:30]}... ({article_time:.1f}s, {elapsed:.1f}s total)")
+                            logger.info(f"✅ Extraction #{completed_articles}/{total_articles}: {enhanced_article.title[:30]}... ({time.time() - start_time:.1f}s total)")
                     except Exception as e:
-                        # Récupérer l'article original pour fallback
                         original_article = future_to_article[future]
                         logger.warning(f"❌ Extraction #{completed_articles}/{total_articles} échouée: {original_article.title[:30]}... - {str(e)}")
-                        # Utiliser fallback avec résumé RSS
-                        original_article.full_text = original_article.summary or ""
-                        original_article.relevance_score = self._calculate_unified_score(original_article, include_full_text=False)
-                        enhanced.append(original_article)
-                        
             except TimeoutError:
-                logger.error(f"Timeout global atteint ({timeout_seconds}s) pour extraction de contenu")
-                # Annuler les futures en attente et utiliser fallback
-                for future, article in future_to_article.items():
-                    if not future.done():
-                        future.cancel()
-                        # Ajouter avec fallback
-                        article.full_text = article.summary or ""
-                        article.relevance_score = self._calculate_unified_score(article, include_full_text=False)
-                        enhanced.append(article)
-                        logger.warning(f"Fallback utilisé pour {article.url} (timeout)")
+                logger.error(f"Échéance atteinte ({deadline.elapsed():.0f}s) pour extraction de contenu")
+        finally:
+            # Annuler les jobs non démarrés; les jobs en cours abandonnent à l'échéance
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        # Fallback avec résumé RSS, une fois tous les threads terminés (pas d'écriture concurrente)
+        for future, article in future_to_article.items():
+            if future in collected:
+                continue
+            if future.done() and not future.cancelled() and future.exception() is None and future.result():
+                enhanced.append(future.result())
+                successful_extractions += 1
+                continue
+            article.full_text = article.summary or ""
+            article.relevance_score = self._calculate_unified_score(article, include_full_text=False)
+            enhanced.append(article)
+            logger.debug(f"Fallback utilisé pour {article.url}")
         
         total_time = time.time() - start_time
+        self.host_limiter.log_summary()
+        if self.article_store:
+            self.article_store.log_summary()
         logger.info(f"📊 Extraction terminée en {total_time:.1f}s: {successful_extractions} réussies, {len(enhanced) - successful_extractions} fallbacks sur {total_articles} articles")
         return enhanced
     
-    def _extract_and_enhance_article(self, item: NewsItem) -> Optional[NewsItem]:
-        """Extraire contenu complet et image pour un article avec fallback robuste"""
-        try:
-            # Extraire contenu complet
-            full_content = self._extract_article_content(item.url)
-            if full_content:
-                item.full_text = full_content
-                # Améliorer le résumé si nécessaire
-                if len(item.summary) < 600:
-                    item.summary = full_content[:1800]
-                logger.debug(f"Contenu extrait avec succès pour {item.url}")
-            else:
-                # Fallback : garder le résumé RSS existant
-                logger.warning(f"Extraction contenu échouée pour {item.url}, conservation résumé RSS")
-                item.full_text = item.summary  # Utiliser le résumé comme contenu
-            
-            # Extraire image si pas déjà présente
-            if not item.image_url:
-                try:
-                    item.image_url = self._extract_image_from_article(item.url)
-                except Exception as img_e:
-                    logger.debug(f"Extraction image échouée pour {item.url}: {img_e}")
-                    # Pas critique, continuer sans image
-            
-            # Recalculer le score avec le contenu complet maintenant disponible
-            item.relevance_score = self._calculate_unified_score(item, include_full_text=True)
-            
-            return item
-            
-        except Exception as e:
-            logger.error(f"Erreur critique lors de l'amélioration de l'article {item.url}: {str(e)}")
-            # Fallback ultime : retourner l'article avec résumé RSS seulement
-            item.full_text = item.summary or ""
-            item.relevance_score = self._calculate_unified_score(item, include_full_text=False)
+    def _extract_and_enhance_article(self, item: NewsItem, deadline: Optional[Deadline] = None) -> Optional[NewsItem]:
+        """Télécharger la page une seule fois puis extraire contenu, image et métadonnées"""
+        if self._restore_from_store(item):
             return item
+        if self._has_rich_summary(item):
+            return self._store_article(self._enhance_article_from_head(item, deadline))
+        if deadline is not None:
+            deadline.check()
+        with self.host_limiter.slot(item.url, timeout=deadline.remaining() if deadline else None) as slot:
+            result = self.http.fetch(item.url, max_bytes=self._max_bytes_for(item.source), deadline=deadline)
+            slot.observe(result.status, result.error, result.header('Retry-After'))
+        if not result.ok:
+            logger.debug(f"Téléchargement échoué pour {item.url}: {result.error}")
+            return self._enhance_article_from_html(item, b"", result.header('Content-Type'), deadline)
+        if self._extract_article_page(item, result.content, result.header('Content-Type'), deadline):
+            return self._store_article(item)
+        return item  # Repli sur le résumé: retenté à la prochaine exécution
+    
+    def _restore_from_store(self, item: NewsItem) -> bool:
+        """Reprendre texte, image et métadonnées d'un article extrait lors d'une exécution précédente"""
+        record = self.article_store.get(item.url) if self.article_store else None
+        if record is None:
+            return False
+        item.full_text = record['full_text'] or item.summary
+        if len(item.summary) < len(record['summary']):
+            item.summary = record['summary']
+        if not item.image_url:
+            item.image_url = record['image_url']
+        item.canonical_url = record['canonical_url'] or item.canonical_url
+        # Les sources 'website' n'ont de date réelle qu'après extraction
+        if record['published'] and self.sources.get(item.source, {}).get('type') == 'website':
+            item.published_date = datetime.fromisoformat(record['published'])
+        item.relevance_score = self._calculate_unified_score(item, include_full_text=True)
+        logger.debug(f"Article repris du magasin local: {item.url}")
+        return True
     
-    def _translate_selected_news(self, selected_news: List[NewsItem]):
-        """Traduire les articles sélectionnés avec protection double traduction"""
-        for item in selected_news:
+    def _store_article(self, item: NewsItem) -> NewsItem:
+        """Mémoriser un article dont la page a été extraite, ou au résumé riche délibéré;
+        les replis sur le résumé (timeout, échec de téléchargement ou de parsing) n'arrivent jamais ici"""
+        if self.article_store and item is not None and item.full_text:
+            try:
+                self.article_store.put(item)
+            except Exception as e:
+                logger.warning(f"Magasin d'articles: écriture impossible pour {item.url}: {e}")
+        if self.analyzer and self.analyzer.bm25 and item is not None and item.full_text:
+            # Statistiques BM25 alimentées dès l'extraction (même document que l'analyse par lot)
+            try:
+                self.analyzer.bm25.ingest([f"{item.title} {item.summary} {item.full_text}"])
+            except Exception as e:
+                logger.warning(f"Corpus BM25: ajout impossible pour {item.url}: {e}")
+        return item
+    
+    def _canonicalize_articles(self, articles: List[NewsItem], deadline: Optional[Deadline] = None) -> List[NewsItem]:
+        """Retirer le suivi, résoudre les redirecteurs (cache persistant) et fusionner les doublons d'URL"""
+        if not self.url_canonicalizer:
+            return articles
+        start_time = time.time()
+        timeout = self.http_config.get('redirect_timeout', 5)
+        
+        def resolve(url: str) -> str:
+            return self.http.resolve_redirect(url, timeout=timeout, deadline=deadline)
+        
+        # Redirecteurs inconnus du cache résolus en parallèle; les autres URLs sont réécrites sans réseau
+        pending = {item.url for item in articles if is_redirect_wrapper(item.url) and self.url_canonicalizer.cached_target(item.url) is None}
+        canonical = {}
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+                for url, target in zip(pending, executor.map(lambda u: self.url_canonicalizer.canonical(u, resolve), pending)):
+                    canonical[url] = target
+        
+        unique = {}
+        for item in articles:
+            item.url = canonical.get(item.url) or self.url_canonicalizer.canonical(item.url)
+            key = url_key(item.url)
+            kept = unique.get(key)
+            if kept is None:
+                unique[key] = item
+                continue
+            # Doublon: garder la première occurrence, compléter avec la variante https et l'image
+            if kept.url.startswith('http://') and item.url.startswith('https://'):
+                kept.url = item.url
+            if not kept.image_url:
+                kept.image_url = item.image_url
+            if len(item.summary) > len(kept.summary):
+                kept.summary = item.summary
+        
+        self.url_canonicalizer.save()
+        logger.info(f"🔗 URLs canoniques: {len(articles) - len(unique)} doublons fusionnés, {self.url_canonicalizer.resolved} redirections résolues, "
+                    f"{self.url_canonicalizer.cache_hits} en cache ({time.time() - start_time:.1f}s)")
+        return list(unique.values())
+    
+    def _max_bytes_for(self, source_name: str) -> int:
+        """Plafond d'octets par réponse: 'max_bytes' de la source, sinon HTTP_CONFIG"""
+        return self.sources.get(source_name, {}).get('max_bytes') or self.http.max_bytes
+    
+    def _translate_selected_news(self, selected_news: List[NewsItem], deadline: Optional[Deadline] = None):
+        """Traduire les articles sélectionnés (dans l'ordre de la sélection) avec protection double traduction"""
+        for position, item in enumerate(selected_news):
+            if deadline is not None and deadline.expired:
+                logger.warning(f"⏰ Budget de traduction épuisé: {len(selected_news) - position} articles laissés dans leur langue d'origine")
+                break
             if not item.is_translated:  # Éviter double traduction
                 original_title = item.title
                 original_summary = item.summary
@@ -424,68 +801,157 @@ class FoodIndustryNewsScraper:
                 else:
                     logger.debug(f"Article déjà en français: {item.title[:50]}...")
     
-    def _scrape_rss_basic(self, source_name: str, config: Dict, cutoff_date: datetime) -> List[NewsItem]:
-        """Scraping RSS basique sans extraction de contenu complet"""
-        news_items = []
+    def _scrape_rss_basic(self, source_name: str, config: Dict, cutoff_date: datetime, deadline: Optional[Deadline] = None,
+                          timeout: Optional[float] = None) -> List[NewsItem]:
+        """Scraping RSS basique sans extraction de contenu complet (GET conditionnel)"""
+        start_time = time.time()
         try:
-            feed = feedparser.parse(config['url'])
-            
-            for entry in feed.entries[:20]:
-                try:
-                    published = datetime(*entry.published_parsed[:6]) if hasattr(entry, 'published_parsed') else datetime.now()
-                    
-                    if published < cutoff_date:
-                        continue
-                    
-                    # Utiliser seulement le résumé RSS pour le pré-filtrage
-                    summary = entry.get('summary', '')[:1800]
-                    
-                    # Extraire l'image depuis le flux RSS seulement
-                    image_url = ""
-                    # Chercher dans les enclosures
-                    if hasattr(entry, 'enclosures') and entry.enclosures:
-                        for enclosure in entry.enclosures:
-                            if 'image' in enclosure.get('type', ''):
-                                image_url = enclosure.get('href', '')
-                                break
-                    # Chercher dans media:content ou media:thumbnail
-                    if not image_url:
-                        if hasattr(entry, 'media_content') and entry.media_content:
-                            image_url = entry.media_content[0].get('url', '')
-                        elif hasattr(entry, 'media_thumbnail') and entry.media_thumbnail:
-                            image_url = entry.media_thumbnail[0].get('url', '')
-                    
-                    # Calculer hash pour déduplication
-                    content_hash = self._calculate_content_hash(entry.title, entry.link)
-                    
-                    news_item = NewsItem(
-                        title=entry.title,
-                        url=entry.link,
-                        source=source_name,
-                        published_date=published,
-                        summary=summary,
-                        full_text="",  # Sera rempli plus tard lors de l'extraction parallèle
-                        image_url=image_url,
-                        content_hash=content_hash
-                    )
-                    
-                    news_items.append(news_item)
-                    
-                except Exception as e:
-                    logger.warning(f"Error processing entry from {source_name}: {str(e)}")
-                    
+            cached = self.feed_cache.load(config['url']) if self.feed_cache else None
+            headers = self.feed_cache.conditional_headers(cached, cutoff_date) if self.feed_cache else {}
+            result = self.http.fetch(config['url'], max_bytes=self._max_bytes_for(source_name),
+                                     timeout=timeout or self.http_config.get('feed_timeout', 15), headers=headers, deadline=deadline)
+            if not result.ok and not (result.status == 304 and cached is not None):
+                logger.error(f"Error fetching RSS feed {config['url']}: {result.error}")
+                self._record_source_health(source_name, result.elapsed, result.error)
+                return []
+            entries = self._read_feed_response(source_name, config['url'], result, cached, deadline, cutoff_date)
+            news_items = self._build_rss_items(source_name, entries, cutoff_date)
+            self._record_source_health(source_name, result.elapsed, duration=time.time() - start_time)
+            return news_items
+        except DeadlineExceeded as e:
+            logger.warning(f"⏰ {source_name}: {e}")
+            return []
         except Exception as e:
             logger.error(f"Error parsing RSS feed {config['url']}: {str(e)}")
+            self._record_source_health(source_name, time.time() - start_time, str(e) or type(e).__name__)
+            return []
+    
+    def _read_feed_response(self, source_name: str, url: str, result: FetchResult, cached: Optional[Dict],
+                            deadline: Optional[Deadline] = None, cutoff_date: Optional[datetime] = None) -> List[Dict]:
+        """Réutiliser les entrées cachées sur 304, sinon parser et mettre le cache à jour"""
+        if result.status == 304 and cached is not None:
+            self.feed_cache.record(not_modified=True)
+            logger.debug(f"   ↺ {source_name}: flux inchangé (304), {len(cached.get('entries', []))} entrées en cache")
+            return cached.get('entries', [])
+        
+        if deadline is not None:
+            deadline.check()
+        if result.truncated:
+            logger.warning(f"   ✂️ {source_name}: flux tronqué à {len(result.content)} octets")
+        # Parseur iterparse rapide (arrêt au quota ou à la date limite); feedparser pour les flux mal formés
+        entries = parse_feed(result.content, FEED_MAX_ENTRIES, cutoff_date) if self.http_config.get('fast_feed_parser', True) else None
+        stopped_at = cutoff_date if entries is not None else None  # Une fenêtre plus large devra relire le flux
+        if entries is None:
+            feed = feedparser.parse(result.content, response_headers={'content-type': result.header('Content-Type')})
+            entries = self._normalize_feed_entries(source_name, feed)
+        self.feed_hints[source_name] = parse_feed_hints(result.content)
+        if self.feed_cache:
+            self.feed_cache.record(not_modified=False)
+            self.feed_cache.store(url, dict(result.headers), entries, stopped_at)
+        return entries
+    
+    def _normalize_feed_entries(self, source_name: str, feed) -> List[Dict]:
+        """Réduire les entrées feedparser aux champs utilisés (format sérialisable pour le cache)"""
+        entries = []
+        for entry in feed.entries[:FEED_MAX_ENTRIES]:
+            try:
+                published = datetime(*entry.published_parsed[:6]) if hasattr(entry, 'published_parsed') else None
+                
+                # Extraire l'image depuis le flux RSS seulement
+                image_url = ""
+                # Chercher dans les enclosures
+                if hasattr(entry, 'enclosures') and entry.enclosures:
+                    for enclosure in entry.enclosures:
+                        if 'image' in enclosure.get('type', ''):
+                            image_url = enclosure.get('href', '')
+                            break
+                # Chercher dans media:content ou media:thumbnail
+                if not image_url:
+                    if hasattr(entry, 'media_content') and entry.media_content:
+                        image_url = entry.media_content[0].get('url', '')
+                    elif hasattr(entry, 'media_thumbnail') and entry.media_thumbnail:
+                        image_url = entry.media_thumbnail[0].get('url', '')
+                
+                entries.append({
+                    'title': entry.title,
+                    'link': entry.link,
+                    # Utiliser seulement le résumé RSS pour le pré-filtrage (texte brut, comme le parseur rapide)
+                    'summary': html_to_text(entry.get('summary', ''))[:1800],
+                    'published': published.isoformat() if published else None,
+                    'image_url': image_url
+                })
+                
+            except Exception as e:
+                logger.warning(f"Error processing entry from {source_name}: {str(e)}")
+        
+        return entries
+    
+    def _build_rss_items(self, source_name: str, entries: List[Dict], cutoff_date: datetime) -> List[NewsItem]:
+        """Construire les NewsItems depuis des entrées normalisées"""
+        news_items = []
+        for entry in entries:
+            try:
+                published = datetime.fromisoformat(entry['published']) if entry.get('published') else datetime.now()
+                
+                if published < cutoff_date:
+                    continue
+                
+                # Calculer hash pour déduplication
+                content_hash = self._calculate_content_hash(entry['title'], entry['link'])
+                
+                news_item = NewsItem(
+                    title=entry['title'],
+                    url=entry['link'],
+                    source=source_name,
+                    published_date=published,
+                    summary=entry.get('summary', ''),
+                    full_text="",  # Sera rempli plus tard lors de l'extraction parallèle
+                    image_url=entry.get('image_url', ''),
+                    content_hash=content_hash
+                )
+                
+                news_items.append(news_item)
+                
+            except Exception as e:
+                logger.warning(f"Error processing entry from {source_name}: {str(e)}")
             
         return news_items
     
-    def _scrape_website_basic(self, source_name: str, config: Dict, cutoff_date: datetime) -> List[NewsItem]:
+    def _scrape_website_basic(self, source_name: str, config: Dict, cutoff_date: datetime, deadline: Optional[Deadline] = None,
+                              timeout: Optional[float] = None) -> List[NewsItem]:
         """Scraping website basique sans extraction de contenu complet"""
+        start_time = time.time()
+        try:
+            result = self.http.fetch(config['url'], max_bytes=self._max_bytes_for(source_name),
+                                     timeout=timeout or self.http_config.get('feed_timeout', 15), deadline=deadline)
+            if not result.ok:
+                logger.error(f"Error scraping website {config['url']}: {result.error}")
+                self._record_source_health(source_name, result.elapsed, result.error)
+                return []
+            news_items = self._parse_website_listing(source_name, config, result.content, deadline, cutoff_date)
+            self._record_source_health(source_name, result.elapsed, duration=time.time() - start_time)
+            return news_items
+        except DeadlineExceeded as e:
+            logger.warning(f"⏰ {source_name}: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Error scraping website {config['url']}: {str(e)}")
+            self._record_source_health(source_name, time.time() - start_time, str(e) or type(e).__name__)
+            return []
+    
+    def _parse_website_listing(self, source_name: str, config: Dict, content: bytes, deadline: Optional[Deadline] = None,
+                               cutoff_date: Optional[datetime] = None) -> List[NewsItem]:
+        """Extraire les liens d'articles d'une page de listing déjà téléchargée"""
+        if deadline is not None:
+            deadline.check()
+        if self.extraction_config.get('structured_listings', True):
+            entries = self._structured_listing_entries(source_name, config, content, deadline, cutoff_date)
+            if entries:
+                # Dates et descriptions réelles: les articles périmés tombent dès maintenant
+                return self._build_rss_items(source_name, entries, cutoff_date or datetime.min)
         news_items = []
         try:
-            response = requests.get(config['url'], timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'lxml')
+            soup = BeautifulSoup(content, 'lxml')
             
             articles = soup.select(config.get('article_selector', 'article'))[:20]
             
@@ -525,77 +991,149 @@ class FoodIndustryNewsScraper:
                     logger.warning(f"Error processing article from {source_name}: {str(e)}")
                     
         except Exception as e:
-            logger.error(f"Error scraping website {config['url']}: {str(e)}")
+            logger.error(f"Error parsing website listing {config['url']}: {str(e)}")
             
         return news_items
     
-    def _extract_article_content(self, url: str) -> str:
+    def _structured_listing_entries(self, source_name: str, config: Dict, content: bytes, deadline: Optional[Deadline] = None,
+                                    cutoff_date: Optional[datetime] = None) -> List[Dict]:
+        """JSON-LD de la page, sinon flux RSS/Atom ou sitemap news (configuré ou annoncé par la page)"""
+        listing = extract_listing(content, config['url'], FEED_MAX_ENTRIES)
+        if listing.entries:
+            logger.debug(f"   🧩 {source_name}: {len(listing.entries)} entrées JSON-LD")
+            return listing.entries
+        
+        feed_url = config.get('feed_url') or listing.feed_url
+        sitemap_url = config.get('sitemap_url') or listing.sitemap_url
         try:
-            article = Article(url)
-            article.download()
-            article.parse()
-            return article.text
-        except:
+            if feed_url:
+                # Flux découvert: même chemin que les sources RSS (GET conditionnel, parseur rapide)
+                cached = self.feed_cache.load(feed_url) if self.feed_cache else None
+                headers = self.feed_cache.conditional_headers(cached, cutoff_date) if self.feed_cache else {}
+                result = self.http.fetch(feed_url, max_bytes=self._max_bytes_for(source_name),
+                                         timeout=self.http_config.get('feed_timeout', 15), headers=headers, deadline=deadline)
+                if result.ok or (result.status == 304 and cached is not None):
+                    entries = self._read_feed_response(source_name, feed_url, result, cached, deadline, cutoff_date)
+                    logger.debug(f"   🧩 {source_name}: {len(entries)} entrées du flux {feed_url}")
+                    return entries
+            if sitemap_url:
+                result = self.http.fetch(sitemap_url, max_bytes=self._max_bytes_for(source_name),
+                                         timeout=self.http_config.get('feed_timeout', 15), deadline=deadline)
+                if result.ok:
+                    entries = parse_news_sitemap(result.content, FEED_MAX_ENTRIES)
+                    logger.debug(f"   🧩 {source_name}: {len(entries)} entrées du sitemap {sitemap_url}")
+                    return entries
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            logger.warning(f"Listing structuré indisponible pour {source_name}: {e}")
+        return []
+    
+    def _has_rich_summary(self, item: NewsItem) -> bool:
+        """Le résumé RSS est-il assez riche pour servir de contenu complet?"""
+        rich_chars = self.extraction_config.get('rich_summary_chars', 1000)
+        return bool(rich_chars) and len(item.summary) >= rich_chars
+    
+    def _needs_head_metadata(self, item: NewsItem) -> bool:
+        """Image manquante, ou source 'website' sans date réelle"""
+        return not item.image_url or self.sources.get(item.source, {}).get('type') == 'website'
+    
+    def _enhance_article_from_head(self, item: NewsItem, deadline: Optional[Deadline] = None) -> NewsItem:
+        """Résumé riche: contenu = résumé, image et date lues dans le <head> seulement"""
+        head_html, content_type = b"", ""
+        if self._needs_head_metadata(item):
             try:
-                response = requests.get(url, timeout=10)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'lxml')
-                
-                for script in soup(["script", "style"]):
-                    script.decompose()
-                    
-                text = soup.get_text()
-                lines = (line.strip() for line in text.splitlines())
-                chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-                text = ' '.join(chunk for chunk in chunks if chunk)
-                
-                return text[:5000]  # Augmenter pour avoir plus de contenu
-            except:
-                return ""
+                with self.host_limiter.slot(item.url, timeout=deadline.remaining() if deadline else None) as slot:
+                    try:
+                        head_html, content_type = self.http.fetch_head(
+                            item.url, max_bytes=self.extraction_config.get('head_max_bytes', 65536), deadline=deadline
+                        )
+                    except requests.HTTPError as e:
+                        # Même signal que le téléchargement complet: 429/503 et Retry-After ralentissent l'hôte
+                        slot.observe(e.response.status_code, f"HTTP {e.response.status_code}", e.response.headers.get('Retry-After', ''))
+                        raise
+                    except (requests.Timeout, DeadlineExceeded):
+                        slot.observe(error="deadline" if deadline is not None and deadline.expired else "timeout")
+                        raise
+            except Exception as e:
+                logger.debug(f"Lecture du <head> échouée pour {item.url}: {e}")
+        return self._apply_head_metadata(item, head_html, content_type)
     
-    def _extract_image_from_article(self, url: str) -> str:
-        """Extraire l'image principale d'un article"""
-        try:
-            # D'abord essayer avec newspaper3k
-            article = Article(url)
-            article.download()
-            article.parse()
-            if article.top_image:
-                return article.top_image
-        except:
-            pass
-        
-        # Si \u00e7a ne marche pas, essayer avec BeautifulSoup
+    def _apply_head_metadata(self, item: NewsItem, head_html: bytes, content_type: str = "") -> NewsItem:
+        item.full_text = item.summary
+        if head_html:
+            page = self.extractor.extract_head(item.url, head_html, content_type)
+            if not item.image_url:
+                item.image_url = page.top_image
+            if page.canonical_url:
+                item.canonical_url = page.canonical_url
+            if page.published_date and self.sources.get(item.source, {}).get('type') == 'website':
+                item.published_date = page.published_date
+        item.relevance_score = self._calculate_unified_score(item, include_full_text=True)
+        return item
+    
+    def _extract_page(self, url: str, html: bytes, content_type: str = "", deadline: Optional[Deadline] = None):
+        """Extraction unifiée, dans le pool de processus si EXTRACTION_CONFIG 'parse_workers' > 0"""
+        workers = self.extraction_config.get('parse_workers', 0)
+        if not workers:
+            return self.extractor.extract(url, html, content_type)
+        with self._parse_pool_lock:
+            if self._parse_pool is None:
+                self._parse_pool = ParsePool(self.extractor, workers)
+        return self._parse_pool.extract(url, html, content_type, timeout=deadline.remaining() if deadline else None)
+    
+    def close(self):
+        """Libérer le pool de parsing (processus de travail); un scraper réutilisé le recrée à la demande"""
+        with self._parse_pool_lock:
+            pool, self._parse_pool = self._parse_pool, None
+        if pool is not None:
+            pool.close()
+    
+    def _enhance_article_from_html(self, item: NewsItem, html: bytes, content_type: str = "", deadline: Optional[Deadline] = None) -> NewsItem:
+        """Appliquer l'extraction unifiée (une seule passe) à une page déjà téléchargée"""
+        self._extract_article_page(item, html, content_type, deadline)
+        return item
+    
+    def _extract_article_page(self, item: NewsItem, html: bytes, content_type: str = "", deadline: Optional[Deadline] = None) -> bool:
+        """Extraction unifiée appliquée à l'article; False si le texte de la page n'a pas été obtenu (repli sur le résumé)"""
+        if deadline is not None:
+            deadline.check()  # Échéance passée: l'appelant bascule sur le résumé
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'lxml')
+            page = self._extract_page(item.url, html, content_type, deadline)
+            if page.text:
+                item.full_text = page.text
+                # Améliorer le résumé si nécessaire
+                if len(item.summary) < 600:
+                    item.summary = page.text[:1800]
+                logger.debug(f"Contenu extrait avec succès pour {item.url}")
+            else:
+                # Fallback : garder le résumé RSS existant
+                logger.warning(f"Extraction contenu échouée pour {item.url}, conservation résumé RSS")
+                item.full_text = item.summary  # Utiliser le résumé comme contenu
             
-            # Chercher Open Graph image
-            og_image = soup.find('meta', property='og:image')
-            if og_image and og_image.get('content'):
-                return og_image['content']
+            # Image et métadonnées issues de la même passe
+            if not item.image_url:
+                item.image_url = page.top_image
+            if page.canonical_url:
+                item.canonical_url = page.canonical_url
+            # Les sources 'website' n'ont pas de date réelle avant l'extraction
+            if page.published_date and self.sources.get(item.source, {}).get('type') == 'website':
+                item.published_date = page.published_date
             
-            # Chercher Twitter Card image
-            twitter_image = soup.find('meta', attrs={'name': 'twitter:image'})
-            if twitter_image and twitter_image.get('content'):
-                return twitter_image['content']
+            # Recalculer le score avec le contenu complet maintenant disponible
+            item.relevance_score = self._calculate_unified_score(item, include_full_text=True)
+            return bool(page.text)
             
-            # Chercher la premi\u00e8re grande image
-            img = soup.find('img', src=True)
-            if img:
-                img_url = img['src']
-                # Convertir en URL absolue si n\u00e9cessaire
-                if not img_url.startswith('http'):
-                    from urllib.parse import urljoin
-                    img_url = urljoin(url, img_url)
-                return img_url
-        except:
-            pass
-        
-        return ""
+        except DeadlineExceeded:
+            raise  # Parsing interrompu à l'échéance: l'appelant bascule sur le résumé, rien n'est mémorisé
+        except Exception as e:
+            logger.error(f"Erreur critique lors de l'amélioration de l'article {item.url}: {str(e)}")
+            # Fallback ultime : retourner l'article avec résumé RSS seulement
+            item.full_text = item.summary or ""
+            item.relevance_score = self._calculate_unified_score(item, include_full_text=False)
+            return False
     
-    def _filter_relevant_news(self, news_items: List[NewsItem]) -> List[NewsItem]:
+    def _filter_relevant_news(self, news_items: List[NewsItem], deadline: Optional[Deadline] = None) -> List[NewsItem]:
         """Pipeline unifié de filtrage avec ou sans analyseur avancé"""
         
         # Phase 1: Calcul du score de base pour tous les articles
@@ -604,150 +1142,168 @@ class FoodIndustryNewsScraper:
         # Phase 2: Analyse avancée si disponible
         if self.analyzer:
             logger.info("Using advanced analysis pipeline")
-            return self._apply_advanced_analysis(scored_items)
+            return self._apply_advanced_analysis(scored_items, deadline)
         else:
             logger.info("Using basic scoring pipeline")
             return self._apply_basic_selection(scored_items)
     
     def _calculate_unified_score(self, item: NewsItem, include_full_text: bool = True) -> float:
+        """Score unifié, calculé une seule fois par état du contenu (cache partagé par toutes les phases)"""
+        key, priority_multiplier, days_old = self._score_inputs(item, include_full_text)
+        cached = self.score_cache.get(key)
+        if cached is None:
+            cached = self._score_content(item, include_full_text, priority_multiplier, days_old)
+            self.score_cache.put(key, cached)
+        return self._apply_score(item, cached, include_full_text)
+    
+    def _score_batch(self, items: List[NewsItem], include_full_text: bool = True) -> List[float]:
+        """Scores unifiés d'un lot: contenus déjà notés repris du cache, les autres notés ensemble (NumPy)"""
+        if self.batch_scorer is None:
+            return [self._calculate_unified_score(item, include_full_text) for item in items]
+        inputs = [self._score_inputs(item, include_full_text) for item in items]
+        results = [self.score_cache.get(key) for key, _, _ in inputs]
+        missing = [n for n, cached in enumerate(results) if cached is None]
+        if missing:
+            texts = [self._score_text(items[n], include_full_text) for n in missing]
+            scores, keywords = self.batch_scorer.score(texts, [len(items[n].title.lower()) for n in missing],
+                                                       [inputs[n][1] for n in missing], [inputs[n][2] for n in missing])
+            for n, score, relevant_keywords in zip(missing, scores.tolist(), keywords):
+                explanation = ""
+                if score > 0 and include_full_text:
+                    explanation = self._generate_relevance_explanation(items[n], relevant_keywords)
+                results[n] = CachedScore(score, relevant_keywords, explanation)
+                self.score_cache.put(inputs[n][0], results[n])
+        return [self._apply_score(item, cached, include_full_text) for item, cached in zip(items, results)]
+    
+    def _score_inputs(self, item: NewsItem, include_full_text: bool) -> tuple:
+        """Clé de cache du score et entrées hors texte (multiplicateur de source, âge en jours)"""
+        days_old = (datetime.now() - item.published_date).days if item.published_date else None
+        priority_multiplier = self.sources.get(item.source, {}).get('priority_multiplier', 1.0)
+        key = ScoreCache.key(item.title, item.summary, item.full_text, include_full_text, self.keyword_profile,
+                             priority_multiplier, days_old)
+        return key, priority_multiplier, days_old
+    
+    def _score_text(self, item: NewsItem, include_full_text: bool) -> str:
+        """Texte analysé: titre et résumé RSS au pré-filtrage, contenu complet ensuite"""
+        if include_full_text:
+            return (item.title + " " + item.summary + " " + item.full_text).lower()
+        return (item.title + " " + item.summary).lower()
+    
+    def _apply_score(self, item: NewsItem, cached: CachedScore, include_full_text: bool) -> float:
+        # Mettre à jour les métadonnées de l'item si nécessaire
+        if cached.score > 0 and include_full_text:
+            item.tags = list(cached.tags)
+            item.relevance_to_flb = cached.relevance_to_flb
+        return cached.score
+    
+    def _score_content(self, item: NewsItem, include_full_text: bool, priority_multiplier: float, days_old: Optional[int]) -> CachedScore:
         """Calcul unifié du score avec analyse contextuelle intelligente"""
         relevant_keywords = []
         
         # Construire le texte à analyser selon le contexte
-        if include_full_text:
-            text_to_check = (item.title + " " + item.summary + " " + item.full_text).lower()
-        else:
-            # Pour pré-filtrage : seulement titre et résumé RSS
-            text_to_check = (item.title + " " + item.summary).lower()
+        text_to_check = self._score_text(item, include_full_text)
         
         if not text_to_check.strip():
-            return 0.0
+            return CachedScore(0.0, [], "")
         
-        # Tokeniser pour analyse contextuelle
-        sentences = text_to_check.split('.')
-        title_words = item.title.lower().split()
+        # Une passe sur le texte: occurrences de tous les motifs, avec leur phrase
+        matches = self.keyword_matcher.scan(text_to_check)
+        title_end = len(item.title.lower())  # Le titre ouvre le texte analysé
         
         # Score par mots-clés avec analyse contextuelle
         score = 0.0
         for keyword, weight in self.keyword_weights.items():
-            keyword_lower = keyword.lower()
-            keyword_score = self._calculate_contextual_keyword_score(
-                keyword_lower, text_to_check, sentences, title_words, weight
-            )
+            keyword_score = self._calculate_contextual_keyword_score(keyword.lower(), matches, title_end, weight)
             if keyword_score > 0:
                 score += keyword_score
                 relevant_keywords.append(keyword)
         
         # Détection de contexte négatif (réduit le score)
-        negative_context_penalty = self._detect_negative_context(text_to_check, relevant_keywords)
+        negative_context_penalty = self._detect_negative_context(matches, relevant_keywords)
         score *= (1 - negative_context_penalty)
         
         # Multiplicateur de source
-        source_config = self.sources.get(item.source, {})
-        priority_multiplier = source_config.get('priority_multiplier', 1.0)
         score *= priority_multiplier
         
         # Bonus géographique avec contexte
-        geo_bonus = self._calculate_geographic_relevance(text_to_check)
+        geo_bonus = self._calculate_geographic_relevance(matches)
         score += geo_bonus
         
         # Score de fraîcheur
-        if item.published_date:
-            days_old = (datetime.now() - item.published_date).days
-            freshness_bonus = {0: 1.5, 1: 1.3, 2: 1.2, 3: 1.1, 4: 1.0}.get(days_old, 0.8)
+        if days_old is not None:
+            freshness_bonus = FRESHNESS_BONUS.get(days_old, 0.8)
             score *= freshness_bonus
         
-        # Mettre à jour les métadonnées de l'item si nécessaire
+        explanation = ""
         if score > 0 and include_full_text:
-            item.tags = relevant_keywords
-            item.relevance_to_flb = self._generate_relevance_explanation(item, relevant_keywords)
-        
-        return score
+            explanation = self._generate_relevance_explanation(item, relevant_keywords)
+        return CachedScore(score, relevant_keywords, explanation)
     
-    def _calculate_contextual_keyword_score(self, keyword: str, text: str, sentences: List[str], title_words: List[str], base_weight: float) -> float:
+    def _calculate_contextual_keyword_score(self, keyword: str, matches: KeywordMatches, title_end: int, base_weight: float) -> float:
         """Calcul du score contextuel pour un mot-clé"""
-        if keyword not in text:
+        if keyword not in matches:
             return 0.0
         
         score = 0.0
         
-        # Bonus titre (mots-clés dans le titre = plus important)
-        if keyword in title_words or any(keyword in word for word in title_words):
+        # Bonus titre (mots-clés dans un mot du titre = plus important)
+        if len(keyword.split()) == 1 and any(start + len(keyword) <= title_end for start in matches.starts(keyword)):
             score += base_weight * 1.5
         
         # Comptage avec bonus de proximité
-        for sentence in sentences:
-            if keyword in sentence:
-                # Score de base pour présence
-                sentence_score = base_weight
-                
-                # Bonus si proche d'autres mots-clés importants
-                proximity_keywords = ['distributeur', 'québec', 'alimentaire', 'supply chain']
-                for prox_kw in proximity_keywords:
-                    if prox_kw != keyword and prox_kw in sentence:
-                        sentence_score *= 1.2  # 20% de bonus
-                
-                # Bonus selon la position dans la phrase
-                words = sentence.strip().split()
-                if words and keyword in ' '.join(words[:5]):  # Dans les 5 premiers mots
-                    sentence_score *= 1.1
-                
-                score += sentence_score
+        proximity_sentences = [matches.sentences(prox_kw) for prox_kw in PROXIMITY_KEYWORDS if prox_kw != keyword]
+        for sentence in sorted(matches.sentences(keyword)):
+            # Score de base pour présence
+            sentence_score = base_weight
+            
+            # Bonus si proche d'autres mots-clés importants
+            for sentences in proximity_sentences:
+                if sentence in sentences:
+                    sentence_score *= 1.2  # 20% de bonus
+            
+            # Bonus selon la position dans la phrase
+            if matches.in_leading_words(keyword, sentence, 5):  # Dans les 5 premiers mots
+                sentence_score *= 1.1
+            
+            score += sentence_score
         
         # Diminution logarithmique pour occurrences multiples
-        import math
-        occurrences = text.count(keyword)
+        occurrences = matches.count(keyword)
         if occurrences > 1:
             log_bonus = 1 + math.log(occurrences) * 0.3
             score *= log_bonus
         
         return score
     
-    def _detect_negative_context(self, text: str, keywords: List[str]) -> float:
+    def _detect_negative_context(self, matches: KeywordMatches, keywords: List[str]) -> float:
         """Détecter le contexte négatif qui réduit la pertinence"""
-        negative_indicators = [
-            'pas de', 'aucun', 'éviter', 'rejeter', 'interdire', 'bannir',
-            'no longer', 'avoid', 'prevent', 'ban', 'prohibit',
-            'fermeture', 'closure', 'échec', 'failure'
-        ]
-        
-        penalty = 0.0
-        for sentence in text.split('.'):
-            # Vérifier si une phrase contient à la fois un mot-clé et un indicateur négatif
-            has_keyword = any(kw.lower() in sentence for kw in keywords)
-            has_negative = any(neg in sentence for neg in negative_indicators)
-            
-            if has_keyword and has_negative:
-                penalty += 0.1  # 10% de pénalité par contexte négatif
+        # Phrases contenant à la fois un mot-clé et un indicateur négatif
+        keyword_sentences = set()
+        for kw in keywords:
+            keyword_sentences.update(matches.sentences(kw.lower()))
+        negative_sentences = keyword_sentences & matches.sentences_of('negative')
         
+        penalty = 0.1 * len(negative_sentences)  # 10% de pénalité par contexte négatif
         return min(penalty, 0.5)  # Maximum 50% de pénalité
     
-    def _calculate_geographic_relevance(self, text: str) -> float:
+    def _calculate_geographic_relevance(self, matches: KeywordMatches) -> float:
         """Calcul intelligent de la pertinence géographique"""
-        quebec_terms = ['québec', 'quebec', 'capitale-nationale', 'beauport', 'lévis', 'sainte-foy', 'charlesbourg']
-        canada_terms = ['canada', 'canadien', 'canadian']
-        
         geo_score = 0.0
         
         # Bonus élevé pour mentions spécifiques de Québec
-        for term in quebec_terms:
-            occurrences = text.count(term)
-            if occurrences > 0:
-                geo_score += occurrences * 8  # Score élevé pour géo local
+        for term in QUEBEC_TERMS:
+            geo_score += matches.count(term) * 8  # Score élevé pour géo local
         
         # Bonus moyen pour mentions du Canada
-        for term in canada_terms:
-            occurrences = text.count(term)
-            if occurrences > 0:
-                geo_score += occurrences * 3
+        for term in CANADA_TERMS:
+            geo_score += matches.count(term) * 3
         
         return geo_score
     
     def _calculate_base_scores(self, news_items: List[NewsItem]) -> List[NewsItem]:
         """Wrapper pour compatibilité - utilise le scoring unifié"""
         valid_items = []
-        for item in news_items:
-            score = self._calculate_unified_score(item, include_full_text=True)
+        for item, score in zip(news_items, self._score_batch(news_items, include_full_text=True)):
             if score > 0:
                 item.relevance_score = score
                 valid_items.append(item)
@@ -812,7 +1368,7 @@ class FoodIndustryNewsScraper:
         logger.debug(f"Calcul seuils: P60={percentile_60:.2f}, Min={min_threshold:.2f}, Dynamic={dynamic_threshold:.2f}, Final={final_threshold:.2f}")
         return final_threshold
     
-    def _apply_advanced_analysis(self, scored_items: List[NewsItem]) -> List[NewsItem]:
+    def _apply_advanced_analysis(self, scored_items: List[NewsItem], deadline: Optional[Deadline] = None) -> List[NewsItem]:
         """Pipeline d'analyse avancée avec le moteur hybride"""
         logger.info(f"Using advanced analysis for {len(scored_items)} pre-scored articles")
         
@@ -830,7 +1386,7 @@ class FoodIndustryNewsScraper:
             })
         
         # Analyse avec le moteur hybride
-        analysis_results = self.analyzer.analyze_batch(articles_dict)
+        analysis_results = self.analyzer.analyze_batch(articles_dict, deadline=deadline)
         
         # Enrichir les NewsItems
         enhanced_items = []
@@ -1017,8 +1573,9 @@ class FoodIndustryNewsScraper:
         return hashlib.md5(content_key.encode('utf-8')).hexdigest()[:12]  # 12 chars suffisent
     
     def _deduplicate_articles(self, articles: List[NewsItem]) -> List[NewsItem]:
-        """Supprimer articles dupliqués basé sur hash de contenu"""
+        """Supprimer articles dupliqués basé sur hash de contenu et URL canonique"""
         seen_hashes = set()
+        seen_urls = set()
         deduplicated = []
         duplicates_removed = 0
         
@@ -1026,9 +1583,12 @@ class FoodIndustryNewsScraper:
             if not article.content_hash:
                 # Recalculer si manquant
                 article.content_hash = self._calculate_content_hash(article.title, article.url)
+            # URL canonique déclarée par la page si connue (même article publié sous plusieurs URLs)
+            article_url_key = url_key(article.canonical_url or article.url)
             
-            if article.content_hash not in seen_hashes:
+            if article.content_hash not in seen_hashes and article_url_key not in seen_urls:
                 seen_hashes.add(article.content_hash)
+                seen_urls.add(article_url_key)
                 deduplicated.append(article)
             else:
                 duplicates_removed += 1
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Santé des sources et disjoncteur pour FLB News
+Statistiques persistées par source (taux de succès, latences p50/p95, dernière erreur)
+et mise à l'écart temporaire des sources en échec répété
+"""
+
+import os
+import csv
+import math
+import json
+import time
+import logging
+import threading
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field, asdict
+
+logger = logging.getLogger(__name__)
+
+LATENCY_WINDOW = 50  # Dernières mesures conservées par source
+
+BAND_FLOOR = 0.25  # Tranches de durée attendue: <0.5 s, 0.5-1 s, 1-2 s, 2-4 s...
+
+# Décisions du disjoncteur
+RUN, PROBE, SKIP = 'run', 'probe', 'skip'
+
+def _percentile(values: List[float], ratio: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(ratio * (len(ordered) - 1))))]
+
+def latency_band(seconds: float) -> int:
+    """Tranche logarithmique d'une durée (les écarts de quelques dixièmes ne réordonnent pas les sources)"""
+    return int(math.log2(max(seconds, BAND_FLOOR) / BAND_FLOOR))
+
+@dataclass
+class SourceHealth:
+    """Historique d'une source"""
+    name: str
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    latencies: List[float] = field(default_factory=list)
+    durations: List[float] = field(default_factory=list)  # Récupération + parsing (occupation d'un worker)
+    last_error: str = ""
+    last_success_at: float = 0.0
+    last_failure_at: float = 0.0
+    open_until: float = 0.0  # Disjoncteur ouvert jusqu'à cet instant (epoch)
+
+    @property
+    def success_rate(self) -> float:
+        total = self.successes + self.failures
+        return self.successes / total if total else 1.0
+
+    @property
+    def p50(self) -> float:
+        return _percentile(self.latencies, 0.5)
+
+    @property
+    def p95(self) -> float:
+        return _percentile(self.latencies, 0.95)
+
+    @property
+    def expected_duration(self) -> Optional[float]:
+        """Durée médiane d'une interrogation (latence réseau seule pour un historique antérieur)"""
+        samples = self.durations or self.latencies
+        return _percentile(samples, 0.5) if samples else None
+
+class SourceHealthTracker:
+    """Registre persistant + disjoncteur (fermé → ouvert → sonde → fermé)"""
+
+    def __init__(self, path: str = None, failure_threshold: int = 3, cooldown: float = 6 * 3600, max_cooldown: float = 48 * 3600):
+        self.path = path or os.path.join(os.path.dirname(__file__), '..', '.source_health', 'health.json')
+        self.failure_threshold = failure_threshold  # Échecs consécutifs avant ouverture
+        self.cooldown = cooldown  # Mise à l'écart initiale, doublée à chaque sonde ratée
+        self.max_cooldown = max_cooldown
+        self._lock = threading.Lock()
+        self.sources: Dict[str, SourceHealth] = self._load()
+
+    @classmethod
+    def from_config(cls, http_config: Dict = None, path: str = None) -> 'SourceHealthTracker':
+        http_config = http_config or {}
+        return cls(
+            path=path,
+            failure_threshold=http_config.get('breaker_failure_threshold', 3),
+            cooldown=http_config.get('breaker_cooldown', 6 * 3600)
+        )
+
+    def _load(self) -> Dict[str, SourceHealth]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return {name: SourceHealth(**record) for name, record in data.items()}
+        except Exception as e:
+            logger.warning(f"Santé des sources illisible ({self.path}): {e}")
+            return {}
+
+    def save(self):
+        """Écriture atomique du registre"""
+        with self._lock:
+            data = {name: asdict(health) for name, health in self.sources.items()}
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_file = f"{self.path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=1)
+            os.replace(tmp_file, self.path)
+        except Exception as e:
+            logger.warning(f"Impossible de sauvegarder la santé des sources: {e}")
+
+    def _health(self, name: str) -> SourceHealth:
+        health = self.sources.get(name)
+        if health is None:
+            health = self.sources[name] = SourceHealth(name=name)
+        return health
+
+    def admission(self, name: str) -> str:
+        """RUN (fermé), SKIP (ouvert, en pause) ou PROBE (pause écoulée: une tentative courte)"""
+        with self._lock:
+            health = self.sources.get(name)
+            if health is None or health.consecutive_failures < self.failure_threshold:
+                return RUN
+            return SKIP if time.time() < health.open_until else PROBE
+
+    def expected_duration(self, name: str) -> Optional[float]:
+        """Durée attendue d'une source (None sans historique)"""
+        with self._lock:
+            health = self.sources.get(name)
+            return health.expected_duration if health else None
+
+    def record_success(self, name: str, latency: float, duration: Optional[float] = None):
+        with self._lock:
+            health = self._health(name)
+            if health.consecutive_failures >= self.failure_threshold:
+                logger.info(f"🔌 {name}: source rétablie après {health.consecutive_failures} échecs")
+            health.successes += 1
+            health.consecutive_failures = 0
+            health.open_until = 0.0
+            health.last_success_at = time.time()
+            health.latencies = (health.latencies + [round(latency, 3)])[-LATENCY_WINDOW:]
+            health.durations = (health.durations + [round(duration if duration is not None else latency, 3)])[-LATENCY_WINDOW:]
+
+    def record_failure(self, name: str, latency: float, error: str, duration: Optional[float] = None):
+        with self._lock:
+            health = self._health(name)
+            health.failures += 1
+            health.consecutive_failures += 1
+            health.last_error = error[:300]
+            health.last_failure_at = time.time()
+            health.latencies = (health.latencies + [round(latency, 3)])[-LATENCY_WINDOW:]
+            health.durations = (health.durations + [round(duration if duration is not None else latency, 3)])[-LATENCY_WINDOW:]
+            if health.consecutive_failures >= self.failure_threshold:
+                # Pause exponentielle: chaque sonde ratée double la durée
+                extra = health.consecutive_failures - self.failure_threshold
+                cooldown = min(self.cooldown * (2 ** extra), self.max_cooldown)
+                health.open_until = time.time() + cooldown
+                logger.warning(f"🔌 {name}: disjoncteur ouvert pour {cooldown / 3600:.1f}h ({health.consecutive_failures} échecs: {error[:80]})")
+
+    def report(self) -> List[Dict]:
+        """Lignes d'export triées de la source la plus lente à la plus rapide"""
+        now = time.time()
+        with self._lock:
+            rows = [{
+                'source': h.name,
+                'etat': 'ouvert' if h.consecutive_failures >= self.failure_threshold and now < h.open_until
+                        else 'sonde' if h.consecutive_failures >= self.failure_threshold else 'fermé',
+                'taux_succes': round(h.success_rate, 3),
+                'p50_s': round(h.p50, 2),
+                'p95_s': round(h.p95, 2),
+                'duree_attendue_s': round(h.expected_duration or 0.0, 2),
+                'echecs_consecutifs': h.consecutive_failures,
+                'derniere_erreur': h.last_error,
+                'dernier_succes': time.strftime('%Y-%m-%d %H:%M', time.localtime(h.last_success_at)) if h.last_success_at else ''
+            } for h in self.sources.values()]
+        return sorted(rows, key=lambda row: row['p95_s'], reverse=True)
+
+    def export_csv(self, path: str) -> int:
+        rows = self.report()
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()) if rows else ['source'])
+            writer.writeheader()
+            writer.writerows(rows)
+        return len(rows)
+
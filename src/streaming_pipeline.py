@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Pipeline en flux pour FLB News
+Les phases ne sont plus des barrières: dès qu'une source répond, ses entrées sont canonicalisées,
+pré-filtrées et placées dans une file bornée d'extraction; les articles nettement en tête
+sont traduits pendant que le reste de l'extraction se poursuit
+"""
+
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from src.deadline import Deadline, DeadlineExceeded
+from src.url_canonicalizer import url_key
+
+logger = logging.getLogger(__name__)
+
+class OnlineTopK:
+    """Admission en ligne: un candidat passe s'il figure parmi les k meilleurs pré-scores vus jusqu'ici.
+    Le nombre d'admissions reste borné (environ k * (1 + ln(n / k))) sans attendre toutes les sources"""
+
+    def __init__(self, k: int):
+        self.k = max(1, k)
+        self._heap: List[float] = []
+        self.seen = 0
+
+    def admit(self, score: float) -> bool:
+        self.seen += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, score)
+            return True
+        if score > self._heap[0]:
+            heapq.heapreplace(self._heap, score)
+            return True
+        return False
+
+class StreamingPipeline:
+    """Sources → canonicalisation + pré-filtre → file bornée → extraction → traduction anticipée → sélection"""
+
+    def __init__(self, scraper, queue_size: int = 32, translate_ahead: Optional[int] = None):
+        self.scraper = scraper
+        self.queue_size = queue_size
+        max_articles = scraper.bulletin_config.get('max_articles', 7)
+        # Même ordre de grandeur que le pré-filtrage en barrière (max_articles + tampon)
+        self.admission_k = max_articles + max(3, max_articles)
+        # Articles « nettement en tête »: traduits avant la fin de l'extraction (cache disque du traducteur)
+        self.translate_ahead = max_articles // 2 if translate_ahead is None else translate_ahead
+        self._lock = threading.Lock()
+        self._order = itertools.count()
+        self._extracted: List = []
+        self._translated = set()
+        self._translations = []
+        self._translation_executor: Optional[ThreadPoolExecutor] = None
+        self.unqueued = 0  # Candidats admis restés hors de la file (extraction saturée jusqu'à l'échéance)
+
+    @classmethod
+    def from_config(cls, scraper) -> 'StreamingPipeline':
+        http_config = scraper.http_config
+        return cls(scraper, queue_size=http_config.get('stream_queue_size', 32),
+                   translate_ahead=http_config.get('stream_translate_ahead'))
+
+    def run(self, days_back: int = 7, deadline: Optional[Deadline] = None) -> List:
+        scraper = self.scraper
+        start_time = time.time()
+        cutoff_date = datetime.now() - timedelta(days=days_back)
+        budget = scraper._run_budget(deadline)
+        sources_deadline = budget.phase('sources')
+        # L'extraction commence avec la première source: elle dispose de la part des sources en plus de la sienne
+        extraction_deadline = budget.phase('sources', 'extraction')
+        logger.info(f"🚀 DÉBUT SCRAPING EN FLUX - Recherche des {days_back} derniers jours depuis {cutoff_date.strftime('%Y-%m-%d %H:%M')}")
+
+        work = queue.PriorityQueue(maxsize=self.queue_size)
+        workers = [threading.Thread(target=self._extraction_worker, args=(work, extraction_deadline), name=f"extraction-{n}", daemon=True)
+                   for n in range(scraper.host_limiter.global_limit)]
+        for worker in workers:
+            worker.start()
+        self._translation_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='traduction')
+
+        admitted = []
+        try:
+            admitted = self._stream_sources(work, cutoff_date, sources_deadline, extraction_deadline)
+        finally:
+            for _ in workers:
+                work.put((float('inf'), next(self._order), None))  # Fin de file, après le travail restant
+            for worker in workers:
+                worker.join()  # Chaque extraction s'arrête d'elle-même à l'échéance
+            # Traductions anticipées non démarrées annulées; celles en cours terminées avant la phase 5
+            self._translation_executor.shutdown(wait=True, cancel_futures=True)
+
+        with self._lock:
+            done = {id(item) for item in self._extracted}
+            enhanced = list(self._extracted)
+        for item in admitted:
+            if id(item) not in done:
+                # Échéance atteinte avant l'extraction: résumé RSS
+                item.full_text = item.summary or ""
+                item.relevance_score = scraper._calculate_unified_score(item, include_full_text=False)
+                enhanced.append(item)
+        logger.info(f"✅ Flux terminé en {time.time() - start_time:.1f}s → {len(enhanced)} articles extraits, "
+                    f"{len(self._translations)} traductions anticipées, {self.unqueued} candidats hors file (résumé RSS)")
+        scraper.host_limiter.log_summary()
+        if scraper.article_store:
+            scraper.article_store.log_summary()
+        if not enhanced:
+            logger.warning("❌ Aucun article pertinent après pré-filtrage")
+            return []
+        return scraper._finalize_selection(enhanced, start_time, budget)
+
+    def _stream_sources(self, work: queue.PriorityQueue, cutoff_date: datetime, sources_deadline: Deadline,
+                        extraction_deadline: Deadline) -> List:
+        """Sources en parallèle; chaque réponse est pré-filtrée et mise en file sans attendre les autres"""
+        scraper = self.scraper
+        admission = OnlineTopK(self.admission_k)
+        seen_keys = set()
+        admitted = []
+        fetched = 0
+        executor = ThreadPoolExecutor(max_workers=5)
+        future_to_source = {}
+        try:
+            for source_name, source_config, timeout in scraper._admitted_sources():
+                method = scraper._scrape_rss_basic if source_config['type'] == 'rss' else scraper._scrape_website_basic
+                future = executor.submit(method, source_name, source_config, cutoff_date, sources_deadline, timeout)
+                future_to_source[future] = source_name
+            logger.info(f"📡 {len(future_to_source)} sources en vol, extraction au fil des réponses (échéance {sources_deadline.remaining():.0f}s)")
+
+            try:
+                for future in as_completed(future_to_source, timeout=sources_deadline.remaining()):
+                    source_name = future_to_source[future]
+                    try:
+                        news_items = future.result()
+                    except Exception as e:
+                        logger.error(f"❌ {source_name}: ERREUR - {str(e)}")
+                        continue
+                    fetched += len(news_items)
+                    news_items = scraper._canonicalize_articles(
+                        news_items, sources_deadline.child(scraper.http_config.get('redirect_phase_timeout', 15), 'canonicalization'))
+                    candidates = []
+                    for item in scraper._rapid_keyword_filter(news_items):
+                        key = url_key(item.url)
+                        if key in seen_keys:
+                            continue
+                        seen_keys.add(key)
+                        item.priority_score = scraper._priority_score(item)
+                        candidates.append(item)
+                    queued = 0
+                    # Réponse de la source notée en un lot
+                    for item, score in zip(candidates, scraper._score_batch(candidates, include_full_text=False)):
+                        if score <= 0 or not admission.admit(score):
+                            continue
+                        item.relevance_score = score
+                        admitted.append(item)
+                        try:
+                            # File bornée, meilleure valeur attendue servie en premier; un pic de réponses
+                            # attend que l'extraction rattrape son retard
+                            work.put((-scraper._expected_value(item), next(self._order), item), timeout=extraction_deadline.remaining())
+                        except queue.Full:
+                            # File encore pleine à l'échéance: candidat gardé, repli sur le résumé RSS
+                            self.unqueued += 1
+                            continue
+                        queued += 1
+                    logger.info(f"✅ {source_name}: {len(news_items)} articles, {queued} en file d'extraction à {sources_deadline.elapsed():.1f}s")
+            except TimeoutError:
+                remaining_sources = [name for future, name in future_to_source.items() if not future.done()]
+                logger.warning(f"⏰ Échéance des sources atteinte ({sources_deadline.elapsed():.0f}s), sources abandonnées: {', '.join(remaining_sources)}")
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            scraper.source_health.save()
+        logger.info(f"📊 Sources terminées: {fetched} articles récupérés, {len(admitted)}/{admission.seen} candidats admis à l'extraction"
+                    + (f", {self.unqueued} hors file (extraction saturée)" if self.unqueued else ""))
+        return admitted
+
+    def _extraction_worker(self, work: queue.PriorityQueue, deadline: Deadline):
+        scraper = self.scraper
+        while True:
+            _, _, item = work.get()
+            if item is None:
+                return
+            if deadline.expired:
+                continue  # Repli sur le résumé RSS en fin de pipeline
+            try:
+                enhanced = scraper._extract_and_enhance_article(item, deadline)
+            except DeadlineExceeded:
+                continue
+            except Exception as e:
+                logger.warning(f"❌ Extraction échouée: {item.title[:30]}... - {str(e)}")
+                continue
+            if enhanced is not None:
+                self._on_extracted(enhanced)
+
+    def _on_extracted(self, item):
+        """Classement courant des articles extraits; les nouveaux entrants du peloton de tête sont traduits"""
+        with self._lock:
+            self._extracted.append(item)
+            leaders = sorted(self._extracted, key=lambda x: x.relevance_score, reverse=True)[:self.translate_ahead]
+            to_translate = [leader for leader in leaders if id(leader) not in self._translated]
+            self._translated.update(id(leader) for leader in to_translate)
+        for leader in to_translate:
+            try:
+                self._translations.append(self._translation_executor.submit(self._warm_translation, leader))
+            except RuntimeError:
+                pass  # Pipeline en cours d'arrêt
+
+    def _warm_translation(self, item):
+        """Traduire titre, résumé et explication sans modifier l'article: la phase 5 les retrouve dans le cache"""
+        translator = self.scraper.translator
+        for text in (item.title, item.summary, item.relevance_to_flb):
+            if text:
+                translator.translate_if_needed(text, item.source)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Canonicalisation des URLs d'articles pour FLB News
+Paramètres de suivi retirés, variantes AMP et http/https ramenées à une seule forme,
+redirecteurs (feedproxy, raccourcisseurs) résolus via un cache persistant
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, unquote_plus
+
+logger = logging.getLogger(__name__)
+
+TRACKING_PARAMS = {'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'igshid', 'yclid', '_hsenc', '_hsmi',
+                   'mkt_tok', 'ref', 'ref_src', 'cmpid', 'ncid', 'sr_share', 'amp', 'outputtype'}
+TRACKING_PREFIXES = ('utm_', 'pk_', 'hsa_', 'ga_', 'at_', 'oly_')
+DEFAULT_PORTS = {'http': '80', 'https': '443'}
+
+# Hôtes qui ne font que rediriger vers l'article (chemin optionnel pour les hôtes partagés)
+REDIRECT_WRAPPERS = {
+    'feedproxy.google.com': '', 'feeds.feedburner.com': '/~r/', 'feeds.feedblitz.com': '/~/',
+    't.co': '', 'bit.ly': '', 'buff.ly': '', 'ow.ly': '', 'dlvr.it': '', 'trib.al': '', 'lnkd.in': '',
+    'tinyurl.com': '', 'ift.tt': '', 'rebrand.ly': '', 'shorturl.at': ''
+}
+
+REDIRECT_CACHE_TTL = 30 * 24 * 3600  # Une redirection d'article ne change pratiquement jamais
+
+def _strip_amp_path(path: str) -> str:
+    for suffix in ('/amp/', '/amp', '.amp'):
+        if path.endswith(suffix):
+            return path[:-len(suffix)] or '/'
+    return path
+
+def _is_tracking(pair: str) -> bool:
+    name = unquote_plus(pair.split('=', 1)[0]).lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+def clean_url(url: str) -> str:
+    """Forme téléchargeable: hôte en minuscules, port par défaut, fragment et paramètres de suivi retirés, AMP désactivé"""
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port  # ValueError sur un port mal formé (http://hote:abc/)
+    except ValueError:
+        return url
+    if parts.scheme not in ('http', 'https') or not parts.hostname:
+        return url
+    host = parts.hostname.rstrip('.')
+    if port and str(port) != DEFAULT_PORTS[parts.scheme]:
+        host = f"{host}:{port}"
+    # Paramètres filtrés sur les paires brutes: le reste de la requête est gardé octet pour octet (encodage, valeurs vides)
+    query = '&'.join(pair for pair in parts.query.split('&') if pair and not _is_tracking(pair))
+    return urlunsplit((parts.scheme, host, _strip_amp_path(parts.path) or '/', query, ''))
+
+def url_key(url: str) -> str:
+    """Clé de déduplication exacte: sans schéma ni www/amp, requête triée, sans barre finale"""
+    parts = urlsplit(clean_url(url))
+    if not parts.netloc:
+        return url
+    host = parts.netloc[4:] if parts.netloc.startswith(('www.', 'amp.')) else parts.netloc
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return f"{host}{parts.path.rstrip('/') or '/'}{'?' + query if query else ''}"
+
+def is_redirect_wrapper(url: str) -> bool:
+    parts = urlsplit(url)
+    host = (parts.hostname or '').lower()
+    host = host[4:] if host.startswith('www.') else host
+    if host not in REDIRECT_WRAPPERS:
+        return False
+    return parts.path.startswith(REDIRECT_WRAPPERS[host])
+
+class UrlCanonicalizer:
+    """Canonicalisation + cache persistant des redirecteurs résolus (url enveloppée → url finale)"""
+
+    def __init__(self, cache_path: str = None, ttl: float = REDIRECT_CACHE_TTL, persistent: bool = True):
+        self.cache_path = cache_path or os.path.join(os.path.dirname(__file__), '..', '.url_cache', 'redirects.json')
+        self.ttl = ttl
+        self.persistent = persistent  # False: cache limité à l'exécution (aucune lecture ni écriture disque)
+        self._lock = threading.Lock()
+        self.redirects: Dict[str, Dict] = self._load() if persistent else {}
+        self.resolved = 0
+        self.cache_hits = 0
+
+    def _load(self) -> Dict[str, Dict]:
+        if not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Cache de redirections illisible ({self.cache_path}): {e}")
+            return {}
+
+    def save(self):
+        """Écriture atomique du cache (entrées expirées purgées)"""
+        if not self.persistent:
+            return
+        now = time.time()
+        with self._lock:
+            data = {url: entry for url, entry in self.redirects.items() if now - entry.get('at', 0) < self.ttl}
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp_file = f"{self.cache_path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_file, self.cache_path)
+        except Exception as e:
+            logger.warning(f"Impossible de sauvegarder le cache de redirections: {e}")
+
+    def cached_target(self, url: str) -> Optional[str]:
+        with self._lock:
+            entry = self.redirects.get(url)
+        if entry and time.time() - entry.get('at', 0) < self.ttl:
+            self.cache_hits += 1
+            return entry['target']
+        return None
+
+    def canonical(self, url: str, resolve: Optional[Callable[[str], str]] = None) -> str:
+        """URL téléchargeable canonique; resolve(url) → url finale n'est appelé que pour un redirecteur non caché"""
+        if not is_redirect_wrapper(url):
+            return clean_url(url)
+        target = self.cached_target(url)
+        if target is None and resolve is not None:
+            try:
+                target = resolve(url)
+            except Exception as e:
+                logger.debug(f"Redirection non résolue pour {url}: {e}")
+                return clean_url(url)
+            if target and target != url:
+                with self._lock:
+                    self.redirects[url] = {'target': target, 'at': time.time()}
+                self.resolved += 1
+        return clean_url(target or url)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Test de l'extraction unifiée des pages d'articles (un téléchargement, une passe)
+"""
+
+import sys
+import tempfile
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, 'src')
+
+from article_extractor import ArticleExtractor
+from scraper import FoodIndustryNewsScraper, NewsItem
+
+PARAGRAPH = ("Le distributeur alimentaire de la ville de Québec agrandit son entrepôt de Beauport "
+             "pour mieux servir les restaurants et les hôtels de la Capitale-Nationale. ")
+
+PAGE = f"""<html><head>
+<title>Expansion à Beauport</title>
+<link rel="canonical" href="/nouvelles/expansion-beauport">
+<meta property="og:image" content="/images/entrepot.jpg">
+<meta name="twitter:image" content="https://cdn.example.com/twitter.jpg">
+<meta property="article:published_time" content="2026-10-14T09:30:00+00:00">
+<meta name="description" content="Un distributeur agrandit son entrepôt.">
+</head><body><nav><a href="/">Accueil</a></nav>
+<article><h1>Expansion à Beauport</h1><p>{PARAGRAPH * 8}</p><p>{PARAGRAPH * 6}</p></article>
+<script>var tracking = true;</script></body></html>""".encode('utf-8')
+
+class Handler(BaseHTTPRequestHandler):
+    hits = []
+
+    def do_GET(self):
+        Handler.hits.append(self.path)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+def test_extract_metadata():
+    """Texte, image, URL canonique et date issus d'une seule passe"""
+    page = ArticleExtractor().extract("https://example.com/nouvelles/expansion-beauport?utm_source=rss", PAGE)
+
+    assert "entrepôt de Beauport" in page.text
+    assert "tracking" not in page.text
+    assert page.top_image == "https://example.com/images/entrepot.jpg"
+    assert page.canonical_url == "https://example.com/nouvelles/expansion-beauport"
+    assert page.published_date is not None and page.published_date.date().isoformat() == "2026-10-14"
+    assert page.metadata['twitter:image'] == "https://cdn.example.com/twitter.jpg"
+    print(f"✅ Extraction unifiée: {len(page.text)} caractères, image {page.top_image}")
+
+def test_single_download_per_article():
+    """_extract_and_enhance_article ne télécharge la page qu'une seule fois"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/nouvelles/expansion-beauport"
+
+    scraper = FoodIndustryNewsScraper({'Local': {'type': 'website', 'url': url, 'category': 'A'}}, http_config={'state_dir': tempfile.mkdtemp()})
+    item = NewsItem(title="Expansion à Beauport", url=url, source='Local', published_date=datetime.now(), summary="")
+    scraper._extract_and_enhance_article(item)
+    server.shutdown()
+
+    assert Handler.hits == ['/nouvelles/expansion-beauport'], Handler.hits
+    assert item.image_url.endswith('/images/entrepot.jpg')
+    assert item.published_date.date().isoformat() == "2026-10-14"
+    assert item.relevance_score > 0
+    print(f"✅ 1 téléchargement pour contenu + image + date (score {item.relevance_score:.1f})")
+
+class BigPageHandler(BaseHTTPRequestHandler):
+    """Page de ~1 Mo dont le <head> fait moins de 1 Ko"""
+    def do_GET(self):
+        head = PAGE.split(b'<body>')[0]
+        body = b'<body>' + b'<p>' + b'x' * 1024 * 1024 + b'</p></body></html>'
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(head) + len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(head)
+            for i in range(0, len(body), 16384):
+                self.wfile.write(body[i:i + 16384])
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Le client a fermé la connexion après le <head>
+
+    def log_message(self, *args):
+        pass
+
+def test_head_only_probe():
+    """Résumé RSS riche: seul le <head> est lu pour l'image et la date"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), BigPageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/nouvelles/expansion-beauport"
+
+    scraper = FoodIndustryNewsScraper({'Local': {'type': 'website', 'url': url, 'category': 'A'}}, http_config={'state_dir': tempfile.mkdtemp()},
+                                      extraction_config={'rich_summary_chars': 500})
+    head_html, _ = scraper.http.fetch_head(url)
+    item = NewsItem(title="Expansion à Beauport", url=url, source='Local', published_date=datetime.now(), summary=PARAGRAPH * 4)
+    scraper._extract_and_enhance_article(item)
+    server.shutdown()
+
+    assert len(head_html) < 64 * 1024
+    assert item.full_text == item.summary
+    assert item.image_url.endswith('/images/entrepot.jpg')
+    assert item.canonical_url.endswith('/nouvelles/expansion-beauport')
+    assert item.published_date.date().isoformat() == "2026-10-14"
+    print(f"✅ Lecture du <head> seulement: {len(head_html)} octets sur ~1 Mo")
+
+def test_head_probe_observed():
+    """Un 429 sur la lecture du <head> ralentit l'hôte comme un téléchargement complet"""
+    class ThrottledHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(429)
+            self.send_header('Retry-After', '5')
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ThrottledHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/nouvelles/expansion-beauport"
+
+    scraper = FoodIndustryNewsScraper({'Local': {'type': 'website', 'url': url, 'category': 'A'}},
+                                      http_config={'state_dir': tempfile.mkdtemp(), 'max_retries': 0},
+                                      extraction_config={'rich_summary_chars': 500})
+    item = NewsItem(title="Expansion à Beauport", url=url, source='Local', published_date=datetime.now(), summary=PARAGRAPH * 4)
+    scraper._extract_and_enhance_article(item)
+    server.shutdown()
+
+    state = scraper.host_limiter.hosts["127.0.0.1"]
+    assert item.full_text == item.summary
+    assert state.throttled == 1 and state.blocked_until > 0
+    print("✅ Lecture du <head>: 429 et Retry-After observés par le limiteur")
+
+def test_boilerplate_pruning():
+    """Navigation, barre latérale et commentaires exclus; troncature pendant l'extraction"""
+    html = f"""<html><body><nav><a href="/">Accueil</a> <a href="/a">Actualités</a></nav>
+<div class="sidebar"><p>Lien populaire numéro un, lien populaire numéro deux, lien trois.</p></div>
+<div class="post-body"><p>{PARAGRAPH}</p><p>{PARAGRAPH}</p><p>{PARAGRAPH}</p></div>
+<div id="comments"><p>Premier commentaire d'un lecteur, très long et sans intérêt pour FLB.</p></div>
+</body></html>""".encode('utf-8')
+
+    page = ArticleExtractor().extract("https://example.com/a", html)
+    assert page.text.count("entrepôt de Beauport") == 3
+    assert "populaire" not in page.text and "commentaire" not in page.text and "Accueil" not in page.text
+
+    capped = ArticleExtractor(max_text_chars=300).extract("https://example.com/a", html)
+    assert len(capped.text) == 300
+    print("✅ Élaguage du bruit et troncature à l'extraction")
+
+if __name__ == "__main__":
+    test_extract_metadata()
+    test_boilerplate_pruning()
+    test_single_download_per_article()
+    test_head_only_probe()
+    test_head_probe_observed()
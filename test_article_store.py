@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test du magasin local d'articles (exécutions incrémentales)
+"""
+
+import os
+import sys
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, 'src')
+
+from article_store import ArticleStore
+from scraper import FoodIndustryNewsScraper, NewsItem
+
+PARAGRAPH = "Le grossiste alimentaire de Lévis ouvre un centre de distribution pour la restauration. "
+PAGE = f"""<html><head><meta property="og:image" content="/img/centre.jpg"></head>
+<body><article><h1>Centre de distribution</h1><p>{PARAGRAPH * 12}</p></article></body></html>""".encode('utf-8')
+
+class Handler(BaseHTTPRequestHandler):
+    hits = []
+
+    def do_GET(self):
+        Handler.hits.append(self.path)
+        if self.path == '/absent':
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.end_headers()
+        self.wfile.write(b"<html><body><nav>Accueil</nav></body></html>" if self.path == '/vide' else PAGE)
+
+    def log_message(self, *args):
+        pass
+
+def test_store_roundtrip_and_ttl():
+    path = os.path.join(tempfile.mkdtemp(), 'articles.sqlite3')
+    store = ArticleStore(path)
+    item = NewsItem('Centre', 'https://example.com/centre?utm_source=rss', 'Local', datetime(2026, 10, 1), 'Résumé',
+                    full_text=PARAGRAPH * 50, image_url='https://example.com/c.jpg', relevance_score=12.5)
+    store.put(item)
+    store.close()
+
+    record = ArticleStore(path).get('http://www.example.com/centre/')  # même URL canonique
+    assert record['full_text'] == PARAGRAPH * 50
+    assert record['image_url'] == 'https://example.com/c.jpg' and record['relevance_score'] == 12.5
+    stored, = sqlite3.connect(path).execute("SELECT length(full_text) FROM articles").fetchone()
+    assert stored < len(PARAGRAPH * 50) // 10  # texte compressé
+    assert ArticleStore(path, ttl_days=0).get('https://example.com/centre') is None
+    print("✅ Magasin: clé canonique, texte compressé, fraîcheur")
+
+def test_second_run_skips_download():
+    """Un article déjà extrait n'est plus téléchargé; les échecs et les replis sur le résumé ne sont pas mémorisés"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    scraper = FoodIndustryNewsScraper({'Local': {'type': 'rss', 'url': base, 'category': 'A'}}, http_config={'state_dir': tempfile.mkdtemp()})
+
+    for _ in range(2):
+        item = scraper._extract_and_enhance_article(NewsItem('Centre', f"{base}/centre", 'Local', datetime.now(), ''))
+        missing = scraper._extract_and_enhance_article(NewsItem('Absent', f"{base}/absent", 'Local', datetime.now(), ''))
+        empty = scraper._extract_and_enhance_article(NewsItem('Vide', f"{base}/vide", 'Local', datetime.now(), 'Résumé RSS'))
+        assert empty.full_text == 'Résumé RSS'  # repli sur le résumé, page sans texte
+        assert 'centre de distribution' in item.full_text
+        assert item.image_url == f"{base}/img/centre.jpg"
+        assert item.relevance_score > 0 and missing.full_text == ''
+    server.shutdown()
+
+    assert Handler.hits == ['/centre', '/absent', '/vide', '/absent', '/vide'], Handler.hits
+    assert (scraper.article_store.hits, scraper.article_store.misses) == (1, 5)
+    print("✅ Seconde exécution servie par le magasin sans téléchargement")
+
+if __name__ == "__main__":
+    test_store_roundtrip_and_ttl()
+    test_second_run_skips_download()
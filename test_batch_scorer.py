@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test du scoring de pertinence par lot (matrices creuses NumPy)
+"""
+
+import sys
+import random
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, 'src')
+
+import config
+from analyzer_engine import BM25Analyzer
+from scraper import FoodIndustryNewsScraper, NewsItem
+
+VOCABULARY = list(config.RELEVANCE_KEYWORDS) + ['pas de', 'fermeture', 'canada', 'canadien', 'le', 'des', '.', '.', 'QUÉBEC', '\n']
+
+def _corpus(count, seed=11):
+    rnd = random.Random(seed)
+    words = lambda n: ' '.join(rnd.choice(VOCABULARY) for _ in range(rnd.randint(0, n)))
+    return [NewsItem(words(6), f"https://example.com/{n}", rnd.choice(['A', 'B']), datetime.now() - timedelta(days=rnd.randint(0, 6)),
+                     words(25), full_text=words(150)) for n in range(count)]
+
+def _scraper():
+    sources = {'A': {'type': 'rss', 'category': 'A', 'priority_multiplier': 1.2}, 'B': {'type': 'rss', 'category': 'C'}}
+    return FoodIndustryNewsScraper(sources, keywords_config=config.RELEVANCE_KEYWORDS, http_config={'feed_cache_enabled': False, 'state_dir': tempfile.mkdtemp()},
+                                   extraction_config={'article_store_enabled': False})
+
+def test_batch_matches_per_article_scoring():
+    scraper = _scraper()
+    assert scraper.batch_scorer is not None
+    items = _corpus(150)
+    for include_full_text in (False, True):
+        expected = []
+        for item in items:
+            key, multiplier, days_old = scraper._score_inputs(item, include_full_text)
+            expected.append(scraper._score_content(item, include_full_text, multiplier, days_old))
+        scores = scraper._score_batch(items, include_full_text)
+        assert all(abs(score - cached.score) < 1e-9 * max(1.0, cached.score) for score, cached in zip(scores, expected))
+        if include_full_text:
+            assert all(item.tags == cached.tags for item, cached in zip(items, expected) if cached.score > 0)
+    print(f"✅ Scores par lot identiques au scoring article par article ({len(items)} articles)")
+
+def test_prefilter_scores_every_candidate():
+    scraper = _scraper()
+    items = _corpus(90, seed=4)
+    for item in items:
+        item.title = 'Distributeur alimentaire ' + item.title
+    selected = scraper._pre_filter_articles(items)
+    assert scraper.score_cache.misses == len(items)  # aucun candidat écarté avant le scoring
+    best = max(items, key=lambda item: item.relevance_score)
+    assert best in selected
+    print(f"✅ Pré-filtrage: {scraper.score_cache.misses} candidats notés, {len(selected)} retenus")
+
+def test_bm25_keyword_scores_batch():
+    analyzer = BM25Analyzer(config.RELEVANCE_KEYWORDS)
+    documents = [f"{item.title} {item.summary} {item.full_text}" for item in _corpus(80, seed=2)] + ['']
+    batch = analyzer.keyword_scores(documents)
+    assert all(abs(score - analyzer._keyword_score(document)) < 1e-9 for score, document in zip(batch, documents))
+    print("✅ Scores de mots-clés BM25 calculés en lot")
+
+if __name__ == "__main__":
+    test_batch_matches_per_article_scoring()
+    test_prefilter_scores_every_candidate()
+    test_bm25_keyword_scores_batch()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test du scoring BM25 par lot (un seul passage sur le corpus, documents retrouvés par position)
+et des statistiques de corpus persistantes entre exécutions
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+sys.path.insert(0, 'src')
+
+import analyzer_engine
+from analyzer_engine import BM25Analyzer
+from corpus_stats import CorpusStats
+
+KEYWORDS = {'distributeur alimentaire': 10, 'québec': 8, 'supply chain': 7, 'restauration': 6, 'grossiste': 6}
+DOCUMENTS = [
+    "Les distributeurs alimentaires du Québec font face à de nouveaux défis d'approvisionnement.",
+    "Un grossiste de Québec livre la restauration et l'hôtellerie.",
+    "La météo sera ensoleillée demain.",
+    "Un grossiste de Québec livre la restauration et l'hôtellerie.",  # doublon exact
+    "Supply chain innovation transforms food distribution in Quebec restaurants."
+]
+
+class CountingIndex:
+    """Index BM25 réel dont les passages sur le corpus sont comptés"""
+
+    def __init__(self, index):
+        self.index = index
+        self.passes = 0
+
+    def get_scores(self, query_tokens):
+        self.passes += 1
+        return self.index.get_scores(query_tokens)
+
+def test_score_batch_single_pass():
+    analyzer = BM25Analyzer(KEYWORDS)
+    if not hasattr(analyzer_engine, 'BM25Okapi'):
+        scores = analyzer.score_batch(DOCUMENTS)
+        assert scores == [analyzer._keyword_score(document) for document in DOCUMENTS]
+        print("✅ rank-bm25 absent: score_batch se replie sur les mots-clés")
+        return
+
+    available = analyzer_engine.BM25_AVAILABLE
+    analyzer_engine.BM25_AVAILABLE = True
+    try:
+        analyzer.build_index(DOCUMENTS)
+        analyzer.bm25_index = counting = CountingIndex(analyzer.bm25_index)
+        scores = analyzer.score_batch(DOCUMENTS)
+        assert counting.passes == 1
+        assert scores[1] == scores[3] and scores[1] > scores[2]
+        assert all(abs(analyzer.score_document(document) - score) < 1e-12 for document, score in zip(DOCUMENTS, scores))
+        assert counting.passes == 1  # scores du corpus réutilisés, requête tokenisée une fois
+        assert len(analyzer._query_tokens) == 1
+    finally:
+        analyzer_engine.BM25_AVAILABLE = available
+    print(f"✅ BM25: {len(DOCUMENTS)} documents notés en {counting.passes} passage sur le corpus")
+
+def test_corpus_stats_persist_and_expire():
+    analyzer = BM25Analyzer(KEYWORDS)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'terms.sqlite3')
+        stats = CorpusStats(path)
+        tokenized = [analyzer.tokenizer(document) for document in DOCUMENTS]
+        assert stats.add_many(zip(DOCUMENTS, tokenized)) == 4  # doublon exact compté une fois
+        assert stats.add_many(zip(DOCUMENTS[:2], tokenized[:2])) == 0
+        term = tokenized[1][1]
+        df, avgdl = stats.document_frequency(term), stats.avgdl
+        stats.close()
+
+        stats = CorpusStats(path)  # exécution suivante
+        assert (stats.doc_count, stats.document_frequency(term), stats.avgdl) == (4, df, avgdl)
+        stats.add_many([("Un grossiste livre les épiceries.", analyzer.tokenizer("Un grossiste livre les épiceries."))])
+        assert stats.doc_count == 5 and stats.document_frequency(term) == df + 1  # mise à jour incrémentale
+        stats.close()
+
+        stats = CorpusStats(path, window_days=1)
+        with stats._conn:
+            stats._conn.execute("UPDATE documents SET added_at = ? WHERE length > 10", (time.time() - 2 * 86400,))
+        stats.expire()
+        assert 0 < stats.doc_count < 5
+        assert stats.doc_count == stats._conn.execute("SELECT COUNT(DISTINCT doc_key) FROM postings").fetchone()[0]
+        assert stats.document_frequency(term) == stats._conn.execute(
+            "SELECT COUNT(*) FROM postings WHERE term = ?", (term,)).fetchone()[0]
+        stats.close()
+    print(f"✅ Corpus BM25 persistant: df et longueur moyenne ({avgdl:.1f}) repris et mis à jour sans recompter")
+
+def test_score_batch_with_corpus_stats():
+    with tempfile.TemporaryDirectory() as tmp:
+        stats = CorpusStats(os.path.join(tmp, 'terms.sqlite3'))
+        analyzer = BM25Analyzer(KEYWORDS, stats)
+        scores = analyzer.score_batch(DOCUMENTS)
+        assert analyzer.bm25_index is None and stats.doc_count == 4  # aucun index reconstruit
+        assert scores[1] == scores[3] and scores[1] > scores[2]
+        assert all(abs(analyzer.score_document(document) - score) < 1e-12 for document, score in zip(DOCUMENTS, scores))
+        analyzer.score_batch(DOCUMENTS)
+        assert stats.doc_count == 4
+        stats.close()
+    print("✅ BM25 noté contre les statistiques globales, sans index par exécution")
+
+if __name__ == "__main__":
+    test_score_batch_single_pass()
+    test_corpus_stats_persist_and_expire()
+    test_score_batch_with_corpus_stats()
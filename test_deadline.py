@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Test des échéances: le travail est réellement abandonné et les threads libérés
+"""
+
+import sys
+import time
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, 'src')
+
+from deadline import Deadline, DeadlineExceeded, RunBudget
+from http_client import HttpClient
+from scraper import FoodIndustryNewsScraper, NewsItem
+
+class TrickleHandler(BaseHTTPRequestHandler):
+    """Réponse au compte-gouttes: un octet toutes les 0,2 s (le timeout par lecture ne se déclenche jamais)"""
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml')
+        self.end_headers()
+        try:
+            self.wfile.write(b'<?xml version="1.0"?><rss><channel>')
+            for _ in range(100):
+                time.sleep(0.2)
+                self.wfile.write(b' ')
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, *args):
+        pass
+
+def scraping_threads() -> int:
+    """Threads hors serveur de test (ses threads de requête finissent au prochain octet écrit)"""
+    return sum(1 for thread in threading.enumerate() if 'process_request_thread' not in thread.name)
+
+def start_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), TrickleHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def test_deadline_nesting():
+    """Une phase n'excède jamais l'échéance de l'exécution"""
+    run = Deadline(1.0)
+    phase = run.child(60, 'sources')
+    assert phase.remaining() <= 1.0
+    assert Deadline.never().timeout(10) == 10
+    expired = Deadline(0)
+    try:
+        expired.check()
+        assert False, "DeadlineExceeded attendue"
+    except DeadlineExceeded:
+        pass
+    print("✅ Échéances imbriquées")
+
+def test_fetch_stops_at_deadline():
+    """Un flux au compte-gouttes est coupé à l'échéance malgré un timeout de lecture de 10 s"""
+    server = start_server()
+    client = HttpClient()
+    start = time.time()
+    result = client.fetch(f"http://127.0.0.1:{server.server_port}/feed", timeout=10, deadline=Deadline(1.0))
+    elapsed = time.time() - start
+    client.close()
+    server.shutdown()
+
+    assert result.error in ("deadline", "timeout"), result
+    assert elapsed < 2.0, f"{elapsed:.1f}s"
+    print(f"✅ Téléchargement abandonné à l'échéance ({elapsed:.2f}s)")
+
+def test_phase_releases_threads():
+    """Phase 1: retour à l'échéance et aucun thread de scraping laissé en arrière-plan"""
+    server = start_server()
+    base = f"http://127.0.0.1:{server.server_port}"
+    sources = {f'Lent {i}': {'type': 'rss', 'url': f"{base}/feed/{i}", 'category': 'B'} for i in range(8)}
+    scraper = FoodIndustryNewsScraper(sources, http_config={'feed_cache_enabled': False, 'state_dir': tempfile.mkdtemp()})
+
+    threads_before = scraping_threads()
+    start = time.time()
+    news = scraper._parallel_scrape_sources(datetime.now() - timedelta(days=7), Deadline(1.0, name='sources'))
+    elapsed = time.time() - start
+    server.shutdown()
+
+    assert news == []
+    assert elapsed < 2.5, f"{elapsed:.1f}s"
+    assert scraping_threads() <= threads_before, (threads_before, scraping_threads())
+    print(f"✅ Phase abandonnée en {elapsed:.2f}s, threads libérés")
+
+def test_run_budget_split():
+    """Part du temps restant par phase, plafonds respectés, temps non consommé reporté sur les phases suivantes"""
+    budget = RunBudget(Deadline(100), caps={'sources': 20})
+    assert 19.9 < budget.phase('sources').remaining() <= 20  # 30 s plafonnées à 20 s
+    assert 64 < budget.phase('extraction').remaining() <= 64.3  # 45 / 70 du restant
+    assert 59.9 < budget.phase('analysis').remaining() <= 60
+    assert 99.9 < budget.phase('translation').remaining() <= 100  # dernière phase: tout le restant
+    streaming = RunBudget(Deadline(100))
+    streaming.phase('sources')
+    assert 74.9 < streaming.phase('sources', 'extraction').remaining() <= 75
+    assert 59.9 < RunBudget(Deadline.never(), caps={'sources': 60}).phase('sources').remaining() <= 60
+    print("✅ Budget d'exécution réparti entre les phases")
+
+def test_value_ordered_work_within_budget():
+    """Extraction par valeur attendue (pré-score x catégorie); traduction arrêtée à l'épuisement du budget"""
+    sources = {'Source A': {'type': 'rss', 'url': 'http://localhost/a', 'category': 'A'},
+               'Source C': {'type': 'rss', 'url': 'http://localhost/c', 'category': 'C'}}
+    scraper = FoodIndustryNewsScraper(sources, http_config={'max_workers': 1, 'state_dir': tempfile.mkdtemp()})
+    articles = [NewsItem(f"Article {n}", f"http://localhost/{n}", source, datetime.now(), 'Résumé', relevance_score=score)
+                for n, (source, score) in enumerate([('Source C', 15), ('Source A', 4), ('Source A', 10), ('Source C', 5)])]
+    order = []
+
+    def extract(item, deadline=None):
+        order.append(item.title)
+        time.sleep(0.2)
+        deadline.check()
+        item.full_text = 'Texte complet'
+        return item
+
+    scraper._extract_and_enhance_article = extract
+    enhanced = scraper._parallel_extract_content(articles, Deadline(0.5, name='extraction'))
+    assert order[:2] == ['Article 2', 'Article 0'], order  # 10 x 1.0 puis 15 x 0.6
+    fallbacks = [item.title for item in enhanced if item.full_text != 'Texte complet']
+    assert 'Article 2' not in fallbacks and 'Article 3' in fallbacks  # les moins prometteurs en repli
+
+    translated = []
+    scraper.translator.translate_if_needed = lambda text, source: translated.append(text) or text
+    scraper._translate_selected_news(articles, Deadline(0))
+    assert translated == []
+    print(f"✅ Travail ordonné par valeur attendue: {', '.join(order)}")
+
+if __name__ == "__main__":
+    test_deadline_nesting()
+    test_fetch_stops_at_deadline()
+    test_phase_releases_threads()
+    test_run_budget_split()
+    test_value_ordered_work_within_budget()
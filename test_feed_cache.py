@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Test du cache de flux RSS par GET conditionnel (ETag / Last-Modified)
+"""
+
+import sys
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, 'src')
+
+from scraper import FoodIndustryNewsScraper
+
+FEED = f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Test</title>
+<item><title>Grossiste alimentaire à Lévis</title><link>https://example.com/a</link>
+<pubDate>{format_datetime(datetime.now().astimezone())}</pubDate>
+<description>Nouvel entrepôt pour la restauration.</description>
+<enclosure url="https://example.com/a.jpg" type="image/jpeg" length="0"/></item>
+</channel></rss>""".encode('utf-8')
+
+class Handler(BaseHTTPRequestHandler):
+    statuses = []
+
+    def do_GET(self):
+        if self.headers.get('If-None-Match') == '"v1"':
+            Handler.statuses.append(304)
+            self.send_response(304)
+            self.end_headers()
+            return
+        Handler.statuses.append(200)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml')
+        self.send_header('ETag', '"v1"')
+        self.send_header('Content-Length', str(len(FEED)))
+        self.end_headers()
+        self.wfile.write(FEED)
+
+    def log_message(self, *args):
+        pass
+
+def test_conditional_get():
+    """Le second passage reçoit un 304 et réutilise les entrées cachées"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    config = {'type': 'rss', 'url': f"http://127.0.0.1:{server.server_port}/feed"}
+
+    scraper = FoodIndustryNewsScraper({'Local': config}, http_config={'state_dir': tempfile.mkdtemp()})
+    cutoff = datetime(2000, 1, 1)
+
+    first = scraper._scrape_rss_basic('Local', config, cutoff)
+    second = scraper._scrape_rss_basic('Local', config, cutoff)
+    server.shutdown()
+
+    assert Handler.statuses == [200, 304]
+    assert [i.title for i in first] == [i.title for i in second] == ['Grossiste alimentaire à Lévis']
+    assert second[0].image_url == 'https://example.com/a.jpg'
+    assert second[0].published_date == first[0].published_date
+    assert (scraper.feed_cache.hits, scraper.feed_cache.misses) == (1, 1)
+    print("✅ Flux inchangé servi depuis le cache (304)")
+
+def _dated_feed(ages):
+    items = ''.join(f"""<item><title>Article {n}</title><link>https://example.com/{n}</link>
+<pubDate>{format_datetime((datetime.now() - timedelta(days=age)).astimezone())}</pubDate></item>""" for n, age in enumerate(ages))
+    return f"""<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>Test</title>{items}</channel></rss>""".encode('utf-8')
+
+class DatedHandler(BaseHTTPRequestHandler):
+    statuses = []
+    feed = _dated_feed([0, 10, 11, 12, 20, 30])
+
+    def do_GET(self):
+        if self.headers.get('If-None-Match') == '"v2"':
+            DatedHandler.statuses.append(304)
+            self.send_response(304)
+            self.end_headers()
+            return
+        DatedHandler.statuses.append(200)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml')
+        self.send_header('ETag', '"v2"')
+        self.end_headers()
+        self.wfile.write(DatedHandler.feed)
+
+    def log_message(self, *args):
+        pass
+
+def test_wider_window_rereads_feed():
+    """Entrées cachées après arrêt anticipé: une fenêtre plus large relit le flux au lieu du 304"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), DatedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    config = {'type': 'rss', 'url': f"http://127.0.0.1:{server.server_port}/feed"}
+    scraper = FoodIndustryNewsScraper({'Local': config}, http_config={'max_retries': 0, 'state_dir': tempfile.mkdtemp()})
+
+    week = scraper._scrape_rss_basic('Local', config, datetime.now() - timedelta(days=7))
+    narrower = scraper._scrape_rss_basic('Local', config, datetime.now() - timedelta(days=3))
+    month = scraper._scrape_rss_basic('Local', config, datetime.now() - timedelta(days=45))
+    again = scraper._scrape_rss_basic('Local', config, datetime.now() - timedelta(days=45))
+    server.shutdown()
+
+    assert DatedHandler.statuses == [200, 304, 200, 304]
+    assert len(week) == len(narrower) == 1
+    assert len(month) == len(again) == 6
+    print(f"✅ Fenêtre élargie: flux relu ({len(month)} articles au lieu de {len(week)}), puis 304")
+
+if __name__ == "__main__":
+    test_conditional_get()
+    test_wider_window_rereads_feed()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test du parseur RSS/Atom rapide (iterparse) et du repli feedparser
+"""
+
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, 'src')
+
+import feedparser
+from feed_parser import parse_feed
+from scraper import FoodIndustryNewsScraper
+
+def _rss(days_old):
+    items = ''.join(f"""
+<item><title>Article {n}</title><link>https://example.com/{n}</link>
+<pubDate>{(datetime(2026, 10, 1) - timedelta(days=d)).strftime('%a, %d %b %Y 12:00:00 +0000')}</pubDate>
+<description><![CDATA[<p>Résumé <b>{n}</b></p>]]></description>
+<media:thumbnail url="https://example.com/{n}-t.jpg"/>
+<media:content url="https://example.com/{n}.jpg" medium="image"/></item>""" for n, d in enumerate(days_old))
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/"><channel><title>Test</title>{items}
+</channel></rss>""".encode('utf-8')
+
+ATOM = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom"><title>Atom</title>
+<entry><title type="html">Grossiste &amp; distributeur</title>
+<link rel="alternate" href="https://example.com/atom-1"/>
+<link rel="enclosure" type="image/png" href="https://example.com/atom-1.png"/>
+<published>2026-09-30T08:00:00-04:00</published><updated>2026-10-01T00:00:00Z</updated>
+<summary>Nouvel entrepôt</summary></entry>
+</feed>""".encode('utf-8')
+
+def test_rss_fields_match_feedparser():
+    """Mêmes champs que la normalisation feedparser (résumé réduit au texte brut sur les deux chemins)"""
+    content = _rss([0, 1, 2])
+    fast = parse_feed(content)
+    scraper = FoodIndustryNewsScraper({}, http_config={'state_dir': tempfile.mkdtemp()})
+    slow = scraper._normalize_feed_entries('Test', feedparser.parse(content))
+
+    assert [e['link'] for e in fast] == [e['link'] for e in slow]
+    assert [e['published'] for e in fast] == [e['published'] for e in slow]
+    assert [e['image_url'] for e in fast] == [e['image_url'] for e in slow] == [f"https://example.com/{n}.jpg" for n in range(3)]
+    assert [e['summary'] for e in fast] == [e['summary'] for e in slow] == [f"Résumé {n}" for n in range(3)]
+    print("✅ RSS: titres, liens, dates UTC, résumés et images identiques à feedparser")
+
+def test_atom():
+    entry, = parse_feed(ATOM)
+    assert entry['title'] == 'Grossiste & distributeur'
+    assert entry['link'] == 'https://example.com/atom-1'
+    assert entry['image_url'] == 'https://example.com/atom-1.png'
+    assert entry['published'] == '2026-09-30T12:00:00'  # <published> préféré à <updated>, en UTC
+    print("✅ Atom: lien alternate, enclosure image, date de publication")
+
+def test_early_stop():
+    """Arrêt au quota d'entrées, ou après quelques entrées plus vieilles que la limite"""
+    assert len(parse_feed(_rss(range(40)))) == 20
+    entries = parse_feed(_rss(range(40)), cutoff=datetime(2026, 10, 1) - timedelta(days=5, hours=1))
+    assert len(entries) == 9  # 6 entrées récentes + 3 périmées d'affilée
+    print("✅ Lecture arrêtée au quota et à la date limite")
+
+def test_malformed_falls_back():
+    """Flux mal formé ou page HTML: None, et le scraper repasse par feedparser"""
+    broken = _rss([0, 1]).replace(b'</title><link>https://example.com/1', b'</titl><link>https://example.com/1')
+    assert parse_feed(broken) is None
+    assert parse_feed(b'<html><body><p>Pas un flux</p></body></html>') is None
+    print("✅ Flux mal formés renvoyés à feedparser")
+
+if __name__ == "__main__":
+    test_rss_fields_match_feedparser()
+    test_atom()
+    test_early_stop()
+    test_malformed_falls_back()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Test du moteur de récupération asyncio (serveur HTTP local, sans réseau externe)
+"""
+
+import sys
+import time
+import asyncio
+import tempfile
+import threading
+from datetime import datetime
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, 'src')
+
+from fetch_engine import AsyncFetchEngine
+from scraper import FoodIndustryNewsScraper
+
+NOW = format_datetime(datetime.now().astimezone())
+
+FEED = f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Test</title>
+<item><title>Distributeur alimentaire au Québec</title><link>{{base}}/article/1</link>
+<pubDate>{NOW}</pubDate><description>Un grossiste alimentaire de la ville de Québec investit dans la restauration.</description></item>
+</channel></rss>"""
+
+ARTICLE = """<html><head><meta property="og:image" content="https://img.example.com/a.jpg"></head>
+<body><article><p>Le distributeur alimentaire de Québec agrandit son entrepôt pour servir les restaurants.</p></article></body></html>"""
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == '/slow':
+            time.sleep(3)
+        base = f"http://127.0.0.1:{self.server.server_port}"
+        body = FEED.replace('{base}', base) if self.path == '/feed' else ARTICLE
+        data = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml' if self.path == '/feed' else 'text/html')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+def start_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def test_fetch_timeout():
+    """Un timeout par requête doit réellement interrompre la requête"""
+    server = start_server()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    async def run():
+        async with AsyncFetchEngine(default_timeout=0.5) as engine:
+            start = time.time()
+            results = await engine.fetch_many([f"{base}/slow", f"{base}/feed"])
+            return results, time.time() - start
+
+    (slow, fast), elapsed = asyncio.run(run())
+    server.shutdown()
+
+    assert slow.error == "timeout", slow
+    assert fast.ok and b"<rss" in fast.content
+    assert elapsed < 2.5, f"timeout non respecté: {elapsed:.1f}s"
+    print(f"✅ Timeout par requête respecté ({elapsed:.2f}s)")
+
+def test_fetch_head():
+    """fetch_head s'arrête à la fin du <head>"""
+    server = start_server()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    async def run():
+        async with AsyncFetchEngine() as engine:
+            return await engine.fetch_head(f"{base}/article/1")
+
+    result = asyncio.run(run())
+    server.shutdown()
+
+    assert result.ok and b'og:image' in result.content
+    assert b'distributeur' not in result.content
+    print(f"✅ fetch_head: {len(result.content)} octets lus")
+
+def test_ascrape_all_sources():
+    """Pipeline async complet sur une source RSS locale"""
+    server = start_server()
+    base = f"http://127.0.0.1:{server.server_port}"
+    sources = {'Local Feed': {'type': 'rss', 'url': f"{base}/feed", 'category': 'A', 'priority_multiplier': 1.5}}
+
+    scraper = FoodIndustryNewsScraper(sources, bulletin_config={'max_articles': 7, 'max_per_source': 2}, http_config={'state_dir': tempfile.mkdtemp()})
+    scraper._translate_selected_news = lambda items, deadline=None: None
+    items = asyncio.run(scraper.ascrape_all_sources(days_back=7))
+    server.shutdown()
+
+    assert len(items) == 1
+    assert "entrepôt" in items[0].full_text
+    assert items[0].image_url == "https://img.example.com/a.jpg"
+    print(f"✅ ascrape_all_sources: {items[0].title} (score {items[0].relevance_score:.1f})")
+
+if __name__ == "__main__":
+    test_fetch_timeout()
+    test_fetch_head()
+    test_ascrape_all_sources()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test du limiteur de concurrence adaptatif par hôte (AIMD)
+"""
+
+import sys
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, 'src')
+
+from host_limiter import HostLimiter
+
+def test_aimd_adjustments():
+    """Hausse additive sur succès rapides, division sur 429 et timeout"""
+    limiter = HostLimiter(initial_per_host=2, max_per_host=8)
+    for _ in range(20):
+        with limiter.slot("https://rapide.example.com/a") as slot:
+            slot.observe(200)
+    fast = limiter.limit_for("rapide.example.com")
+    assert fast > 4, fast
+
+    with limiter.slot("https://rapide.example.com/b") as slot:
+        slot.observe(429)
+    assert limiter.limit_for("rapide.example.com") == fast / 2
+
+    for _ in range(5):
+        with limiter.slot("https://lent.example.com/a") as slot:
+            slot.observe(0, "timeout")
+    assert limiter.limit_for("lent.example.com") == 1
+    assert limiter.active_total == 0
+    print(f"✅ AIMD: hôte rapide {fast:.1f} → {fast / 2:.1f} après 429, hôte lent à 1")
+
+def test_retry_after_blocks_host():
+    """Retry-After suspend l'hôte sans bloquer les autres"""
+    limiter = HostLimiter()
+    with limiter.slot("https://bloque.example.com/a") as slot:
+        slot.observe(503, "HTTP 503", "0.3")
+
+    start = time.time()
+    with limiter.slot("https://autre.example.com/a"):
+        pass
+    other = time.time() - start
+    with limiter.slot("https://bloque.example.com/b"):
+        pass
+    blocked = time.time() - start
+    assert other < 0.1 and blocked >= 0.25, (other, blocked)
+    print(f"✅ Retry-After respecté ({blocked:.2f}s) sans pénaliser les autres hôtes")
+
+def test_per_host_and_global_caps():
+    """Jamais plus que la fenêtre par hôte ni que le plafond global"""
+    limiter = HostLimiter(global_limit=5, initial_per_host=2, max_per_host=2)
+    lock = threading.Lock()
+    peak = {'total': 0, 'hosts': {}}
+    current = {'total': 0, 'hosts': {}}
+
+    def work(url, host):
+        with limiter.slot(url) as slot:
+            with lock:
+                current['total'] += 1
+                current['hosts'][host] = current['hosts'].get(host, 0) + 1
+                peak['total'] = max(peak['total'], current['total'])
+                peak['hosts'][host] = max(peak['hosts'].get(host, 0), current['hosts'][host])
+            time.sleep(0.02)
+            with lock:
+                current['total'] -= 1
+                current['hosts'][host] -= 1
+            slot.observe(200)
+
+    with ThreadPoolExecutor(max_workers=20) as executor:
+        for i in range(60):
+            host = f"site{i % 4}.example.com"
+            executor.submit(work, f"https://{host}/{i}", host)
+
+    assert peak['total'] <= 5, peak
+    assert max(peak['hosts'].values()) <= 2, peak
+    print(f"✅ Plafonds respectés: {peak['total']} simultanées au total, {max(peak['hosts'].values())} par hôte")
+
+def test_async_slots():
+    """Emplacements asyncio: la fenêtre par hôte limite les requêtes en vol"""
+    limiter = HostLimiter(initial_per_host=1, max_per_host=1)
+    in_flight = {'now': 0, 'peak': 0}
+
+    async def fetch(i):
+        async with limiter.aslot(f"https://unique.example.com/{i}") as slot:
+            in_flight['now'] += 1
+            in_flight['peak'] = max(in_flight['peak'], in_flight['now'])
+            await asyncio.sleep(0.01)
+            in_flight['now'] -= 1
+            slot.observe(200)
+
+    async def run():
+        await asyncio.gather(*(fetch(i) for i in range(10)))
+
+    asyncio.run(run())
+    assert in_flight['peak'] == 1 and limiter.active_total == 0
+    print("✅ Emplacements asyncio sérialisés par hôte")
+
+if __name__ == "__main__":
+    test_aimd_adjustments()
+    test_retry_after_blocks_host()
+    test_per_host_and_global_caps()
+    test_async_slots()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test du client HTTP mutualisé (réutilisation des connexions, en-têtes communs)
+"""
+
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, 'src')
+
+from http_client import HttpClient, get_http_client
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive
+    client_ports = set()
+    user_agents = set()
+
+    def do_GET(self):
+        Handler.client_ports.add(self.client_address[1])
+        Handler.user_agents.add(self.headers.get('User-Agent'))
+        data = b"<html><body>ok</body></html>"
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+def test_connection_reuse():
+    """Plusieurs pages du même hôte doivent partager une seule connexion TCP"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    client = HttpClient({'user_agent': 'FLBTest/1.0'})
+    for i in range(10):
+        assert client.fetch(f"{base}/article/{i}").status == 200
+    client.close()
+    server.shutdown()
+
+    assert len(Handler.client_ports) == 1, f"{len(Handler.client_ports)} connexions ouvertes"
+    assert Handler.user_agents == {'FLBTest/1.0'}
+    print("✅ 10 requêtes sur 1 connexion keep-alive")
+
+class CappedHandler(BaseHTTPRequestHandler):
+    """Page de listing géante (chunked, sans fin annoncée) et lien PDF"""
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        if self.path.endswith('.pdf'):
+            data = b'%PDF-1.4' + b'0' * 1024 * 1024
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/pdf')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            try:
+                self.wfile.write(data)
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        try:
+            self.wfile.write(b'<html><body>')
+            for _ in range(2000):  # ~16 Mo si le client lit tout
+                self.wfile.write(b'<article><h2>Titre</h2><a href="/a">lien</a></article>' * 128)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, *args):
+        pass
+
+def test_fetch_byte_cap():
+    """fetch() coupe le corps au plafond et ignore les types non HTML"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), CappedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    client = HttpClient({'max_page_bytes': 256 * 1024})
+    listing = client.fetch(f"{base}/listing")
+    pdf = client.fetch(f"{base}/rapport.pdf")
+    client.close()
+    server.shutdown()
+
+    assert listing.ok and listing.truncated
+    assert len(listing.content) == 256 * 1024
+    assert pdf.error.startswith("type de contenu ignoré") and pdf.content == b""
+    assert pdf.header('content-type') == 'application/pdf'
+    print(f"✅ Plafond respecté: {len(listing.content)} octets gardés, PDF ignoré")
+
+def test_shared_client():
+    """Un client partagé par configuration: les réglages d'un scraper ne sont jamais ignorés"""
+    assert get_http_client() is get_http_client({})
+    assert 'gzip' in get_http_client().session.headers['Accept-Encoding']
+    capped = get_http_client({'max_page_bytes': 1024, 'max_retries': 0})
+    assert capped is get_http_client({'max_retries': 0, 'max_page_bytes': 1024})
+    assert capped is not get_http_client() and capped.max_bytes == 1024
+    assert get_http_client({'user_agent': 'FLBTest/2.0'}).session.headers['User-Agent'] == 'FLBTest/2.0'
+    print("✅ Client partagé unique par configuration")
+
+if __name__ == "__main__":
+    test_connection_reuse()
+    test_fetch_byte_cap()
+    test_shared_client()
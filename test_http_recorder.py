@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Test de l'enregistrement et du rejeu HTTP (exécutions hors ligne reproductibles)
+"""
+
+import os
+import sys
+import time
+import asyncio
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, 'src')
+
+from src import http_recorder
+from src.fetch_engine import AsyncFetchEngine
+from src.http_client import HttpClient
+from src.analyzer_engine import HybridAnalysisEngine
+
+PAGE = ("<html><head><title>Distribution</title></head><body><p>"
+        + "Le distributeur alimentaire de Rimouski livre les restaurants. " * 40 + "</p></body></html>").encode('utf-8')
+
+class Handler(BaseHTTPRequestHandler):
+    hits = []
+
+    def do_GET(self):
+        Handler.hits.append(self.path)
+        if self.path == '/court':
+            self.send_response(301)
+            self.send_header('Location', '/article')
+            self.end_headers()
+            return
+        time.sleep(0.05)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        Handler.hits.append(self.path)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(b'{"translations": [{"text": "' + body.upper() + b'"}]}')
+
+    def log_message(self, *args):
+        pass
+
+def test_record_then_replay_offline():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    archive = os.path.join(tempfile.mkdtemp(), 'run.jsonl.gz')
+
+    def run():
+        client = HttpClient({'max_retries': 0})
+        page = client.fetch(f"{base}/article")
+        head, _ = client.fetch_head(f"{base}/article")
+        final_url = client.resolve_redirect(f"{base}/court")
+        translated = [requests.post(f"{base}/v2/translate", data=text).json() for text in ('bonjour', 'merci')]
+        return page.content, head, final_url, translated
+
+    http_recorder.install(archive, http_recorder.RECORD)
+    try:
+        recorded = run()
+    finally:
+        http_recorder.uninstall()
+    server.shutdown()
+    server.server_close()
+    hits = len(Handler.hits)
+
+    recorder = http_recorder.install(archive, http_recorder.REPLAY, latency=0)
+    try:
+        assert run() == recorded
+        assert recorded[0] == PAGE and recorded[1].endswith(b'</title>') and recorded[2] == f"{base}/article"
+        assert recorded[3][1] == {'translations': [{'text': 'MERCI'}]}  # corps du POST dans la clé
+        missing = HttpClient({'max_retries': 0}).fetch(f"{base}/absent")
+        assert not missing.ok and "Absent de l'archive" in missing.error
+        assert recorder.missing == 1
+    finally:
+        http_recorder.uninstall()
+    assert len(Handler.hits) == hits  # aucune requête réseau au rejeu
+    print(f"✅ {recorder.replayed} réponses rejouées à l'identique sans réseau")
+
+def test_replay_latency_and_async_engine():
+    archive = os.path.join(tempfile.mkdtemp(), 'run.jsonl.gz')
+    recorder = http_recorder.install(archive, http_recorder.RECORD)
+    recorder.record('GET', 'https://example.com/lent', None, 200, 'OK', {'Content-Type': 'text/html'}, PAGE, elapsed=0.3)
+    http_recorder.uninstall()
+
+    async def fetch_all():
+        async with AsyncFetchEngine(sync_client=HttpClient({'max_retries': 0})) as engine:
+            return await engine.fetch('https://example.com/lent'), await engine.fetch_head('https://example.com/lent')
+
+    for latency, minimum in ((None, 0.3), (0.1, 0.1)):
+        http_recorder.install(archive, http_recorder.REPLAY, latency=latency)
+        try:
+            start_time = time.time()
+            page, head = asyncio.run(fetch_all())
+            assert time.time() - start_time >= 2 * minimum
+        finally:
+            http_recorder.uninstall()
+        assert page.ok and page.content == PAGE and head.content.endswith(b'</title>')
+    print("✅ Latence d'origine ou fixe, moteur asyncio servi par l'archive")
+
+def test_replay_twice_same_bm25_scores():
+    """Sous enregistrement/rejeu, le corpus BM25 persistant n'évolue pas d'un rejeu à l'autre"""
+    import config
+    import main
+    saved = {name: dict(getattr(config, name)) for name in ('HTTP_CONFIG', 'EXTRACTION_CONFIG', 'ANALYSIS_CONFIG')}
+    saved_main = dict(main.ANALYSIS_CONFIG or {})
+    tmp = tempfile.mkdtemp()
+    archive = os.path.join(tmp, 'run.jsonl.gz')
+    urls = [f"https://example.com/article/{n}" for n in range(3)]
+    recorder = http_recorder.install(archive, http_recorder.RECORD)
+    for n, url in enumerate(urls):
+        body = PAGE.replace(b'Rimouski', b'Rimouski ' + b'entrepot ' * n)
+        recorder.record('GET', url, None, 200, 'OK', {'Content-Type': 'text/html'}, body)
+    http_recorder.uninstall()
+
+    try:
+        main.isolate_for_http_archive()
+        runs = []
+        for _ in range(2):
+            http_recorder.install(archive, http_recorder.REPLAY, latency=0)
+            try:
+                client = HttpClient({'max_retries': 0})
+                documents = [client.fetch(url).content.decode('utf-8') for url in urls]
+            finally:
+                http_recorder.uninstall()
+            engine = HybridAnalysisEngine(dict(config.ANALYSIS_CONFIG, keywords={'distributeur alimentaire': 10, 'restaurants': 5},
+                                               bm25_corpus_path=os.path.join(tmp, 'terms.sqlite3')))
+            assert engine.bm25.corpus_stats is None
+            runs.append(engine.bm25.score_batch(documents))
+    finally:
+        for name, values in saved.items():
+            getattr(config, name).clear()
+            getattr(config, name).update(values)
+        if main.ANALYSIS_CONFIG is not None:
+            main.ANALYSIS_CONFIG.clear()
+            main.ANALYSIS_CONFIG.update(saved_main)
+    assert runs[0] == runs[1]
+    assert not os.path.exists(os.path.join(tmp, 'terms.sqlite3'))
+    print(f"✅ Deux rejeux, mêmes scores BM25: {[round(score, 3) for score in runs[0]]}")
+
+if __name__ == "__main__":
+    test_record_then_replay_offline()
+    test_replay_latency_and_async_engine()
+    test_replay_twice_same_bm25_scores()
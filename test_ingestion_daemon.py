@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test de l'ingestion continue (rythme adaptatif par flux, bulletin depuis le magasin)
+"""
+
+import sys
+import tempfile
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, 'src')
+
+from feed_parser import parse_feed_hints
+from ingestion_daemon import IngestionDaemon, FeedSchedule, next_interval, skip_forward
+from scraper import FoodIndustryNewsScraper
+
+PARAGRAPH = "Le grossiste alimentaire de Québec livre les restaurants et les hôtels de la région. "
+
+def _feed(count):
+    now = datetime.now(timezone.utc)
+    items = ''.join(f"""<item><title>Distribution alimentaire à Québec {n}</title><link>/article/{n}</link>
+<pubDate>{(now - timedelta(hours=2 * n)).strftime('%a, %d %b %Y %H:%M:%S +0000')}</pubDate>
+<description>Grossiste et restauration</description></item>""" for n in range(count))
+    return f"""<?xml version="1.0"?><rss version="2.0" xmlns:sy="http://purl.org/rss/1.0/modules/syndication/">
+<channel><title>Local</title><ttl>30</ttl><skipHours><hour>3</hour><hour>4</hour></skipHours>
+<sy:updatePeriod>daily</sy:updatePeriod><sy:updateFrequency>48</sy:updateFrequency>{items}</channel></rss>""".encode('utf-8')
+
+class Handler(BaseHTTPRequestHandler):
+    feed_items = 2
+    hits = []
+    failing = set()
+
+    def do_GET(self):
+        Handler.hits.append(self.path)
+        if self.path in Handler.failing:
+            self.send_response(500)
+            self.end_headers()
+            return
+        if self.path == '/feed':
+            body, content_type = _feed(Handler.feed_items).replace(b'<link>/', f"<link>http://{self.headers['Host']}/".encode()), 'application/rss+xml'
+        else:
+            body, content_type = f"<html><body><article><p>{PARAGRAPH * 10}</p></article></body></html>".encode('utf-8'), 'text/html; charset=utf-8'
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def test_adaptive_interval():
+    schedule = FeedSchedule('Flux', interval=3600, entry_times=[0, 7200, 14400, 21600], polls=1)
+    assert next_interval(schedule, 1, 900, 6 * 3600, 3600) == 3600  # publication toutes les 2 h → toutes les heures
+    assert next_interval(schedule, 0, 900, 6 * 3600, 3600) == 5400  # rien de neuf: recul x1.5
+    schedule.hints = {'ttl': 7200}
+    assert next_interval(schedule, 1, 900, 6 * 3600, 3600) == 7200  # ttl respecté
+    quiet = FeedSchedule('Calme', interval=6 * 3600, entry_times=[0, 10 * 86400], polls=3)
+    assert next_interval(quiet, 0, 900, 6 * 3600, 3600) == 6 * 3600  # plafond
+
+    three_am = datetime(2026, 10, 14, 3, 20, tzinfo=timezone.utc).timestamp()
+    assert skip_forward(three_am, {'skip_hours': [3, 4]}) == datetime(2026, 10, 14, 5, tzinfo=timezone.utc).timestamp()
+    assert skip_forward(three_am, {'skip_days': ['wednesday']}) == datetime(2026, 10, 15, 0, tzinfo=timezone.utc).timestamp()
+    print("✅ Intervalle adaptatif: rythme observé, recul, ttl, plafond, skipHours/skipDays")
+
+def test_feed_hints():
+    assert parse_feed_hints(_feed(1)) == {'ttl': 1800, 'skip_hours': [3, 4], 'update_period': 1800}
+    print("✅ Indications du canal: ttl, skipHours, sy:updatePeriod")
+
+def _start(feed_items=2, failing=()):
+    Handler.feed_items, Handler.hits, Handler.failing = feed_items, [], set(failing)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    sources = {'Local': {'type': 'rss', 'url': f"http://127.0.0.1:{server.server_port}/feed", 'category': 'A'}}
+    scraper = FoodIndustryNewsScraper(sources, bulletin_config={'max_articles': 7},
+                                      http_config={'feed_cache_enabled': False, 'canonicalize_urls': False, 'max_retries': 0,
+                                                   'state_dir': tempfile.mkdtemp()})
+    scraper.translator.translate_if_needed = lambda text, source: text
+    return server, scraper
+
+def test_ingest_then_bulletin_from_store():
+    """Seuls les nouveaux articles sont téléchargés; le bulletin est une requête sur le magasin"""
+    server, scraper = _start()
+    daemon = IngestionDaemon(scraper)
+    assert daemon.state_path.startswith(scraper.state_dir)  # rythmes rangés avec les autres états
+
+    assert daemon.run_once() == 2
+    assert daemon.run_once() == 0  # pas encore dû
+    daemon.schedules['Local'].next_poll_at = 0
+    Handler.feed_items = 3
+    assert daemon.run_once() == 1
+    server.shutdown()
+
+    article_hits = [path for path in Handler.hits if path.startswith('/article/')]
+    assert sorted(article_hits) == ['/article/0', '/article/1', '/article/2'], article_hits
+    schedule = IngestionDaemon(scraper, daemon.state_path).schedules['Local']
+    assert schedule.hints['ttl'] == 1800 and schedule.interval >= 1800 and len(schedule.entry_times) == 3
+
+    selected = scraper.select_from_store(days_back=7)
+    assert selected and all(PARAGRAPH.strip() in item.full_text for item in selected)
+    print(f"✅ {len(article_hits)} articles ingérés, bulletin de {len(selected)} articles sans réseau")
+
+def test_failed_article_retried():
+    """Un article dont le téléchargement échoue n'est ni compté ni marqué vu: il est retenté"""
+    server, scraper = _start(failing={'/article/1'})
+    daemon = IngestionDaemon(scraper)
+    assert daemon.run_once() == 1  # repli sur le résumé: non rangé, non compté
+    assert len(daemon.schedules['Local'].seen) == 1
+
+    Handler.failing = set()
+    daemon.schedules['Local'].next_poll_at = 0
+    assert daemon.run_once() == 1
+    server.shutdown()
+    assert [path for path in Handler.hits if path.startswith('/article/')].count('/article/1') == 2, Handler.hits
+    assert len(daemon.schedules['Local'].seen) == 2
+    print("✅ Article en échec retenté au passage suivant")
+
+if __name__ == "__main__":
+    test_adaptive_interval()
+    test_feed_hints()
+    test_ingest_then_bulletin_from_store()
+    test_failed_article_retried()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Test de la recherche multi-motifs du scoring (une passe pour tous les mots-clés)
+"""
+
+import sys
+import random
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, 'src')
+
+from keyword_matcher import KeywordMatcher, compile_profile
+from scraper import FoodIndustryNewsScraper, NewsItem, CRITICAL_KEYWORDS
+
+def test_matches_agree_with_substring_scans():
+    groups = {'keywords': ['import', 'importation', 'Québec', 'ville de québec', 'aa'], 'negative': ['ban', 'pas de']}
+    matcher = KeywordMatcher(groups)
+    rnd = random.Random(3)
+    vocab = ['importation', 'ville de québec', 'banane', 'pas de', 'aaa', 'le', '.', ' ', 'québec.']
+    for _ in range(200):
+        text = ''.join(rnd.choice(vocab) + rnd.choice(['', ' ']) for _ in range(rnd.randint(0, 40)))
+        matches = matcher.scan(text)
+        sentences = text.split('.')
+        for pattern in matcher.patterns:
+            assert (pattern in matches) == (pattern in text)
+            assert matches.count(pattern) == text.count(pattern)
+            assert set(matches.sentences(pattern)) == {n for n, sentence in enumerate(sentences) if pattern in sentence}
+    assert matcher.scan("ville de québec").starts('québec') == [9]  # occurrence chevauchante retrouvée
+    print("✅ Occurrences, comptes et phrases identiques aux recherches par sous-chaîne")
+
+def test_scraper_scores_from_single_scan():
+    scraper = FoodIndustryNewsScraper({}, http_config={'feed_cache_enabled': False, 'state_dir': tempfile.mkdtemp()}, extraction_config={'article_store_enabled': False})
+    assert compile_profile({'critical': CRITICAL_KEYWORDS}) is compile_profile({'critical': CRITICAL_KEYWORDS})
+
+    calls = []
+    scan = scraper.keyword_matcher.scan
+    scraper.keyword_matcher = type('Compteur', (), {'scan': lambda self, text: calls.append(text) or scan(text)})()
+    item = NewsItem('Distributeur alimentaire à Québec', 'https://example.com/a', 'Local', datetime.now(),
+                    "Pas de fermeture prévue. Le grossiste alimentaire livre les restaurants de la ville de Québec.")
+    score = scraper._calculate_unified_score(item, include_full_text=False)
+    assert score > 0 and len(calls) == 1  # mots-clés, contexte négatif et bonus géographique sur une seule passe
+    assert scraper._rapid_keyword_filter([item]) == [item]
+    print(f"✅ Score {score:.1f} calculé sur une seule passe du texte")
+
+if __name__ == "__main__":
+    test_matches_agree_with_substring_scans()
+    test_scraper_scores_from_single_scan()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test de l'extraction structurée des pages de listing (JSON-LD, sitemap news, flux annoncé)
+"""
+
+import sys
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, 'src')
+
+from listing_extractor import extract_listing, parse_news_sitemap
+from scraper import FoodIndustryNewsScraper
+
+RECENT = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%dT09:00:00+00:00')
+OLD = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%dT09:00:00+00:00')
+
+JSON_LD_PAGE = f"""<html><head>
+<script type="application/ld+json">{{"@context": "https://schema.org", "@graph": [
+  {{"@type": "WebPage", "url": "https://example.com/news/", "name": "Salle de presse"}},
+  {{"@type": "ItemList", "itemListElement": [
+    {{"@type": "ListItem", "position": 1, "item": {{"@type": "NewsArticle", "headline": "Sysco ouvre un entrepôt à Lévis",
+      "url": "/news/entrepot", "datePublished": "{RECENT}", "description": "Distribution alimentaire au Québec",
+      "image": {{"@type": "ImageObject", "url": "/img/entrepot.jpg"}}}}}},
+    {{"@type": "ListItem", "position": 2, "url": "https://example.com/news/ancien", "name": "Vieux communiqué"}}
+  ]}}]}}</script>
+<script type="application/ld+json">{{"@type": "BlogPosting", "headline": "Tendances HORECA",
+  "mainEntityOfPage": {{"@id": "https://example.com/news/horeca"}}, "datePublished": "{OLD}"}}</script>
+<script type="application/ld+json">{{ invalide </script>
+</head><body></body></html>""".encode('utf-8')
+
+SITEMAP = f"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" xmlns:news="http://www.google.com/schemas/sitemap-news/0.9"
+        xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">
+<url><loc>https://example.com/a</loc><image:image><image:loc>https://example.com/a.jpg</image:loc></image:image>
+<news:news><news:publication_date>{OLD}</news:publication_date><news:title>Ancien</news:title></news:news></url>
+<url><loc>https://example.com/b</loc>
+<news:news><news:publication_date>{RECENT}</news:publication_date><news:title>Récent</news:title></news:news></url>
+<url><loc>https://example.com/sans-titre</loc></url>
+</urlset>""".encode('utf-8')
+
+FEED = f"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Presse</title>
+<item><title>Grossiste alimentaire: nouveau centre</title><link>https://example.com/recent</link>
+<pubDate>{(datetime.now() - timedelta(days=1)).strftime('%a, %d %b %Y 09:00:00 +0000')}</pubDate>
+<description>Restauration et hôtellerie</description></item>
+<item><title>Ancienne nouvelle</title><link>https://example.com/old</link>
+<pubDate>{(datetime.now() - timedelta(days=30)).strftime('%a, %d %b %Y 09:00:00 +0000')}</pubDate></item>
+</channel></rss>""".encode('utf-8')
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == '/feed':
+            body, content_type = FEED, 'application/rss+xml'
+        else:
+            body = b'<html><head><link rel="alternate" type="application/rss+xml" href="/feed"></head><body></body></html>'
+            content_type = 'text/html'
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def test_json_ld_listing():
+    listing = extract_listing(JSON_LD_PAGE, 'https://example.com/news/')
+    by_link = {entry['link']: entry for entry in listing.entries}
+    assert list(by_link) == ['https://example.com/news/entrepot', 'https://example.com/news/ancien', 'https://example.com/news/horeca']
+    first = by_link['https://example.com/news/entrepot']
+    assert first['summary'] == 'Distribution alimentaire au Québec'
+    assert first['image_url'] == 'https://example.com/img/entrepot.jpg'
+    assert first['published'] == RECENT[:19]
+    assert by_link['https://example.com/news/ancien']['published'] is None
+    print("✅ JSON-LD: ItemList, @graph, mainEntityOfPage, script invalide ignoré")
+
+def test_news_sitemap():
+    entries = parse_news_sitemap(SITEMAP)
+    assert [e['title'] for e in entries] == ['Récent', 'Ancien']
+    assert entries[1]['link'] == 'https://example.com/a' and entries[1]['image_url'] == 'https://example.com/a.jpg'
+    print("✅ Sitemap news: titres, dates, images, tri du plus récent")
+
+def test_website_source_follows_advertised_feed():
+    """Source 'website' sans JSON-LD: le flux annoncé donne dates et résumés; les vieux articles tombent"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    config = {'type': 'website', 'url': f"http://127.0.0.1:{server.server_port}/news/", 'article_selector': '.news-item'}
+    scraper = FoodIndustryNewsScraper({'Presse': config}, http_config={'state_dir': tempfile.mkdtemp()})
+
+    items = scraper._scrape_website_basic('Presse', config, datetime.now() - timedelta(days=7))
+    server.shutdown()
+
+    assert [i.url for i in items] == ['https://example.com/recent']
+    assert items[0].summary == 'Restauration et hôtellerie'
+    assert items[0].published_date.date() == (datetime.utcnow() - timedelta(days=1)).date()
+    print("✅ Flux <link rel=alternate> suivi, articles périmés écartés en phase 1")
+
+if __name__ == "__main__":
+    test_json_ld_listing()
+    test_news_sitemap()
+    test_website_source_follows_advertised_feed()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test du pool de processus de parsing HTML (phase 3)
+"""
+
+import os
+import sys
+import time
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, 'src')
+
+from article_extractor import ArticleExtractor
+from src.deadline import DeadlineExceeded  # Même classe que celle levée par le pool
+from parse_pool import ParsePool
+from ingestion_daemon import IngestionDaemon
+from scraper import FoodIndustryNewsScraper, NewsItem
+
+PARAGRAPH = "Le distributeur alimentaire de Saguenay agrandit son entrepôt réfrigéré pour la restauration. "
+PAGE = f"""<html><head><meta property="og:image" content="/img/entrepot.jpg"><title>Entrepôt</title></head>
+<body><nav>Accueil</nav><article><h1>Entrepôt réfrigéré</h1><p>{PARAGRAPH * 12}</p></article></body></html>""".encode('utf-8')
+
+def test_pool_matches_local_extraction():
+    extractor = ArticleExtractor()
+    pool = ParsePool(extractor, workers=2)
+    try:
+        local = extractor.extract('https://example.com/entrepot', PAGE, 'text/html; charset=utf-8')
+        remote = pool.extract('https://example.com/entrepot', PAGE, 'text/html; charset=utf-8')
+        assert (remote.text, remote.top_image, remote.canonical_url) == (local.text, local.top_image, local.canonical_url)
+        assert PARAGRAPH.strip() in remote.text
+
+        # Processus réutilisés: pas de démarrage par article
+        pids = {pool._executor.submit(os.getpid).result() for _ in range(10)}
+        assert os.getpid() not in pids and len(pids) <= 2
+    finally:
+        pool.close()
+    print("✅ Pool de parsing: même résultat qu'en local, processus réutilisés")
+
+def test_timeout_raises_and_close_does_not_wait():
+    """Parsing dépassé par l'échéance: DeadlineExceeded, et la fermeture n'attend pas le processus occupé"""
+    pool = ParsePool(ArticleExtractor(), workers=1)
+    pool._executor.submit(time.sleep, 30)  # Processus occupé par un travail interminable
+    try:
+        pool.extract('https://example.com/entrepot', PAGE, 'text/html; charset=utf-8', timeout=0.3)
+        assert False, "DeadlineExceeded attendu"
+    except DeadlineExceeded:
+        pass
+    workers = list(pool._executor._processes.values())
+    start_time = time.time()
+    pool.close()
+    assert time.time() - start_time < 5
+    for worker in workers:
+        worker.join(5)
+    assert not any(worker.is_alive() for worker in workers)
+    print(f"✅ Échéance du parsing signalée, fermeture en {time.time() - start_time:.1f}s sans attendre le travail abandonné")
+
+def test_scraper_routes_through_pool():
+    scraper = FoodIndustryNewsScraper({}, http_config={'state_dir': tempfile.mkdtemp()}, extraction_config={'parse_workers': 1})
+    item = NewsItem('Entrepôt', 'https://example.com/entrepot', 'Local', datetime.now(), '')
+    try:
+        scraper._enhance_article_from_html(item, PAGE, 'text/html; charset=utf-8')
+        assert scraper._parse_pool is not None
+        assert PARAGRAPH.strip() in item.full_text
+        assert item.image_url == 'https://example.com/img/entrepot.jpg'
+    finally:
+        scraper.close()
+    assert scraper._parse_pool is None
+    print("✅ Extraction du scraper déléguée au pool")
+
+def test_daemon_stop_releases_workers():
+    """L'arrêt du démon d'ingestion ferme le pool: aucun processus de travail ne survit"""
+    scraper = FoodIndustryNewsScraper({}, http_config={'state_dir': tempfile.mkdtemp()}, extraction_config={'parse_workers': 1})
+    scraper._enhance_article_from_html(NewsItem('Entrepôt', 'https://example.com/entrepot', 'Local', datetime.now(), ''),
+                                       PAGE, 'text/html; charset=utf-8')
+    workers = list(scraper._parse_pool._executor._processes.values())
+    assert workers and all(worker.is_alive() for worker in workers)
+
+    daemon = IngestionDaemon(scraper)
+    daemon.stop()
+    assert scraper._parse_pool is None
+    assert not any(worker.is_alive() for worker in workers)
+    assert os.path.exists(daemon.state_path)  # rythmes sauvegardés à l'arrêt
+    print(f"✅ Arrêt du démon: {len(workers)} processus de parsing terminés")
+
+if __name__ == "__main__":
+    test_pool_matches_local_extraction()
+    test_timeout_raises_and_close_does_not_wait()
+    test_scraper_routes_through_pool()
+    test_daemon_stop_releases_workers()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test du cache de scores (un article n'est noté qu'une fois par état de son contenu)
+"""
+
+import sys
+import tempfile
+from datetime import datetime
+
+sys.path.insert(0, 'src')
+
+from scraper import FoodIndustryNewsScraper, NewsItem
+
+PAGE = ("<html><body><article><p>"
+        + "Le grossiste alimentaire de Lévis ouvre un entrepôt pour les restaurants de la ville de Québec. " * 8
+        + "</p></article></body></html>").encode('utf-8')
+
+def _scraper():
+    return FoodIndustryNewsScraper({'Local': {'type': 'rss', 'category': 'A'}}, http_config={'feed_cache_enabled': False, 'state_dir': tempfile.mkdtemp()},
+                                   extraction_config={'article_store_enabled': False})
+
+def test_phases_share_scores():
+    scraper = _scraper()
+    item = NewsItem('Distributeur alimentaire à Québec', 'https://example.com/a', 'Local', datetime.now(),
+                    "Un distributeur alimentaire livre la restauration.")
+
+    prefiltered = scraper._pre_filter_articles([item])  # titre + résumé
+    assert prefiltered == [item] and (scraper.score_cache.hits, scraper.score_cache.misses) == (0, 1)
+
+    scraper._enhance_article_from_html(item, PAGE, 'text/html; charset=utf-8')  # texte complet: nouvel état
+    tags, explanation, score = list(item.tags), item.relevance_to_flb, item.relevance_score
+    assert item.full_text and tags and explanation and (scraper.score_cache.hits, scraper.score_cache.misses) == (0, 2)
+
+    item.tags, item.relevance_to_flb = [], ""
+    assert scraper._calculate_base_scores([item]) == [item]  # sélection finale: contenu inchangé
+    assert (scraper.score_cache.hits, scraper.score_cache.misses) == (1, 2)
+    assert (item.relevance_score, item.tags, item.relevance_to_flb) == (score, tags, explanation)
+    print(f"✅ Score {score:.1f} réutilisé à la sélection: {scraper.score_cache.hits} succès, {scraper.score_cache.misses} calculs")
+
+def test_key_follows_content_and_profile():
+    scraper = _scraper()
+    item = NewsItem('Grossiste alimentaire à Lévis', 'https://example.com/b', 'Local', datetime.now(), "Entrepôt réfrigéré.")
+    first = scraper._calculate_unified_score(item, include_full_text=False)
+    assert scraper._calculate_unified_score(item, include_full_text=True) == first  # mode distinct: recalculé
+    item.summary += " Les restaurants de Québec sont livrés."
+    assert scraper._calculate_unified_score(item, include_full_text=False) > first
+    assert (scraper.score_cache.hits, scraper.score_cache.misses) == (0, 3)
+
+    other = _scraper()
+    other.keyword_weights = dict(other.keyword_weights, **{'grossiste alimentaire': 50})
+    other.keyword_profile = 'poids-modifies'
+    other.score_cache = scraper.score_cache
+    assert other._calculate_unified_score(item, include_full_text=False) > scraper._calculate_unified_score(item, include_full_text=False)
+    print("✅ Contenu, mode et profil de mots-clés distinguent les scores mémorisés")
+
+if __name__ == "__main__":
+    test_phases_share_scores()
+    test_key_follows_content_and_profile()
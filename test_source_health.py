@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Test de la santé des sources et du disjoncteur
+"""
+
+import os
+import sys
+import time
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, 'src')
+
+from deadline import Deadline
+from source_health import SourceHealthTracker, RUN, PROBE, SKIP
+from scraper import FoodIndustryNewsScraper
+
+class Handler(BaseHTTPRequestHandler):
+    hits = []
+
+    def do_GET(self):
+        Handler.hits.append(self.path)
+        if self.path == '/lent':
+            time.sleep(1.5)
+        self.send_response(503 if self.path == '/mort' else 200)
+        self.send_header('Content-Type', 'application/rss+xml')
+        self.end_headers()
+        self.wfile.write(b'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title></channel></rss>')
+
+    def log_message(self, *args):
+        pass
+
+def test_breaker_states():
+    """Fermé → ouvert après N échecs → sonde après la pause → fermé sur succès; persistance"""
+    path = os.path.join(tempfile.mkdtemp(), 'health.json')
+    tracker = SourceHealthTracker(path, failure_threshold=3, cooldown=0.2)
+    for latency in (0.5, 0.7, 0.9):
+        tracker.record_success('Rapide', latency)
+    for _ in range(3):
+        tracker.record_failure('Sysco Canada News', 15.0, 'timeout')
+
+    assert tracker.admission('Rapide') == RUN
+    assert tracker.admission('Sysco Canada News') == SKIP
+    time.sleep(0.25)
+    assert tracker.admission('Sysco Canada News') == PROBE
+    tracker.record_failure('Sysco Canada News', 5.0, 'timeout')
+    assert tracker.admission('Sysco Canada News') == SKIP  # pause doublée
+
+    tracker.save()
+    reloaded = SourceHealthTracker(path, failure_threshold=3, cooldown=0.2)
+    assert reloaded.sources['Rapide'].p50 == 0.7
+    assert reloaded.sources['Sysco Canada News'].consecutive_failures == 4
+    time.sleep(0.45)
+    reloaded.record_success('Sysco Canada News', 1.0)
+    assert reloaded.admission('Sysco Canada News') == RUN
+
+    rows = reloaded.report()
+    assert rows[0]['source'] == 'Sysco Canada News' and rows[0]['p95_s'] == 15.0
+    csv_path = path.replace('.json', '.csv')
+    assert reloaded.export_csv(csv_path) == 2 and os.path.getsize(csv_path) > 0
+    print("✅ Disjoncteur: ouverture, sonde, pause doublée, rétablissement, export")
+
+def test_phase_skips_open_sources():
+    """_parallel_scrape_sources n'interroge plus une source en pause"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    sources = {
+        'Morte': {'type': 'rss', 'url': f"{base}/mort", 'category': 'C'},
+        'Vivante': {'type': 'rss', 'url': f"{base}/vivant", 'category': 'A'}
+    }
+    scraper = FoodIndustryNewsScraper(sources, http_config={'feed_cache_enabled': False, 'max_retries': 0, 'state_dir': tempfile.mkdtemp()})
+    scraper.source_health = SourceHealthTracker(os.path.join(tempfile.mkdtemp(), 'health.json'), failure_threshold=2)
+
+    cutoff = datetime.now() - timedelta(days=7)
+    for _ in range(3):
+        scraper._parallel_scrape_sources(cutoff, Deadline(10))
+    server.shutdown()
+
+    assert Handler.hits.count('/mort') == 2, Handler.hits
+    assert Handler.hits.count('/vivant') == 3
+    assert scraper.source_health.sources['Morte'].last_error == 'HTTP 503'
+    print(f"✅ Source morte interrogée {Handler.hits.count('/mort')} fois sur 3 exécutions")
+
+def test_phase_deadline_keeps_breaker_closed():
+    """Source saine coupée par l'échéance de la phase: abandon non compté, disjoncteur fermé"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    sources = {'Lente': {'type': 'rss', 'url': f"http://127.0.0.1:{server.server_port}/lent", 'category': 'A'}}
+    scraper = FoodIndustryNewsScraper(sources, http_config={'feed_cache_enabled': False, 'state_dir': tempfile.mkdtemp()})
+    scraper.source_health = SourceHealthTracker(os.path.join(tempfile.mkdtemp(), 'health.json'), failure_threshold=1)
+
+    cutoff = datetime.now() - timedelta(days=7)
+    for _ in range(2):
+        assert scraper._parallel_scrape_sources(cutoff, Deadline(0.3)) == []
+        time.sleep(0.5)  # Laisser la récupération coupée rendre son résultat
+    server.shutdown()
+
+    assert Handler.hits.count('/lent') >= 2
+    assert scraper.source_health.admission('Lente') == RUN
+    assert 'Lente' not in scraper.source_health.sources or scraper.source_health.sources['Lente'].consecutive_failures == 0
+    print("✅ Échéance de phase: source lente gardée, disjoncteur fermé")
+
+def test_longest_first_submission():
+    """Sources lentes soumises en premier; catégorie A devant dans une même tranche de durée"""
+    sources = {name: {'type': 'rss', 'url': f"http://localhost/{n}", 'category': category}
+               for n, (name, category) in enumerate([('Rapide C', 'C'), ('Rapide A', 'A'), ('Lente B', 'B'),
+                                                     ('Moyenne C', 'C'), ('Moyenne A', 'A'), ('Nouvelle', 'B')])}
+    scraper = FoodIndustryNewsScraper(sources, http_config={'state_dir': tempfile.mkdtemp()})
+    for name, latency, duration in [('Rapide C', 0.3, 0.4), ('Rapide A', 0.2, 0.35), ('Lente B', 1.0, 7.5),
+                                    ('Moyenne C', 1.0, 2.1), ('Moyenne A', 1.5, 2.9)]:
+        scraper.source_health.record_success(name, latency, duration)
+
+    order = [name for name, _, _ in scraper._admitted_sources()]
+    assert order == ['Nouvelle', 'Lente B', 'Moyenne A', 'Moyenne C', 'Rapide A', 'Rapide C'], order
+    assert {row['source']: row['duree_attendue_s'] for row in scraper.source_health.report()}['Lente B'] == 7.5
+    print(f"✅ Soumission la plus longue en premier: {', '.join(order)}")
+
+if __name__ == "__main__":
+    test_breaker_states()
+    test_phase_skips_open_sources()
+    test_phase_deadline_keeps_breaker_closed()
+    test_longest_first_submission()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test du pipeline en flux (extraction dès la réponse de chaque source, traduction anticipée)
+"""
+
+import sys
+import time
+import tempfile
+import threading
+from datetime import datetime
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, 'src')
+
+from scraper import FoodIndustryNewsScraper
+from streaming_pipeline import OnlineTopK, StreamingPipeline
+
+NOW = format_datetime(datetime.now().astimezone())
+SLOW_FEED_DELAY = 1.5
+
+def _feed(base, prefix, titles):
+    items = ''.join(f"""<item><title>{title}</title><link>{base}/{prefix}/{n}</link><pubDate>{NOW}</pubDate>
+<description>{title}: un grossiste alimentaire livre la restauration.</description></item>""" for n, title in enumerate(titles))
+    return f"""<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel><title>{prefix}</title>{items}</channel></rss>"""
+
+class Handler(BaseHTTPRequestHandler):
+    events = []
+
+    def do_GET(self):
+        base = f"http://127.0.0.1:{self.server.server_port}"
+        if self.path == '/lent':
+            time.sleep(SLOW_FEED_DELAY)
+            body, content_type = _feed(base, 'lent', ['Distributeur alimentaire à Montréal', 'Épicerie et restauration']), 'application/rss+xml'
+        elif self.path == '/rapide':
+            body, content_type = _feed(base, 'rapide', ['Distributeur alimentaire de la ville de Québec', 'Grossiste alimentaire à Lévis',
+                                                        'Hôtellerie et restauration à Québec']), 'application/rss+xml'
+        else:
+            paragraph = "Le distributeur alimentaire de Québec agrandit son entrepôt pour servir les restaurants. "
+            body, content_type = f"<html><body><article><p>{paragraph * 8}</p></article></body></html>", 'text/html; charset=utf-8'
+        Handler.events.append((time.time(), self.path))
+        data = body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+def _scraper(base, streaming):
+    sources = {'Lente': {'type': 'rss', 'url': f"{base}/lent", 'category': 'B'},
+               'Rapide': {'type': 'rss', 'url': f"{base}/rapide", 'category': 'A'}}
+    scraper = FoodIndustryNewsScraper(sources, bulletin_config={'max_articles': 4, 'max_per_source': 3},
+                                      http_config={'feed_cache_enabled': False, 'max_retries': 0, 'state_dir': tempfile.mkdtemp(), 'streaming_pipeline': streaming, 'stream_translate_ahead': 2},
+                                      extraction_config={'article_store_enabled': False})
+    return scraper
+
+def test_online_admission():
+    admission = OnlineTopK(2)
+    assert [admission.admit(score) for score in (5, 3, 1, 4, 6, 2)] == [True, True, False, True, True, False]
+    print("✅ Admission en ligne: seuls les k meilleurs pré-scores vus passent")
+
+def test_extraction_and_translation_overlap_slow_source():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+
+    translations = []
+    streaming = _scraper(base, True)
+    streaming.translator.translate_if_needed = lambda text, source: translations.append(time.time()) or text
+    started = time.time()
+    selected = streaming.scrape_all_sources(days_back=7)
+    elapsed = time.time() - started
+
+    Handler.events.clear()
+    barrier = _scraper(base, False)
+    barrier.translator.translate_if_needed = lambda text, source: text
+    expected = barrier.scrape_all_sources(days_back=7)
+    server.shutdown()
+
+    slow_feed_done = started + SLOW_FEED_DELAY
+    assert {item.url for item in selected} == {item.url for item in expected}
+    assert all(item.full_text for item in selected)
+    assert translations and min(translations) < slow_feed_done  # traduction anticipée pendant la source lente
+    assert elapsed < SLOW_FEED_DELAY + 1.0, f"{elapsed:.1f}s"
+    print(f"✅ Pipeline en flux: {len(selected)} articles en {elapsed:.2f}s (source lente {SLOW_FEED_DELAY}s), "
+          f"même sélection qu'en barrière")
+
+def test_articles_fetched_before_slow_source_returns():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    Handler.events.clear()
+    scraper = _scraper(base, True)
+    scraper.translator.translate_if_needed = lambda text, source: text
+    scraper.scrape_all_sources(days_back=7)
+    server.shutdown()
+
+    slow_feed_at = next(at for at, path in Handler.events if path == '/lent')
+    fast_articles = [at for at, path in Handler.events if path.startswith('/rapide/')]
+    assert fast_articles and max(fast_articles) < slow_feed_at
+    print(f"✅ {len(fast_articles)} articles extraits avant la réponse de la source lente")
+
+def test_full_queue_keeps_candidates():
+    """File pleine jusqu'à l'échéance: les candidats restants sont comptés et gardés avec leur résumé RSS"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    sources = {'Rapide': {'type': 'rss', 'url': f"http://127.0.0.1:{server.server_port}/rapide", 'category': 'A'}}
+    scraper = FoodIndustryNewsScraper(sources, bulletin_config={'max_articles': 4, 'max_per_source': 3},
+                                      http_config={'feed_cache_enabled': False, 'max_retries': 0, 'state_dir': tempfile.mkdtemp(),
+                                                   'max_workers': 1, 'stream_queue_size': 1, 'run_timeout': 1.5},
+                                      extraction_config={'article_store_enabled': False})
+    scraper.translator.translate_if_needed = lambda text, source: text
+    scraper._extract_and_enhance_article = lambda item, deadline=None: time.sleep(1.5)  # extraction saturée
+    pipeline = StreamingPipeline.from_config(scraper)
+    selected = pipeline.run(days_back=7)
+    server.shutdown()
+
+    assert pipeline.unqueued == 1
+    assert len(selected) == 3 and all(item.full_text == item.summary for item in selected)
+    print(f"✅ File pleine: {pipeline.unqueued} candidat compté et gardé (résumé RSS), aucun perdu")
+
+if __name__ == "__main__":
+    test_online_admission()
+    test_extraction_and_translation_overlap_slow_source()
+    test_articles_fetched_before_slow_source_returns()
+    test_full_queue_keeps_candidates()
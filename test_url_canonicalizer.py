@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test de la canonicalisation des URLs et du cache de redirections
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, 'src')
+
+import src.url_canonicalizer as url_canonicalizer  # Même module que celui du scraper (table des redirecteurs)
+from src.url_canonicalizer import UrlCanonicalizer, clean_url, url_key
+from scraper import FoodIndustryNewsScraper, NewsItem
+
+class Handler(BaseHTTPRequestHandler):
+    hits = []
+
+    def do_HEAD(self):
+        Handler.hits.append(self.path)
+        if self.path.startswith('/wrap/'):
+            self.send_response(302)
+            self.send_header('Location', f"/article/{self.path.rsplit('/', 1)[-1]}?utm_source=feed&id=7")
+        else:
+            self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+def test_clean_url_and_key():
+    assert clean_url('HTTPS://Example.COM:443/a/b/?utm_source=rss&id=3&fbclid=x#top') == 'https://example.com/a/b/?id=3'
+    assert clean_url('https://example.com/story/amp/?outputType=amp') == 'https://example.com/story'
+    assert clean_url('mailto:info@example.com') == 'mailto:info@example.com'
+    assert clean_url('http://example.com:abc/a?utm_source=x') == 'http://example.com:abc/a?utm_source=x'  # port mal formé
+    assert url_key('http://example.com:abc/a')
+    # Requête conservée octet pour octet hors suivi: encodage, caractères réservés et valeurs vides
+    assert clean_url('https://example.com/s?q=pomme%20de%20terre&f=a%2Fb&vide=&utm_source=x') == \
+        'https://example.com/s?q=pomme%20de%20terre&f=a%2Fb&vide='
+    assert clean_url('https://example.com/s?q=a+b&x=1;2&UTM%5Fmedium=y') == 'https://example.com/s?q=a+b&x=1;2'
+    assert url_key('https://example.com/s?q=a%20b') == url_key('https://example.com/s?q=a+b')
+    # http/https, www, barre finale et ordre des paramètres ne distinguent pas deux articles
+    assert url_key('http://www.example.com/a/?b=2&a=1&utm_medium=x') == url_key('https://example.com/a?a=1&b=2')
+    assert url_key('https://example.com/a') != url_key('https://example.com/b')
+    print("✅ Suivi, AMP, port, fragment et schéma normalisés")
+
+def test_redirects_resolved_once():
+    """Redirecteur résolu une fois, puis servi par le cache persistant; doublons fusionnés avant la phase 3"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    url_canonicalizer.REDIRECT_WRAPPERS['127.0.0.1'] = '/wrap/'
+    cache_path = os.path.join(tempfile.mkdtemp(), 'redirects.json')
+
+    def items():
+        return [
+            NewsItem('Grossiste à Québec', f"{base}/wrap/1", 'Proxy', datetime.now(), ''),
+            NewsItem('Grossiste à Québec', f"{base}/article/1?id=7&utm_campaign=x", 'Direct', datetime.now(), 'Résumé', image_url='i.jpg'),
+            NewsItem('Autre', f"{base}/article/2", 'Direct', datetime.now(), '')
+        ]
+
+    scraper = FoodIndustryNewsScraper({}, http_config={'max_retries': 0, 'state_dir': tempfile.mkdtemp()})
+    try:
+        for _ in range(2):
+            scraper.url_canonicalizer = UrlCanonicalizer(cache_path)
+            merged = scraper._canonicalize_articles(items())
+            assert [i.url for i in merged] == [f"{base}/article/1?id=7", f"{base}/article/2"]
+            assert merged[0].summary == 'Résumé' and merged[0].image_url == 'i.jpg'
+        assert Handler.hits.count('/wrap/1') == 1, Handler.hits
+        assert scraper.url_canonicalizer.cache_hits >= 1 and scraper.url_canonicalizer.resolved == 0
+
+        # Enregistrement/rejeu: cache disque ignoré, la redirection est redemandée et rien n'est écrit
+        saved = os.path.getmtime(cache_path)
+        scraper.url_canonicalizer = UrlCanonicalizer(cache_path, persistent=False)
+        assert [i.url for i in scraper._canonicalize_articles(items())] == [f"{base}/article/1?id=7", f"{base}/article/2"]
+        assert Handler.hits.count('/wrap/1') == 2 and scraper.url_canonicalizer.resolved == 1
+        assert os.path.getmtime(cache_path) == saved
+    finally:
+        server.shutdown()
+        del url_canonicalizer.REDIRECT_WRAPPERS['127.0.0.1']
+    print("✅ Redirecteur résolu une seule fois, doublons fusionnés sans téléchargement")
+
+if __name__ == "__main__":
+    test_clean_url_and_key()
+    test_redirects_resolved_once()